@@ -56,6 +56,7 @@ TRADING_CONFIG = {
 # Price Fetch Settings
 PRICE_FETCH_CONFIG = {
     'timeout_seconds': 5,
+    'first_tick_timeout_seconds': 1.0,  # Max wait for first bid/ask/last tick
     'retry_attempts': 3,
     'show_loading_indicator': True,
     'play_sound_on_fetch': False,
@@ -86,6 +87,7 @@ SCREENER_CONFIG = {
 
 # Chart Settings
 CHART_CONFIG = {
+    'backend': 'matplotlib',  # 'matplotlib' or 'pyqtgraph' (optional dependency)
     'theme': 'dark',
     'entry_line_color': '#00FF00',
     'stop_line_color': '#FF0000',
@@ -198,7 +200,6 @@ TIMER_CONFIG = {
     'connect_action_delay': 100,  # ms - UI render time
     'account_dialog_delay': 500,  # ms - User experience delay
     'mode_switch_delay': 500,  # ms - Mode switching delay
-    'chart_load_delay': 500,  # ms - Prevent IB API concurrent call lockup
     'account_update_interval': 300000,  # ms - 5 minutes to reduce API load
 }
 
@@ -434,6 +435,14 @@ CHART_WIDGET_CONFIG = {
         'crosshair_throttle': 16.67,  # 60fps
         'downsample_threshold': 1000,
         'downsample_max_points': 800,
+        'lod_min_pixels_per_bar': 3,  # Narrowest candle before bars are merged
+        'lod_cache_levels': 8,        # LOD levels kept across datasets
+    },
+    'history': {
+        'page_bars': 500,          # Bars requested per scroll-back page
+        'page_trigger_bars': 20,   # Page in older bars when the view comes this close to the oldest bar
+        'window_margin': 1.0,      # Rendered bars either side of the view, in visible spans
+        'view_settle_ms': 150,     # Debounce for wheel/drag view changes
     },
     'visual': {
         'grid_linewidth': 0.5,
@@ -516,3 +525,44 @@ DATA_FETCHER_CONFIG = {
         'invalid_price': 0,
     }
 }
+
+# Contract Registry Configuration
+CONTRACT_REGISTRY_CONFIG = {
+    'cache_file': 'contracts.json',  # Stored under CACHE_DIR
+    'max_age_days': 7,  # Re-qualify contracts older than this
+}
+
+# Market Data Line Pool Configuration
+MARKET_DATA_POOL_CONFIG = {
+    'max_lines': 90,  # IB default allowance is 100 concurrent lines; keep headroom
+}
+
+# Real-Time Stream Manager Configuration
+REAL_TIME_STREAM_CONFIG = {
+    'max_streams': 100,         # Concurrent symbols with real-time bars + ticks
+    'max_idle_streams': 20,     # Unsubscribed streams kept warm for instant switch-back
+    'flush_interval_ms': 100,   # Per-symbol bar coalescing window before fan-out
+    'bar_size': 5,              # reqRealTimeBars only supports 5-second bars
+}
+
+# Tick Conflation Configuration
+CONFLATION_CONFIG = {
+    'rates_hz': {               # Publish cadence per consumer
+        'chart': 30,
+        'order_panel': 10,
+        'table': 4,
+    },
+    'default_hz': 10,           # Consumers not listed above
+}
+
+# Event Bus Configuration
+EVENT_BUS_CONFIG = {
+    'batch_size': 256,          # Events dispatched per drain pass before re-checking the wakeup
+    'max_history_size': 10000,  # Events kept for debugging/monitoring (ring buffer, fixed memory)
+    'history_per_type_size': 2000,  # Most recent events indexed per event type
+    'coalesce': {               # Event type -> data field; a pending event with the same value is replaced
+        'price_update': 'symbol',
+    },
+    'slow_subscriber_ms': 100,  # Subscriber calls longer than this are logged with a stack sample
+    'metrics_refresh_ms': 2000, # Status bar refresh of queue depth and latency
+}
@@ -0,0 +1,326 @@
+"""
+Bar Builder
+Rolls live ticks and 5-second real-time bars into the active timeframe's forming candle
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.utils.logger import logger
+from src.core.bar_frame import BarFrame, eastern_utc_offsets
+from src.core.bar_resampler import SESSION_OPEN_SECONDS
+
+
+# Chart timeframe -> bar length in minutes (None = one bar per US/Eastern calendar day)
+TIMEFRAME_MINUTES = {
+    '1m': 1,
+    '3m': 3,
+    '5m': 5,
+    '15m': 15,
+    '1h': 60,
+    '4h': 240,
+    '1d': None,
+}
+
+# Length of IB real-time bars; each arrives after its 5 seconds have elapsed
+SOURCE_BAR_SECONDS = 5
+
+# Ticks this long past a boundary close the candle even if its final 5s bar never arrived
+CLOSE_GRACE_SECONDS = 10
+
+
+def bucket_bounds(epoch: int, minutes: Optional[int],
+                  phase: int = SESSION_OPEN_SECONDS) -> Tuple[int, int]:
+    """
+    Get the [start, end) epoch bounds of the bar containing a timestamp
+
+    Intraday buckets start at phase + k * minutes after Eastern midnight and
+    never span days. The default phase matches resample_bars (09:30 session
+    open); phase 0 gives clock-aligned bars like IB's hourly bars, whose first
+    regular-hours bar is the partial one labeled 09:30. Daily bars start at
+    Eastern midnight.
+
+    Args:
+        epoch: Epoch seconds
+        minutes: Bar length in minutes, or None for daily bars
+        phase: Bucket alignment in seconds after local midnight
+
+    Returns:
+        (start, end) epoch seconds
+    """
+    offset = int(eastern_utc_offsets(np.array([epoch], dtype=np.int64))[0])
+    local = epoch + offset
+    day_start = local - local % 86400
+    if minutes is None:
+        return day_start - offset, day_start + 86400 - offset
+
+    bucket_seconds = minutes * 60
+    bucket = (local - day_start - phase) // bucket_seconds
+    start = day_start + phase + bucket * bucket_seconds
+    end = min(start + bucket_seconds, day_start + 86400)
+
+    # A bucket straddling the open is split there, as in IB's regular-hours bars
+    session_open = day_start + SESSION_OPEN_SECONDS
+    if start < session_open <= local:
+        start = session_open
+    return start - offset, end - offset
+
+
+def history_phase(times: np.ndarray, minutes: int) -> Optional[int]:
+    """
+    Detect the bucket alignment of loaded intraday bars
+
+    Args:
+        times: Bar start times (epoch seconds)
+        minutes: Bar length in minutes
+
+    Returns:
+        Phase for bucket_bounds (09:30 or clock aligned), or None if the bars
+        fit neither
+    """
+    times = np.asarray(times[-50:], dtype=np.int64)
+    time_of_day = (times + eastern_utc_offsets(times)) % 86400
+    bucket_seconds = minutes * 60
+    at_open = time_of_day == SESSION_OPEN_SECONDS
+    for phase in (SESSION_OPEN_SECONDS % bucket_seconds, 0):
+        if np.all(((time_of_day - phase) % bucket_seconds == 0) | at_open):
+            return phase
+    return None
+
+
+class BarBuilder(QObject):
+    """
+    Builds the current timeframe's candle from streaming data
+
+    Seed it with the loaded history via reset() so the forming candle
+    continues the last historical bar. 5-second bars contribute OHLCV,
+    ticks move high/low/close. bar_updated carries the forming candle after
+    every change; bar_closed carries the final candle. Both are single-row
+    BarFrames.
+
+    The 5s bar covering a candle's last seconds only arrives after the
+    boundary, so ticks past the boundary do not close the candle: they are
+    held for the next candle until that final 5s bar arrives (or, if it
+    never does, until CLOSE_GRACE_SECONDS have passed).
+    """
+
+    bar_updated = pyqtSignal(object)  # BarFrame with the forming bar
+    bar_closed = pyqtSignal(object)   # BarFrame with the completed bar
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timeframe: Optional[str] = None
+        self._minutes: Optional[int] = None
+        self._phase = SESSION_OPEN_SECONDS
+        self._start = 0
+        self._end = 0
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+        self._has_bar = False
+        self._last_source_bar = 0  # Start time of the newest 5s bar folded in
+        self._last_tick = 0.0      # Epoch of the newest tick folded in
+        self._closed_end = 0       # End of the last closed candle; older data is ignored
+        self._held: Optional[list] = None  # [first epoch, open, high, low, close, last epoch] of ticks past the boundary
+
+    @property
+    def active(self) -> bool:
+        """Whether a timeframe is set and updates are being built"""
+        return self.timeframe is not None
+
+    @property
+    def live_start(self) -> Optional[int]:
+        """Epoch from which candles come from the stream (forming or closed here), or None"""
+        if not self.active:
+            return None
+        if self._has_bar:
+            return self._start
+        return self._closed_end or None
+
+    def reset(self, timeframe: Optional[str], history: Optional[BarFrame] = None):
+        """
+        Start building bars for a timeframe
+
+        Args:
+            timeframe: Chart timeframe ('1m' ... '1d'), or None to stop building
+            history: Loaded bars; their alignment sets the bucket boundaries and
+                the last one becomes the forming candle if it is still open
+        """
+        if timeframe is not None and timeframe not in TIMEFRAME_MINUTES:
+            logger.warning(f"Bar builder does not support timeframe {timeframe}")
+            timeframe = None
+
+        self.timeframe = timeframe
+        self._minutes = TIMEFRAME_MINUTES.get(timeframe)
+        self._phase = SESSION_OPEN_SECONDS
+        self._has_bar = False
+        self._last_source_bar = 0
+        self._last_tick = 0.0
+        self._closed_end = 0
+        self._held = None
+        if timeframe is None or history is None or not len(history):
+            return
+
+        # Build candles on the same boundaries as the loaded bars (e.g. IB's
+        # clock-hour 1h bars), never a second alignment on the same chart
+        if self._minutes is not None:
+            phase = history_phase(history.time, self._minutes)
+            if phase is None:
+                logger.info(f"Loaded {timeframe} bars have an unknown alignment - live candles disabled")
+                self.timeframe = None
+                return
+            self._phase = phase
+
+        last = int(history.time[-1])
+        self._start, self._end = bucket_bounds(last, self._minutes, self._phase)
+        if self._start != last:
+            return  # History is not aligned like ours; start fresh with live data
+        self._open = float(history.open[-1])
+        self._high = float(history.high[-1])
+        self._low = float(history.low[-1])
+        self._close = float(history.close[-1])
+        self._volume = float(history.volume[-1])
+        self._has_bar = True
+
+    def reseed(self, history: Optional[BarFrame]):
+        """
+        Re-seed from reloaded history of the chart already being built
+
+        Reloads are often older than the stream (the store is topped up
+        periodically), so history that ends at or before the forming candle,
+        or inside a candle already closed here, is ignored. Newer history
+        replaces the forming candle, and closed candles stay closed.
+
+        Args:
+            history: Reloaded bars for the builder's symbol and timeframe
+        """
+        if not self.active or history is None or not len(history):
+            return
+        last = int(history.time[-1])
+        if last < self._closed_end or (self._has_bar and last <= self._start):
+            return
+        closed_end = self._closed_end
+        self.reset(self.timeframe, history)
+        self._closed_end = closed_end
+
+    def add_bar(self, bar_time: Union[datetime, int], open: float, high: float,
+                low: float, close: float, volume: float):
+        """
+        Fold a 5-second real-time bar into the forming candle
+
+        Args:
+            bar_time: Start time of the source bar
+            open, high, low, close, volume: Source bar values
+        """
+        if not self.active:
+            return
+        epoch = int(bar_time.timestamp()) if isinstance(bar_time, datetime) else int(bar_time)
+        if epoch <= self._last_source_bar or epoch < self._closed_end:
+            return  # Already counted, or belongs to a closed candle
+        self._last_source_bar = epoch
+
+        if self._has_bar and epoch < self._start:
+            return
+        if self._has_bar and epoch >= self._end:
+            self._close_bar()  # The candle's final 5s bar never came
+        if not self._has_bar:
+            self._open_bar(epoch, open)
+            self._fold_held(epoch + SOURCE_BAR_SECONDS)
+
+        self._high = max(self._high, high)
+        self._low = min(self._low, low)
+        if epoch + SOURCE_BAR_SECONDS >= self._last_tick:
+            self._close = close  # Ticks newer than the bar's end win
+        self._volume += volume
+        self.bar_updated.emit(self._frame())
+
+        # The candle's last 5 seconds are in - it is final
+        if epoch + SOURCE_BAR_SECONDS >= self._end:
+            self._close_bar()
+            if self._held is not None:
+                self._open_bar(self._held[0], self._held[1])
+                self._fold_held(0)
+                self.bar_updated.emit(self._frame())
+
+    def add_tick(self, price: float, tick_time: Optional[float] = None):
+        """
+        Move the forming candle with a trade price
+
+        Args:
+            price: Last trade price
+            tick_time: Epoch seconds of the tick (defaults to now)
+        """
+        if not self.active or price <= 0:
+            return
+        epoch = tick_time if tick_time is not None else datetime.now().timestamp()
+        if epoch < self._closed_end or (self._has_bar and epoch < self._start):
+            return
+
+        if self._has_bar and epoch >= self._end:
+            # Past the boundary: hold for the next candle until the final 5s bar closes this one
+            held = self._held
+            if held is None:
+                self._held = [epoch, price, price, price, price, epoch]
+            else:
+                held[2] = max(held[2], price)
+                held[3] = min(held[3], price)
+                held[4] = price
+                held[5] = epoch
+            if epoch < self._end + CLOSE_GRACE_SECONDS:
+                return
+            self._close_bar()
+            self._open_bar(self._held[0], self._held[1])
+            self._fold_held(0)
+            self.bar_updated.emit(self._frame())
+            return
+
+        if not self._has_bar:
+            self._open_bar(int(epoch), price)
+
+        self._last_tick = epoch
+        if price > self._high:
+            self._high = price
+        if price < self._low:
+            self._low = price
+        self._close = price
+        self.bar_updated.emit(self._frame())
+
+    def current_bar(self) -> Optional[BarFrame]:
+        """Get the forming candle, or None before any data"""
+        return self._frame() if self.active and self._has_bar else None
+
+    def _open_bar(self, epoch: float, price: float):
+        """Start the candle containing epoch"""
+        self._start, self._end = bucket_bounds(int(epoch), self._minutes, self._phase)
+        self._open = self._high = self._low = self._close = price
+        self._volume = 0.0
+        self._has_bar = True
+
+    def _close_bar(self):
+        """Publish the forming candle as final"""
+        self.bar_closed.emit(self._frame())
+        self._closed_end = self._end
+        self._has_bar = False
+
+    def _fold_held(self, newer_than: float):
+        """Apply ticks held past the previous boundary to the new candle"""
+        held, self._held = self._held, None
+        if held is None or held[5] < self._start or held[0] >= self._end:
+            return
+        self._high = max(self._high, held[2])
+        self._low = min(self._low, held[3])
+        if held[5] >= newer_than:
+            self._close = held[4]
+            self._last_tick = held[5]
+
+    def _frame(self) -> BarFrame:
+        return BarFrame(
+            np.array([self._start], dtype=np.int64),
+            np.array([self._open]),
+            np.array([self._high]),
+            np.array([self._low]),
+            np.array([self._close]),
+            np.array([self._volume])
+        )
@@ -0,0 +1,152 @@
+"""
+Bar Frame
+Compact struct-of-arrays container for OHLCV bars used throughout the chart pipeline
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pytz
+
+
+EASTERN = pytz.timezone('US/Eastern')
+
+BAR_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+
+def eastern_utc_offsets(times: np.ndarray) -> np.ndarray:
+    """
+    Get the US/Eastern UTC offset (seconds) for each epoch timestamp
+
+    Offsets are resolved once per distinct UTC hour, so DST transitions
+    are exact while the per-bar work stays vectorized.
+
+    Args:
+        times: Epoch seconds
+
+    Returns:
+        int64 array of offsets (e.g. -14400 for EDT)
+    """
+    if len(times) == 0:
+        return np.zeros(0, dtype=np.int64)
+    hours, inverse = np.unique(np.asarray(times, dtype=np.int64) // 3600, return_inverse=True)
+    offsets = np.fromiter(
+        (int(datetime.fromtimestamp(int(hour) * 3600, tz=pytz.utc).astimezone(EASTERN).utcoffset().total_seconds())
+         for hour in hours),
+        dtype=np.int64, count=len(hours)
+    )
+    return offsets[inverse]
+
+
+def session_days(times: np.ndarray) -> np.ndarray:
+    """Get the US/Eastern calendar day number (days since epoch) for each timestamp"""
+    times = np.asarray(times, dtype=np.int64)
+    return (times + eastern_utc_offsets(times)) // 86400
+
+
+class BarFrame:
+    """
+    OHLCV bars as contiguous NumPy columns
+
+    time is int64 epoch seconds, prices and volume are float64. Slicing
+    returns views, so trimming to max_bars or windowing never copies.
+    """
+
+    __slots__ = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, time: np.ndarray, open: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        self.time = time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> 'BarFrame':
+        """Wrap a dict of column arrays (no copy when dtypes already match)"""
+        return cls(
+            np.asarray(columns['time'], dtype=np.int64),
+            *(np.asarray(columns[name], dtype=np.float64) for name in BAR_COLUMNS[1:])
+        )
+
+    @classmethod
+    def from_dicts(cls, bars: List[Dict[str, Any]]) -> 'BarFrame':
+        """Build a frame from legacy lightweight-charts style dicts"""
+        count = len(bars)
+        return cls(
+            np.fromiter((bar['time'] for bar in bars), dtype=np.int64, count=count),
+            *(np.fromiter((bar[name] for bar in bars), dtype=np.float64, count=count)
+              for name in BAR_COLUMNS[1:])
+        )
+
+    @classmethod
+    def empty(cls) -> 'BarFrame':
+        """Create a frame with no bars"""
+        return cls(np.zeros(0, dtype=np.int64), *(np.zeros(0) for _ in BAR_COLUMNS[1:]))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Get the frame as a dict of column arrays"""
+        return {name: getattr(self, name) for name in BAR_COLUMNS}
+
+    def slice(self, start: Optional[int], stop: Optional[int]) -> 'BarFrame':
+        """Get a zero-copy view of bars [start:stop]"""
+        return BarFrame(*(getattr(self, name)[start:stop] for name in BAR_COLUMNS))
+
+    def tail(self, count: int) -> 'BarFrame':
+        """Get a zero-copy view of the last count bars"""
+        if count <= 0:
+            return BarFrame.empty()
+        return self.slice(-count, None)
+
+    def copy(self) -> 'BarFrame':
+        """Copy into private in-memory arrays (detaches from memory-mapped storage)"""
+        return BarFrame(*(np.array(getattr(self, name)) for name in BAR_COLUMNS))
+
+    def merge(self, newer: 'BarFrame') -> 'BarFrame':
+        """
+        Combine with newer bars; bars at or after newer's first timestamp are replaced
+
+        Args:
+            newer: Bars sorted by time
+
+        Returns:
+            New frame containing both
+        """
+        if len(newer) == 0:
+            return self
+        keep = int(np.searchsorted(self.time, newer.time[0], side='left'))
+        return BarFrame(*(np.concatenate((getattr(self, name)[:keep], getattr(newer, name)))
+                          for name in BAR_COLUMNS))
+
+    def bar(self, index: int) -> Dict[str, Any]:
+        """Get a single bar as a dict (for display, not bulk processing)"""
+        return {
+            'time': int(self.time[index]),
+            'open': float(self.open[index]),
+            'high': float(self.high[index]),
+            'low': float(self.low[index]),
+            'close': float(self.close[index]),
+            'volume': int(self.volume[index])
+        }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to legacy lightweight-charts style dicts"""
+        return [self.bar(i) for i in range(len(self))]
+
+    def local_times(self) -> np.ndarray:
+        """Get US/Eastern wall-clock times as datetime64[s] (vectorized tz conversion)"""
+        return (self.time + eastern_utc_offsets(self.time)).astype('datetime64[s]')
+
+    def session_days(self) -> np.ndarray:
+        """Get the US/Eastern calendar day number for each bar"""
+        return session_days(self.time)
+
+    def price_range(self) -> Tuple[float, float]:
+        """Get the (lowest low, highest high) of the frame"""
+        return float(np.min(self.low)), float(np.max(self.high))
@@ -0,0 +1,64 @@
+"""
+Bar Resampler
+Vectorized OHLCV resampling of 1-minute bars into session-aligned higher timeframes
+"""
+
+import numpy as np
+
+from src.core.bar_frame import BarFrame, eastern_utc_offsets, session_days
+
+
+# Regular session open (09:30 US/Eastern) in seconds after local midnight
+SESSION_OPEN_SECONDS = 9 * 3600 + 30 * 60
+
+
+def count_sessions(times: np.ndarray) -> int:
+    """Count the distinct trading sessions covered by a series of timestamps"""
+    days = session_days(times)
+    if len(days) == 0:
+        return 0
+    return int(np.count_nonzero(np.diff(days)) + 1)
+
+
+def resample_bars(bars: BarFrame, minutes: int) -> BarFrame:
+    """
+    Aggregate 1-minute bars into N-minute bars aligned to the 09:30 session open
+
+    Buckets never span sessions; a bucket is labeled by its start time, and
+    the last bucket of a session may be shorter when the session length is
+    not a multiple of the bar length.
+
+    Args:
+        bars: 1-minute bars sorted by time
+        minutes: Target bar length in minutes
+
+    Returns:
+        Resampled bars
+    """
+    times = bars.time
+    if len(times) == 0:
+        return BarFrame.empty()
+
+    bucket_seconds = minutes * 60
+    offsets = eastern_utc_offsets(times)
+    local = times + offsets
+    days = local // 86400
+    buckets = (local - days * 86400 - SESSION_OPEN_SECONDS) // bucket_seconds
+
+    # Bucket boundaries: wherever the (day, bucket) pair changes
+    changed = np.empty(len(times), dtype=bool)
+    changed[0] = True
+    np.not_equal(days[1:], days[:-1], out=changed[1:])
+    changed[1:] |= buckets[1:] != buckets[:-1]
+    starts = np.flatnonzero(changed)
+    ends = np.append(starts[1:], len(times)) - 1
+
+    bucket_local = days[starts] * 86400 + SESSION_OPEN_SECONDS + buckets[starts] * bucket_seconds
+    return BarFrame(
+        bucket_local - offsets[starts],
+        bars.open[starts],
+        np.maximum.reduceat(bars.high, starts),
+        np.minimum.reduceat(bars.low, starts),
+        bars.close[ends],
+        np.add.reduceat(bars.volume, starts)
+    )
@@ -4,6 +4,7 @@ Real-time stock screening using IB TWS Scanner API
 """
 
 import asyncio
+import time
 from typing import List, Dict, Optional, Any, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -12,6 +13,8 @@ from ib_async import ScannerSubscription, ScanData, TagValue
 
 from src.utils.logger import logger
 from src.services.ib_connection_service import ib_connection_manager
+from src.services.contract_registry import contract_registry
+from src.services.market_data_pool import market_data_pool
 
 
 @dataclass
@@ -322,48 +325,40 @@ class MarketScreener:
             if not ib:
                 return {}
                 
-            logger.info(f"Fetching real market data for up to {price_limit} symbols from {len(symbols)} scanner results")
-            
-            # Create contracts for symbols
-            contracts = []
             # Import config for price fetch limit
             from config import SCREENER_CONFIG
             price_limit = SCREENER_CONFIG.get('real_price_limit', 20)
             
-            for symbol in symbols[:price_limit]:  # Fetch prices for configurable number of symbols
-                try:
-                    from ib_async import Stock
-                    contract = Stock(symbol, 'SMART', 'USD')
-                    contracts.append((symbol, contract))
-                except Exception as e:
-                    logger.warning(f"Error creating contract for {symbol}: {str(e)}")
-                    continue
+            logger.info(f"Fetching real market data for up to {price_limit} symbols from {len(symbols)} scanner results")
+            
+            # Qualify contracts in one batch (cached symbols skip the round trip)
+            qualified = contract_registry.qualify_symbols(symbols[:price_limit])
+            contracts = [(symbol, qualified[symbol.upper()]) for symbol in symbols[:price_limit]
+                         if symbol.upper() in qualified]
             
             if not contracts:
                 return {}
                 
-            # Qualify contracts
-            all_contracts = [contract for _, contract in contracts]
-            ib.qualifyContracts(*all_contracts)
-            
             # Request market data for each contract
             market_data = {}
             tickers = []
             
             for symbol, contract in contracts:
-                try:
-                    # Request tick data
-                    ticker = ib.reqMktData(contract, '', False, False)
-                    tickers.append((symbol, ticker))
-                except Exception as e:
-                    logger.warning(f"Error requesting market data for {symbol}: {str(e)}")
+                # Shared pooled line - symbols already streaming return live data
+                ticker = market_data_pool.acquire(symbol, contract)
+                if ticker is None:
+                    logger.warning(f"Error requesting market data for {symbol}")
                     continue
+                tickers.append((symbol, ticker))
             
             if not tickers:
                 return {}
                 
-            # Wait for data to populate with progressive timeout
-            ib.sleep(1.2)  # Optimized wait time for market data
+            # Wait only while some lines are still cold (max 1.2s)
+            deadline = time.monotonic() + 1.2
+            while (time.monotonic() < deadline and
+                   not all(self._has_quote(ticker) for _, ticker in tickers)):
+                ib.sleep(0.05)
             
             # Extract price and change data
             for symbol, ticker in tickers:
@@ -402,12 +397,9 @@ class MarketScreener:
                     logger.warning(f"Error processing market data for {symbol}: {str(e)}")
                     continue
             
-            # Cancel market data subscriptions to clean up
+            # Release lines back to the pool (they stay warm for repeat fetches)
             for symbol, ticker in tickers:
-                try:
-                    ib.cancelMktData(ticker.contract)
-                except:
-                    pass
+                market_data_pool.release(symbol)
                     
             logger.info(f"Successfully fetched market data for {len(market_data)} symbols")
             return market_data
@@ -416,6 +408,11 @@ class MarketScreener:
             logger.error(f"Error fetching current prices: {str(e)}")
             return {}
 
+    def _has_quote(self, ticker) -> bool:
+        """Check if a ticker has a usable price and previous close"""
+        has_price = (ticker.last and ticker.last > 0) or (ticker.bid and ticker.bid > 0 and ticker.ask and ticker.ask > 0)
+        return bool(has_price and ticker.close and ticker.close > 0)
+
     def get_formatted_results(self, fetch_real_data: bool = True) -> List[Dict[str, Any]]:
         """Get current results in formatted dictionary format"""
         formatted_results = []
@@ -8,10 +8,11 @@ from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import asyncio
 
-from ib_async import Stock, Order, Trade, LimitOrder, StopOrder, MarketOrder, BracketOrder, StopLimitOrder, util
+from ib_async import Order, Trade, LimitOrder, StopOrder, MarketOrder, BracketOrder, StopLimitOrder, util
 
 from src.utils.logger import logger
 from src.services.ib_connection_service import ib_connection_manager
+from src.services.contract_registry import contract_registry
 
 
 class OrderManager:
@@ -31,12 +32,17 @@ class OrderManager:
         
         Args:
             price: Raw price to round
-            symbol: Symbol (for future instrument-specific rules)
+            symbol: Symbol used to look up the instrument's market rule
             
         Returns:
             Properly rounded price
         """
         try:
+            # Use the instrument's market rule when the contract is registered
+            rounded = contract_registry.round_to_tick(symbol, price) if symbol else None
+            if rounded is not None:
+                return rounded
+                
             # For most US stocks, use penny increments (2 decimal places)
             # Sub-penny stocks (< $1) can use 4 decimal places, but round to 0.0001
             
@@ -104,13 +110,9 @@ class OrderManager:
                 
             logger.info(f"IB client available, connection status: {ib.isConnected()}")
                 
-            # Create contract
-            contract = Stock(symbol, 'SMART', 'USD')
-            
-            # Qualify the contract to ensure it's valid
-            qualified_contracts = ib.qualifyContracts(contract)
-            if qualified_contracts:
-                contract = qualified_contracts[0]
+            # Qualified contract from the shared registry
+            contract = contract_registry.get_contract(symbol)
+            if contract:
                 logger.info(f"Contract qualified: {contract.symbol} on {contract.exchange}")
             else:
                 logger.error(f"Failed to qualify contract for {symbol}")
@@ -402,11 +404,9 @@ class OrderManager:
             if total_percent != 100:
                 return False, f"Profit target percentages must total 100% (got {total_percent}%)", None
                 
-            # Create contract
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified_contracts = ib.qualifyContracts(contract)
-            if qualified_contracts:
-                contract = qualified_contracts[0]
+            # Qualified contract from the shared registry
+            contract = contract_registry.get_contract(symbol)
+            if contract:
                 logger.info(f"Contract qualified for multiple targets: {contract.symbol} on {contract.exchange}")
             else:
                 logger.error(f"Failed to qualify contract for {symbol}")
@@ -1,19 +1,23 @@
 """
 Real-Time Chart Updater
-Provides streaming chart updates using ib_async without affecting order operations
+Multi-symbol streaming manager using ib_async without affecting order operations
 """
 
-import asyncio
-from typing import Optional, Dict, Any, Callable, List
-from datetime import datetime, timedelta
-from dataclasses import dataclass
-import numpy as np
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, List, Tuple
+from datetime import datetime
+from dataclasses import dataclass, field
 
-from ib_async import IB, Stock, RealTimeBar, BarData
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from ib_async import Contract, RealTimeBarList, Ticker
+from PyQt6.QtCore import QObject, QTimer
 
 from src.utils.logger import logger
 from src.services.ib_connection_service import ib_connection_manager
+from src.services.market_data_pool import market_data_pool
+from src.services.contract_registry import contract_registry
+from src.core.tick_conflator import tick_conflator, TickCallback
+from config import REAL_TIME_STREAM_CONFIG
 
 
 @dataclass
@@ -28,129 +32,323 @@ class StreamingBar:
     wap: float = 0.0  # Volume weighted average price
 
 
+# Subscriber callback: bars(symbol, [StreamingBar, ...]); price callbacks are TickCallbacks
+BarCallback = Callable[[str, List[StreamingBar]], None]
+
+
+@dataclass
+class SymbolStream:
+    """Live real-time bar and tick subscriptions for one contract"""
+    con_id: int
+    symbol: str
+    contract: Contract
+    rt_bars: Optional[RealTimeBarList] = None
+    ticker: Optional[Ticker] = None
+    tick_handler: Optional[Callable] = None
+    bar_callbacks: List[BarCallback] = field(default_factory=list)
+    price_callbacks: List[Tuple[TickCallback, str]] = field(default_factory=list)  # (callback, consumer)
+
+    # Coalesced bars waiting for the next flush
+    pending_bars: List[StreamingBar] = field(default_factory=list)
+
+    # Stats
+    started: float = 0.0
+    last_used: float = 0.0
+    bars_received: int = 0
+    ticks_received: int = 0
+    flushes: int = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self.bar_callbacks) + len(self.price_callbacks)
+
+
 class RealTimeChartUpdater(QObject):
     """
-    Real-time chart updater using ib_async streaming capabilities
-    Optimized for minimal latency without affecting trading operations
+    Real-time streaming for many symbols at once
+
+    Each contract (keyed by conId) gets one reqRealTimeBars subscription and
+    one pooled tick line, shared by all of its subscribers. Bars are coalesced
+    per symbol and delivered on a fixed flush interval only to that symbol's
+    subscribers; ticks are written to the tick conflator, which publishes
+    them to each consumer at its own cadence. Streams whose last subscriber leaves stay open
+    (warm) so switching back is instant; the least recently used idle streams
+    are closed beyond max_idle_streams or when max_streams is reached.
+    Streams with subscribers survive a disconnect: their subscriber lists are
+    kept and the IB subscriptions are reopened when the connection returns.
     """
-    
-    # Signals for chart updates
-    new_bar_update = pyqtSignal(object)  # StreamingBar
-    price_tick_update = pyqtSignal(float, float, float)  # last, bid, ask
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ib_manager = ib_connection_manager
-        self.current_symbol = None
-        self.streaming_contract = None
-        self.is_streaming = False
-        
-        # Real-time data handlers
-        self._rt_bars_subscription = None
-        self._price_subscription = None
-        
-        # Buffering for performance
-        self._price_buffer = []
-        self._update_buffer_timer = QTimer()
-        self._update_buffer_timer.timeout.connect(self._flush_price_buffer)
-        
-        # Performance tracking
-        self._last_update_time = 0
-        self._update_count = 0
-        
-    def start_streaming(self, symbol: str) -> bool:
+        self.max_streams = REAL_TIME_STREAM_CONFIG['max_streams']
+        self.max_idle_streams = REAL_TIME_STREAM_CONFIG['max_idle_streams']
+        self.bar_size = REAL_TIME_STREAM_CONFIG['bar_size']
+
+        self._streams: "OrderedDict[int, SymbolStream]" = OrderedDict()  # conId -> stream, LRU order
+        self._con_ids: Dict[str, int] = {}  # symbol -> conId
+        self._dirty: Dict[int, SymbolStream] = {}  # streams with pending updates
+        self._suspended: Dict[str, SymbolStream] = {}  # symbol -> stream waiting for a reconnect
+        self._disconnect_hooked = False
+
+        # One timer flushes every symbol's coalesced updates
+        self._flush_timer = QTimer()
+        self._flush_timer.setInterval(REAL_TIME_STREAM_CONFIG['flush_interval_ms'])
+        self._flush_timer.timeout.connect(self._flush)
+
+    # ============================================================================
+    # SUBSCRIPTIONS
+    # ============================================================================
+
+    def subscribe(self, symbol: str, on_bars: Optional[BarCallback] = None,
+                  on_price: Optional[TickCallback] = None, consumer: str = 'default') -> bool:
         """
-        Start real-time streaming for a symbol
-        
+        Subscribe to a symbol's real-time bars and/or price ticks
+
         Args:
-            symbol: Stock symbol to stream
-            
+            symbol: Stock symbol
+            on_bars: Called with (symbol, bars) for new/updated 5-second bars
+            on_price: Called with (symbol, last, bid, ask), conflated to the latest tick
+            consumer: Conflation consumer name, which sets the price publish rate
+
         Returns:
-            bool: True if streaming started successfully
+            True if the symbol is streaming
         """
         try:
-            if not self.ib_manager or not self.ib_manager.is_connected():
-                logger.warning("IB not connected - cannot start real-time streaming")
+            stream = self._get_or_open_stream(symbol.upper())
+            if stream is None:
                 return False
-                
-            # Stop existing streaming
-            self.stop_streaming()
-            
-            # Create contract
-            self.streaming_contract = Stock(symbol, 'SMART', 'USD')
-            self.current_symbol = symbol
-            
-            # Method 1: Real-time 5-second bars (fastest for chart updates)
-            self._start_realtime_bars()
-            
-            # Method 2: Tick-by-tick price updates (for live price display)
-            self._start_price_ticks()
-            
-            self.is_streaming = True
-            logger.info(f"Started real-time streaming for {symbol}")
+
+            if on_bars and on_bars not in stream.bar_callbacks:
+                stream.bar_callbacks.append(on_bars)
+            if on_price and (on_price, consumer) not in stream.price_callbacks:
+                stream.price_callbacks.append((on_price, consumer))
+                tick_conflator.subscribe(stream.symbol, on_price, consumer)
+            stream.last_used = time.time()
+            self._streams.move_to_end(stream.con_id)
+
+            logger.debug(f"Subscribed to {stream.symbol} ({stream.subscriber_count} subscribers, {len(self._streams)} streams)")
             return True
-            
+
         except Exception as e:
-            logger.error(f"Error starting real-time streaming: {e}")
+            logger.error(f"Error subscribing to real-time data for {symbol}: {e}")
             return False
-    
-    def _start_realtime_bars(self):
-        """Start real-time 5-second bar updates"""
+
+    def unsubscribe(self, symbol: str, on_bars: Optional[BarCallback] = None,
+                    on_price: Optional[TickCallback] = None, consumer: str = 'default'):
+        """
+        Remove a subscriber; the stream stays warm until evicted
+
+        Args:
+            symbol: Stock symbol
+            on_bars, on_price, consumer: Arguments passed to subscribe()
+        """
         try:
-            if not self.ib_manager.ib:
+            stream = self._stream_for(symbol) or self._suspended.get(symbol.upper())
+            if stream is None:
                 return
-                
-            # Request real-time 5-second bars
-            # This provides OHLCV data every 5 seconds
-            self._rt_bars_subscription = self.ib_manager.ib.reqRealTimeBars(
-                contract=self.streaming_contract,
-                barSize=5,  # 5-second bars
-                whatToShow='TRADES',  # Use actual trades
-                useRTH=False  # Include extended hours
-            )
-            
-            # Set up the callback for new bars
-            self._rt_bars_subscription.updateEvent += self._on_realtime_bar
-            
-            logger.info(f"Started real-time 5-second bars for {self.current_symbol}")
-            
+            if on_bars in stream.bar_callbacks:
+                stream.bar_callbacks.remove(on_bars)
+            if (on_price, consumer) in stream.price_callbacks:
+                stream.price_callbacks.remove((on_price, consumer))
+                tick_conflator.unsubscribe(stream.symbol, on_price, consumer)
+            stream.last_used = time.time()
+
+            if stream.subscriber_count == 0 and self._suspended.get(stream.symbol) is stream:
+                del self._suspended[stream.symbol]
+            elif stream.subscriber_count == 0:
+                logger.debug(f"{stream.symbol} stream idle, kept warm")
+                self._trim_idle_streams()
+
         except Exception as e:
-            logger.error(f"Error starting real-time bars: {e}")
-    
-    def _start_price_ticks(self):
-        """Start tick-by-tick price updates for live price display"""
+            logger.error(f"Error unsubscribing from real-time data for {symbol}: {e}")
+
+    def is_streaming(self, symbol: str) -> bool:
+        """Check whether a symbol has an open stream"""
+        return self._stream_for(symbol) is not None
+
+    def get_subscriber_count(self, symbol: str) -> int:
+        """Get the number of subscriber callbacks for a symbol"""
+        stream = self._stream_for(symbol)
+        return stream.subscriber_count if stream else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get stream statistics"""
+        return {
+            'streams': len(self._streams),
+            'max_streams': self.max_streams,
+            'active': sum(1 for stream in self._streams.values() if stream.subscriber_count),
+            'symbols': {
+                stream.symbol: {
+                    'con_id': stream.con_id,
+                    'subscribers': stream.subscriber_count,
+                    'bars_received': stream.bars_received,
+                    'ticks_received': stream.ticks_received,
+                    'flushes': stream.flushes,
+                }
+                for stream in self._streams.values()
+            }
+        }
+
+    def stop_all(self):
+        """Close every stream (subscribers are dropped)"""
+        for con_id in list(self._streams):
+            self._close_stream(con_id)
+        for stream in self._suspended.values():
+            for callback, consumer in stream.price_callbacks:
+                tick_conflator.unsubscribe(stream.symbol, callback, consumer)
+        self._suspended.clear()
+        self._flush_timer.stop()
+        logger.info("Stopped all real-time streams")
+
+    # ============================================================================
+    # STREAM LIFECYCLE
+    # ============================================================================
+
+    def _stream_for(self, symbol: str) -> Optional[SymbolStream]:
+        con_id = self._con_ids.get(symbol.upper())
+        return self._streams.get(con_id) if con_id is not None else None
+
+    def _get_or_open_stream(self, symbol: str) -> Optional[SymbolStream]:
+        """Reuse the symbol's stream or open one, evicting an idle stream if at capacity"""
+        stream = self._stream_for(symbol)
+        if stream is not None:
+            return stream
+
+        if not self.ib_manager or not self.ib_manager.is_connected() or not self.ib_manager.ib:
+            logger.warning("IB not connected - cannot start real-time streaming")
+            return None
+
+        contract = contract_registry.get_contract(symbol)
+        if not contract or not contract.conId:
+            logger.error(f"Cannot stream {symbol}: contract not qualified")
+            return None
+
+        # Another symbol alias may already stream this contract
+        stream = self._streams.get(contract.conId)
+        if stream is not None:
+            self._con_ids[symbol] = contract.conId
+            return stream
+
+        if len(self._streams) >= self.max_streams and not self._evict_idle_stream():
+            logger.warning(f"Real-time stream limit ({self.max_streams}) reached, cannot stream {symbol}")
+            return None
+
+        self._hook_disconnect()
+        stream = SymbolStream(con_id=contract.conId, symbol=symbol, contract=contract, started=time.time())
+        ib = self.ib_manager.ib
+
+        # 5-second real-time bars for chart updates
+        stream.rt_bars = ib.reqRealTimeBars(contract, self.bar_size, 'TRADES', False)
+        stream.rt_bars.updateEvent += lambda bars, has_new_bar, stream=stream: self._on_realtime_bar(stream, bars)
+
+        # Shared tick line from the pool (reused by price fetches)
+        stream.ticker = market_data_pool.acquire(symbol, contract)
+        if stream.ticker is not None:
+            stream.tick_handler = lambda ticker, stream=stream: self._on_price_tick(stream, ticker)
+            stream.ticker.updateEvent += stream.tick_handler
+        else:
+            logger.warning(f"No market data line available for {symbol}, streaming bars only")
+
+        self._streams[contract.conId] = stream
+        self._con_ids[symbol] = contract.conId
+        logger.info(f"Started real-time streaming for {symbol} (conId {contract.conId}, {len(self._streams)} streams)")
+        return stream
+
+    def _close_stream(self, con_id: int):
+        """Cancel a stream's subscriptions and forget it"""
+        stream = self._streams.pop(con_id, None)
+        if stream is None:
+            return
+        self._dirty.pop(con_id, None)
+        for callback, consumer in stream.price_callbacks:
+            tick_conflator.unsubscribe(stream.symbol, callback, consumer)
+        for symbol in [symbol for symbol, cid in self._con_ids.items() if cid == con_id]:
+            del self._con_ids[symbol]
         try:
-            if not self.ib_manager.ib:
-                return
-                
-            # Request market data for price ticks
-            self._price_subscription = self.ib_manager.ib.reqMktData(
-                contract=self.streaming_contract,
-                genericTickList='',  # Standard price data
-                snapshot=False,  # Streaming data
-                regulatorySnapshot=False
-            )
-            
-            # Set up price update callback
-            self._price_subscription.updateEvent += self._on_price_tick
-            
-            logger.info(f"Started price tick streaming for {self.current_symbol}")
-            
+            if stream.rt_bars is not None:
+                stream.rt_bars.updateEvent.clear()
+                if self.ib_manager.is_connected():
+                    self.ib_manager.ib.cancelRealTimeBars(stream.rt_bars)
+            if stream.ticker is not None:
+                # The ticker is pooled and may have other users - detach only our handler
+                stream.ticker.updateEvent -= stream.tick_handler
+                market_data_pool.release(stream.symbol)
+            logger.info(f"Stopped real-time streaming for {stream.symbol}")
         except Exception as e:
-            logger.error(f"Error starting price ticks: {e}")
-    
-    def _on_realtime_bar(self, bars, *args):
-        """Handle incoming real-time bar data"""
-        try:
-            # Handle the callback signature - ib_async passes (subscription, bars)
-            if isinstance(bars, (list, tuple)) and len(bars) > 0:
-                # Extract the actual RealTimeBar from the list
-                real_bar = bars[0] if isinstance(bars, (list, tuple)) else bars
+            logger.error(f"Error stopping real-time streaming for {stream.symbol}: {e}")
+
+    def _evict_idle_stream(self) -> bool:
+        """Close the least recently used stream without subscribers"""
+        for con_id, stream in self._streams.items():
+            if stream.subscriber_count == 0:
+                self._close_stream(con_id)
+                return True
+        return False
+
+    def _trim_idle_streams(self):
+        """Keep at most max_idle_streams warm"""
+        idle = [con_id for con_id, stream in self._streams.items() if stream.subscriber_count == 0]
+        for con_id in idle[:max(0, len(idle) - self.max_idle_streams)]:
+            self._close_stream(con_id)
+
+    def _hook_disconnect(self):
+        if not self._disconnect_hooked and self.ib_manager.ib:
+            self.ib_manager.ib.disconnectedEvent += self._on_disconnected
+            self.ib_manager.ib.connectedEvent += self._on_reconnected
+            self._disconnect_hooked = True
+
+    def _on_disconnected(self):
+        """IB subscriptions die with the connection - keep the subscribers for the reconnect"""
+        for stream in self._streams.values():
+            if stream.rt_bars is not None:
+                stream.rt_bars.updateEvent.clear()
+            if stream.ticker is not None:
+                stream.ticker.updateEvent -= stream.tick_handler
+            if stream.subscriber_count:
+                # Price callbacks stay subscribed to the tick conflator's slot
+                self._suspended[stream.symbol] = stream
             else:
-                real_bar = bars
-                
-            # Convert to our StreamingBar format
-            # Handle ib_async RealTimeBar attribute names safely
+                for callback, consumer in stream.price_callbacks:
+                    tick_conflator.unsubscribe(stream.symbol, callback, consumer)
+        if self._streams:
+            logger.info(f"Real-time streams lost with the connection, "
+                        f"{len(self._suspended)} will reopen on reconnect")
+        self._streams.clear()
+        self._con_ids.clear()
+        self._dirty.clear()
+        self._flush_timer.stop()
+
+    def _on_reconnected(self):
+        """Reopen the streams that still had subscribers when the connection dropped"""
+        suspended, self._suspended = self._suspended, {}
+        for symbol, old in suspended.items():
+            stream = self._get_or_open_stream(symbol)
+            if stream is None:
+                logger.warning(f"Could not reopen real-time streaming for {symbol} after reconnect")
+                for callback, consumer in old.price_callbacks:
+                    tick_conflator.unsubscribe(symbol, callback, consumer)
+                continue
+            for callback in old.bar_callbacks:
+                if callback not in stream.bar_callbacks:
+                    stream.bar_callbacks.append(callback)
+            for entry in old.price_callbacks:
+                if entry not in stream.price_callbacks:
+                    stream.price_callbacks.append(entry)
+            stream.last_used = time.time()
+        if suspended:
+            logger.info(f"Reopened {len(self._streams)} real-time streams after reconnect")
+
+    # ============================================================================
+    # UPDATES
+    # ============================================================================
+
+    def _on_realtime_bar(self, stream: SymbolStream, bars):
+        """Queue the newest real-time bar for the stream's subscribers"""
+        try:
+            if not bars:
+                return
+            real_bar = bars[-1]
             streaming_bar = StreamingBar(
                 time=real_bar.time,
                 open=getattr(real_bar, 'open_', getattr(real_bar, 'open', 0.0)),
@@ -160,84 +358,58 @@ class RealTimeChartUpdater(QObject):
                 volume=getattr(real_bar, 'volume', 0),
                 wap=getattr(real_bar, 'wap', 0.0)
             )
-            
-            # Emit signal for chart update
-            self.new_bar_update.emit(streaming_bar)
-            
-            # Performance tracking
-            self._update_count += 1
-            current_time = datetime.now().timestamp()
-            if current_time - self._last_update_time > 60:  # Log every minute
-                logger.info(f"Real-time updates: {self._update_count} bars/minute for {self.current_symbol}")
-                self._update_count = 0
-                self._last_update_time = current_time
-            
-        except Exception as e:
-            logger.error(f"Error processing real-time bar: {e}")
-    
-    def _on_price_tick(self, ticker):
-        """Handle incoming price tick data"""
-        try:
-            if hasattr(ticker, 'last') and hasattr(ticker, 'bid') and hasattr(ticker, 'ask'):
-                last = float(ticker.last) if ticker.last and ticker.last > 0 else 0.0
-                bid = float(ticker.bid) if ticker.bid and ticker.bid > 0 else 0.0  
-                ask = float(ticker.ask) if ticker.ask and ticker.ask > 0 else 0.0
-                
-                if last > 0:  # Only emit if we have valid price data
-                    # Buffer price updates to avoid overwhelming the UI
-                    self._price_buffer.append((last, bid, ask))
-                    
-                    # Start timer for batched updates (100ms intervals)
-                    if not self._update_buffer_timer.isActive():
-                        self._update_buffer_timer.start(100)
-                        
-        except Exception as e:
-            logger.error(f"Error processing price tick: {e}")
-    
-    def _flush_price_buffer(self):
-        """Flush buffered price updates"""
-        try:
-            if self._price_buffer:
-                # Use the most recent price from the buffer
-                last, bid, ask = self._price_buffer[-1]
-                self.price_tick_update.emit(last, bid, ask)
-                self._price_buffer.clear()
-                
-            self._update_buffer_timer.stop()
-            
+
+            # A revised bar with the same timestamp replaces the queued one
+            pending = stream.pending_bars
+            if pending and pending[-1].time == streaming_bar.time:
+                pending[-1] = streaming_bar
+            else:
+                pending.append(streaming_bar)
+            stream.bars_received += 1
+            self._mark_dirty(stream)
+
         except Exception as e:
-            logger.error(f"Error flushing price buffer: {e}")
-    
-    def stop_streaming(self):
-        """Stop all real-time streaming"""
+            logger.error(f"Error processing real-time bar for {stream.symbol}: {e}")
+
+    def _on_price_tick(self, stream: SymbolStream, ticker):
+        """Overwrite the symbol's conflation slot with the latest valid tick"""
         try:
-            if not self.ib_manager.ib:
+            last = ticker.last
+            if not last or last <= 0:
                 return
-                
-            # Cancel real-time bars
-            if self._rt_bars_subscription:
-                self.ib_manager.ib.cancelRealTimeBars(self._rt_bars_subscription)
-                self._rt_bars_subscription = None
-                
-            # Cancel price ticks
-            if self._price_subscription:
-                self.ib_manager.ib.cancelMktData(self._price_subscription)
-                self._price_subscription = None
-                
-            # Stop timers
-            self._update_buffer_timer.stop()
-            
-            self.is_streaming = False
-            logger.info(f"Stopped real-time streaming for {self.current_symbol}")
-            
+            bid = ticker.bid if ticker.bid and ticker.bid > 0 else 0.0
+            ask = ticker.ask if ticker.ask and ticker.ask > 0 else 0.0
+            tick_conflator.publish(stream.symbol, float(last), float(bid), float(ask))
+            stream.ticks_received += 1
+
         except Exception as e:
-            logger.error(f"Error stopping real-time streaming: {e}")
-    
-    def change_symbol(self, new_symbol: str):
-        """Change the streaming symbol"""
-        if new_symbol != self.current_symbol:
-            self.start_streaming(new_symbol)
+            logger.error(f"Error processing price tick for {stream.symbol}: {e}")
+
+    def _mark_dirty(self, stream: SymbolStream):
+        if not stream.bar_callbacks:
+            # Warm stream: keep only the latest state, nobody to deliver to
+            del stream.pending_bars[:-1]
+            return
+        self._dirty[stream.con_id] = stream
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Deliver each symbol's coalesced bars to that symbol's subscribers only"""
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            self._flush_timer.stop()
+            return
+
+        for stream in dirty.values():
+            bars, stream.pending_bars = stream.pending_bars, []
+            stream.flushes += 1
+            for callback in list(stream.bar_callbacks):
+                try:
+                    callback(stream.symbol, bars)
+                except Exception as e:
+                    logger.error(f"Error in real-time bar subscriber for {stream.symbol}: {e}")
 
 
 # Global instance
-real_time_updater = RealTimeChartUpdater()
\ No newline at end of file
+real_time_updater = RealTimeChartUpdater()
@@ -0,0 +1,212 @@
+"""
+Tick Conflator
+Per-symbol latest-value slots published to each consumer at its own fixed cadence
+"""
+
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.utils.logger import logger
+from config import CONFLATION_CONFIG
+
+
+# Consumer callback: (symbol, last, bid, ask)
+TickCallback = Callable[[str, float, float, float], None]
+
+
+class TickSlot:
+    """Latest quote for one symbol, overwritten in place on every tick"""
+
+    __slots__ = ('symbol', 'last', 'bid', 'ask', 'seq', 'updated')
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.last = 0.0
+        self.bid = 0.0
+        self.ask = 0.0
+        self.seq = 0        # Incremented on every write
+        self.updated = 0.0
+
+
+class ConsumerSubscription:
+    """One callback's view of a symbol slot"""
+
+    __slots__ = ('slot', 'callback', 'delivered_seq')
+
+    def __init__(self, slot: TickSlot, callback: TickCallback):
+        self.slot = slot
+        self.callback = callback
+        self.delivered_seq = slot.seq
+
+
+class ConflationConsumer:
+    """A named consumer class (chart, order panel, ...) sharing one publish timer"""
+
+    def __init__(self, name: str, rate_hz: float):
+        self.name = name
+        self.rate_hz = rate_hz
+        self.subscriptions: List[ConsumerSubscription] = []
+        self.timer = QTimer()
+        self.timer.setInterval(max(1, int(1000 / rate_hz)))
+
+        # Stats
+        self.delivered = 0
+        self.dropped = 0
+        self.publishes = 0
+
+
+class TickConflator(QObject):
+    """
+    Conflates tick updates into fixed per-symbol slots
+
+    Producers write with publish(); nothing is queued or allocated per tick.
+    Each consumer is polled by its own timer at its configured rate and only
+    receives symbols whose slot changed since its last delivery. Ticks that
+    were overwritten before a consumer saw them are counted as dropped.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rates = dict(CONFLATION_CONFIG['rates_hz'])
+        self.default_rate = CONFLATION_CONFIG['default_hz']
+        self._slots: Dict[str, TickSlot] = {}
+        self._consumers: Dict[str, ConflationConsumer] = {}
+        self.received = 0
+
+    # ============================================================================
+    # PRODUCER SIDE
+    # ============================================================================
+
+    def publish(self, symbol: str, last: float, bid: float, ask: float):
+        """
+        Overwrite a symbol's slot with the latest quote
+
+        Args:
+            symbol: Stock symbol
+            last, bid, ask: Latest prices (0.0 if unknown)
+        """
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._slots[symbol] = TickSlot(symbol)
+        slot.last = last
+        slot.bid = bid
+        slot.ask = ask
+        slot.seq += 1
+        slot.updated = time.time()
+        self.received += 1
+
+    def get_latest(self, symbol: str) -> Optional[TickSlot]:
+        """Get a symbol's current slot without subscribing"""
+        return self._slots.get(symbol.upper())
+
+    # ============================================================================
+    # CONSUMER SIDE
+    # ============================================================================
+
+    def subscribe(self, symbol: str, callback: TickCallback, consumer: str = 'default'):
+        """
+        Receive conflated ticks for a symbol at the consumer's cadence
+
+        Args:
+            symbol: Stock symbol
+            callback: Called with (symbol, last, bid, ask)
+            consumer: Consumer name from CONFLATION_CONFIG['rates_hz']
+        """
+        symbol = symbol.upper()
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._slots[symbol] = TickSlot(symbol)
+
+        group = self._get_consumer(consumer)
+        if any(sub.slot is slot and sub.callback == callback for sub in group.subscriptions):
+            return
+        group.subscriptions.append(ConsumerSubscription(slot, callback))
+        if not group.timer.isActive():
+            group.timer.start()
+
+    def unsubscribe(self, symbol: str, callback: TickCallback, consumer: str = 'default'):
+        """
+        Stop receiving ticks for a symbol
+
+        Args:
+            symbol: Stock symbol
+            callback: Callback passed to subscribe()
+            consumer: Consumer name passed to subscribe()
+        """
+        group = self._consumers.get(consumer)
+        if group is None:
+            return
+        symbol = symbol.upper()
+        group.subscriptions = [
+            sub for sub in group.subscriptions
+            if not (sub.slot.symbol == symbol and sub.callback == callback)
+        ]
+        if not group.subscriptions:
+            group.timer.stop()
+
+        # Drop slots nobody reads any more
+        if not any(sub.slot.symbol == symbol
+                   for other in self._consumers.values() for sub in other.subscriptions):
+            self._slots.pop(symbol, None)
+
+    def set_rate(self, consumer: str, rate_hz: float):
+        """Change a consumer's publish cadence"""
+        self.rates[consumer] = rate_hz
+        group = self._consumers.get(consumer)
+        if group is not None:
+            group.rate_hz = rate_hz
+            group.timer.setInterval(max(1, int(1000 / rate_hz)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivered versus dropped counters per consumer"""
+        return {
+            'received': self.received,
+            'slots': len(self._slots),
+            'consumers': {
+                name: {
+                    'rate_hz': group.rate_hz,
+                    'subscriptions': len(group.subscriptions),
+                    'publishes': group.publishes,
+                    'delivered': group.delivered,
+                    'dropped': group.dropped,
+                }
+                for name, group in self._consumers.items()
+            }
+        }
+
+    def stop(self):
+        """Stop all consumer timers and drop subscriptions"""
+        for group in self._consumers.values():
+            group.timer.stop()
+            group.subscriptions.clear()
+        self._slots.clear()
+
+    def _get_consumer(self, name: str) -> ConflationConsumer:
+        group = self._consumers.get(name)
+        if group is None:
+            group = ConflationConsumer(name, self.rates.get(name, self.default_rate))
+            group.timer.timeout.connect(lambda group=group: self._publish(group))
+            self._consumers[name] = group
+            logger.debug(f"Tick conflation consumer '{name}' at {group.rate_hz}Hz")
+        return group
+
+    def _publish(self, group: ConflationConsumer):
+        """Deliver changed slots to one consumer (GUI thread timer)"""
+        group.publishes += 1
+        for sub in group.subscriptions:
+            slot = sub.slot
+            if slot.seq == sub.delivered_seq:
+                continue
+            group.dropped += slot.seq - sub.delivered_seq - 1
+            sub.delivered_seq = slot.seq
+            try:
+                sub.callback(slot.symbol, slot.last, slot.bid, slot.ask)
+                group.delivered += 1
+            except Exception as e:
+                logger.error(f"Error in '{group.name}' tick consumer for {slot.symbol}: {str(e)}")
+
+
+# Create singleton instance for global access
+tick_conflator = TickConflator()
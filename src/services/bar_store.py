@@ -0,0 +1,277 @@
+"""
+Bar Store
+Persistent columnar store of historical bars (memory-mapped NumPy columns per symbol and bar size)
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.utils.logger import logger
+from config import CACHE_DIR
+
+
+# Column layout: epoch seconds + OHLCV
+BAR_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+BAR_DTYPES = {
+    'time': np.dtype('<i8'),
+    'open': np.dtype('<f8'),
+    'high': np.dtype('<f8'),
+    'low': np.dtype('<f8'),
+    'close': np.dtype('<f8'),
+    'volume': np.dtype('<f8'),
+}
+
+
+class BarStore:
+    """
+    On-disk bar store with one raw column file per field
+
+    Layout: <root>/<SYMBOL>/<bar_size>/{meta.json, <column>.<generation>.bin}
+    The row count lives in meta.json, so appends write column data past the
+    stored rows first and commit by updating the metadata. Anything that
+    changes stored rows (tail replacements, prepended history) goes to a new
+    generation, so readers holding memory maps never see rows change.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(CACHE_DIR, 'bars')
+        os.makedirs(self.root, exist_ok=True)
+
+    def load(self, symbol: str, bar_size: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load stored bars as read-only memory-mapped columns
+
+        Args:
+            symbol: Stock symbol
+            bar_size: IB bar size setting (e.g. '1 min')
+
+        Returns:
+            Dict of column name -> array, or None if nothing is stored
+        """
+        try:
+            meta = self._read_meta(symbol, bar_size)
+            if not meta or meta['rows'] == 0:
+                return None
+
+            series_dir = self._series_dir(symbol, bar_size)
+            rows = meta['rows']
+            return {
+                name: np.memmap(
+                    os.path.join(series_dir, f"{name}.{meta['generation']}.bin"),
+                    dtype=BAR_DTYPES[name], mode='r', shape=(rows,)
+                )
+                for name in BAR_COLUMNS
+            }
+        except Exception as e:
+            logger.warning(f"Error loading stored bars for {symbol} {bar_size}: {str(e)}")
+            return None
+
+    def get_row_count(self, symbol: str, bar_size: str) -> int:
+        """Get the number of stored bars"""
+        meta = self._read_meta(symbol, bar_size)
+        return meta['rows'] if meta else 0
+
+    def last_timestamp(self, symbol: str, bar_size: str) -> Optional[int]:
+        """Get the epoch timestamp of the newest stored bar"""
+        columns = self.load(symbol, bar_size)
+        return int(columns['time'][-1]) if columns is not None else None
+
+    def append(self, symbol: str, bar_size: str, columns: Dict[str, np.ndarray]) -> bool:
+        """
+        Merge newer bars into the store
+
+        Stored bars at or after the first new timestamp are replaced (the
+        previously stored last bar may have still been forming). Pure appends
+        extend the current generation in place; replacing stored bars writes
+        a new generation.
+
+        Args:
+            symbol: Stock symbol
+            bar_size: IB bar size setting
+            columns: Dict of column name -> array, sorted by time
+
+        Returns:
+            True if the bars were written
+        """
+        try:
+            new_rows = len(columns['time'])
+            if new_rows == 0:
+                return True
+
+            meta = self._read_meta(symbol, bar_size)
+            if not meta:
+                return self._rewrite(symbol, bar_size, columns)
+
+            stored = self.load(symbol, bar_size)
+            rows = meta['rows']
+            write_from = rows
+            if stored is not None:
+                write_from = int(np.searchsorted(stored['time'], columns['time'][0], side='left'))
+                if write_from < rows:
+                    merged = {
+                        name: np.concatenate((stored[name][:write_from],
+                                              np.asarray(columns[name], dtype=BAR_DTYPES[name])))
+                        for name in BAR_COLUMNS
+                    }
+                    del stored
+                    self._rewrite(symbol, bar_size, merged)
+                    logger.debug(f"Stored {new_rows} bars for {symbol} {bar_size} "
+                                 f"({len(merged['time'])} total, {rows - write_from} replaced)")
+                    return True
+                del stored
+
+            series_dir = self._series_dir(symbol, bar_size)
+            for name in BAR_COLUMNS:
+                path = os.path.join(series_dir, f"{name}.{meta['generation']}.bin")
+                data = np.ascontiguousarray(columns[name], dtype=BAR_DTYPES[name])
+                with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+                    f.seek(write_from * BAR_DTYPES[name].itemsize)
+                    f.write(data.tobytes())
+
+            meta['rows'] = write_from + new_rows
+            self._write_meta(symbol, bar_size, meta)
+            logger.debug(f"Stored {new_rows} bars for {symbol} {bar_size} ({meta['rows']} total)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error storing bars for {symbol} {bar_size}: {str(e)}")
+            return False
+
+    def prepend(self, symbol: str, bar_size: str, columns: Dict[str, np.ndarray]) -> bool:
+        """
+        Merge older bars in front of the store
+
+        Bars at or after the first stored timestamp are ignored (the stored
+        series is authoritative there). The merged series is written as a
+        new generation, so readers holding memory maps are unaffected.
+
+        Args:
+            symbol: Stock symbol
+            bar_size: IB bar size setting
+            columns: Dict of column name -> array, sorted by time
+
+        Returns:
+            True if any older bars were written
+        """
+        try:
+            stored = self.load(symbol, bar_size)
+            if stored is None:
+                return len(columns['time']) > 0 and self._rewrite(symbol, bar_size, columns)
+
+            older = int(np.searchsorted(columns['time'], stored['time'][0], side='left'))
+            if older == 0:
+                return False
+
+            merged = {
+                name: np.concatenate((np.asarray(columns[name][:older], dtype=BAR_DTYPES[name]), stored[name]))
+                for name in BAR_COLUMNS
+            }
+            del stored
+            self._rewrite(symbol, bar_size, merged)
+            logger.debug(f"Prepended {older} bars for {symbol} {bar_size} ({len(merged['time'])} total)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error prepending bars for {symbol} {bar_size}: {str(e)}")
+            return False
+
+    def replace(self, symbol: str, bar_size: str, columns: Dict[str, np.ndarray]) -> bool:
+        """
+        Replace the stored series with a fresh download
+
+        Written as a new generation, so readers holding memory maps are unaffected.
+
+        Args:
+            symbol: Stock symbol
+            bar_size: IB bar size setting
+            columns: Dict of column name -> array, sorted by time
+
+        Returns:
+            True if the bars were written
+        """
+        try:
+            if len(columns['time']) == 0:
+                return False
+            self._rewrite(symbol, bar_size, columns)
+            logger.debug(f"Replaced stored bars for {symbol} {bar_size} ({len(columns['time'])} total)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error replacing bars for {symbol} {bar_size}: {str(e)}")
+            return False
+
+    def clear(self, symbol: Optional[str] = None):
+        """
+        Delete stored bars
+
+        Args:
+            symbol: Symbol to clear, or None to clear everything
+        """
+        try:
+            target = os.path.join(self.root, symbol.upper()) if symbol else self.root
+            shutil.rmtree(target, ignore_errors=True)
+            os.makedirs(self.root, exist_ok=True)
+            logger.info(f"Cleared stored bars for {symbol or 'all symbols'}")
+        except Exception as e:
+            logger.error(f"Error clearing stored bars: {str(e)}")
+
+    # ============================================================================
+    # FILE LAYOUT
+    # ============================================================================
+
+    def _series_dir(self, symbol: str, bar_size: str) -> str:
+        """Directory holding one symbol/bar size series"""
+        return os.path.join(self.root, symbol.upper(), bar_size.replace(' ', '_'))
+
+    def _read_meta(self, symbol: str, bar_size: str) -> Optional[Dict]:
+        """Read series metadata, or None if the series does not exist"""
+        path = os.path.join(self._series_dir(symbol, bar_size), 'meta.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _write_meta(self, symbol: str, bar_size: str, meta: Dict):
+        """Atomically replace series metadata"""
+        path = os.path.join(self._series_dir(symbol, bar_size), 'meta.json')
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, path)
+
+    def _rewrite(self, symbol: str, bar_size: str, columns: Dict[str, np.ndarray]) -> bool:
+        """Write a complete series as a new generation"""
+        series_dir = self._series_dir(symbol, bar_size)
+        os.makedirs(series_dir, exist_ok=True)
+
+        meta = self._read_meta(symbol, bar_size) or {'generation': 0, 'rows': 0}
+        old_generation = meta['generation']
+        generation = old_generation + 1
+
+        for name in BAR_COLUMNS:
+            data = np.ascontiguousarray(columns[name], dtype=BAR_DTYPES[name])
+            with open(os.path.join(series_dir, f"{name}.{generation}.bin"), 'wb') as f:
+                f.write(data.tobytes())
+
+        self._write_meta(symbol, bar_size, {
+            'generation': generation,
+            'rows': len(columns['time']),
+            'bar_size': bar_size
+        })
+
+        # Old generation may still be memory-mapped by a reader; retry on next rewrite
+        for entry in os.listdir(series_dir):
+            if entry.endswith('.bin') and not entry.endswith(f".{generation}.bin"):
+                try:
+                    os.remove(os.path.join(series_dir, entry))
+                except OSError:
+                    pass
+        return True
+
+
+# Create singleton instance for global access
+bar_store = BarStore()
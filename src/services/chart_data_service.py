@@ -5,12 +5,19 @@ Migrated from src/core/chart_data_manager.py as part of architecture consolidati
 """
 
 import asyncio
-from typing import List, Dict, Optional, Any
-from datetime import datetime
-from ib_async import BarData, Stock
+import time
+from typing import List, Dict, Optional, Any, Set, Tuple
+from datetime import datetime, time as dt_time
+import numpy as np
+import pytz
+from ib_async import BarData
 
 from src.services.base_service import BaseService
+from src.services.bar_store import bar_store
 from src.services.ib_connection_service import ib_connection_manager
+from src.services.contract_registry import contract_registry
+from src.core.bar_frame import BarFrame, EASTERN, session_days
+from src.core.bar_resampler import resample_bars, count_sessions
 from src.utils.logger import logger
 
 
@@ -33,7 +40,7 @@ class ChartDataService(BaseService):
     
     # Duration mappings for different timeframes
     CHART_DURATIONS = {
-        '1 min': '1 D',    # 1 day of 1-min bars
+        '1 min': '5 D',    # 5 days of 1-min bars (base series for resampled timeframes)
         '3 mins': '1 D',   # 1 day of 3-min bars
         '5 mins': '2 D',   # 2 days of 5-min bars
         '15 mins': '5 D',  # 5 days of 15-min bars
@@ -42,18 +49,51 @@ class ChartDataService(BaseService):
         '1 day': '1 Y'     # 1 year of daily bars
     }
     
+    # Timeframes built locally from the stored 1-minute series (minutes per bar).
+    # Only timeframes whose duration fits within CHART_DURATIONS['1 min']; 1h
+    # and 4h charts span months and always come from IB.
+    RESAMPLED_TIMEFRAMES = {
+        '3m': 3,
+        '5m': 5,
+        '15m': 15
+    }
+    
+    # Trading sessions per IB duration unit, for 1-minute coverage checks
+    DURATION_SESSIONS = {'D': 1, 'W': 5, 'M': 21, 'Y': 252}
+    
+    # Calendar days per IB duration unit, for top-up gap limits
+    DURATION_DAYS = {'D': 1, 'W': 7, 'M': 31, 'Y': 365}
+    
+    # Bar lengths in seconds, used to size incremental top-up requests
+    BAR_SECONDS = {
+        '1 min': 60,
+        '3 mins': 180,
+        '5 mins': 300,
+        '15 mins': 900,
+        '1 hour': 3600,
+        '4 hours': 14400,
+        '1 day': 86400
+    }
+    
+    # Default minimum seconds between IB top-ups of the same series
+    TOP_UP_INTERVAL = 60
+    
     def __init__(self):
         """Initialize chart data service"""
         super().__init__("ChartDataService")
         self.ib_manager = ib_connection_manager
+        self.bar_store = bar_store
         self.current_symbol = None
         self.current_timeframe = '5m'
-        self.cached_data = {}  # Simple cache for recent data
+        self.top_up_interval = self.TOP_UP_INTERVAL
+        self._last_top_up: Dict[str, float] = {}  # series key -> monotonic time of last IB top-up
+        self._history_exhausted: Set[str] = set()  # series keys IB has no older bars for
         
     def initialize(self) -> bool:
         """Initialize the service"""
         try:
-            self.cached_data.clear()
+            self._last_top_up.clear()
+            self._history_exhausted.clear()
             logger.info("ChartDataService initialized successfully")
             return True
         except Exception as e:
@@ -62,12 +102,13 @@ class ChartDataService(BaseService):
             
     def cleanup(self):
         """Cleanup service resources"""
-        self.cached_data.clear()
+        self._last_top_up.clear()
+        self._history_exhausted.clear()
         logger.info("ChartDataService cleaned up")
         
-    def get_chart_data(self, symbol: str, timeframe: str = '5m', max_bars: int = 500) -> List[Dict[str, Any]]:
+    def get_chart_data(self, symbol: str, timeframe: str = '5m', max_bars: int = 500) -> BarFrame:
         """
-        Get chart data in lightweight-charts format
+        Get chart data as a BarFrame
         
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
@@ -75,51 +116,221 @@ class ChartDataService(BaseService):
             max_bars: Maximum number of bars for performance
             
         Returns:
-            List of dictionaries in lightweight-charts format
+            BarFrame with the most recent bars (empty if unavailable)
         """
         try:
             if timeframe not in self.CHART_TIMEFRAMES:
                 logger.error(f"Unsupported timeframe: {timeframe}")
-                return []
+                return BarFrame.empty()
                 
             bar_size = self.CHART_TIMEFRAMES[timeframe]
             duration = self.CHART_DURATIONS[bar_size]
             
             logger.info(f"Fetching chart data for {symbol} ({timeframe} / {bar_size} / {duration})")
             
-            # Check cache first
-            cache_key = f"{symbol}_{timeframe}"
-            if cache_key in self.cached_data:
-                cached_time, cached_bars = self.cached_data[cache_key]
-                # Use cache if less than 1 minute old
-                if (datetime.now() - cached_time).seconds < 60:
-                    logger.info(f"Using cached chart data for {symbol} {timeframe}")
-                    return cached_bars
-            
-            # Fetch historical bars using our proven sync method
-            bars = self._get_historical_bars_sync(symbol, duration, bar_size, max_bars)
+            columns = None
+            if timeframe in self.RESAMPLED_TIMEFRAMES:
+                columns = self._get_resampled_bars(symbol, timeframe, duration)
+            if columns is None:
+                columns = self._get_stored_bars(symbol, bar_size, duration)
             
-            if bars:
-                # Convert to lightweight-charts format
-                chart_data = self._convert_to_chart_format(bars)
-                
-                # Cache the result
-                self.cached_data[cache_key] = (datetime.now(), chart_data)
-                
+            if columns is not None:
+                # Detach the displayed tail from the memory-mapped store
+                chart_data = self._convert_to_chart_format(columns, max_bars)
                 logger.info(f"Successfully fetched {len(chart_data)} bars for {symbol} {timeframe}")
                 return chart_data
             else:
                 logger.warning(f"No chart data available for {symbol} {timeframe}")
-                return []
+                return BarFrame.empty()
                 
         except Exception as e:
             logger.error(f"Error getting chart data for {symbol} {timeframe}: {str(e)}")
-            return []
+            return BarFrame.empty()
+            
+    def get_history_page(self, symbol: str, timeframe: str, before: int, max_bars: int = 500) -> BarFrame:
+        """
+        Get the bars preceding a timestamp, for scroll-back paging
+        
+        Pages come from the local bar store. When the store runs out, the
+        preceding IB duration is fetched with endDateTime at the oldest stored
+        bar and prepended to the store first.
+        
+        Args:
+            symbol: Stock symbol
+            timeframe: Chart timeframe
+            before: Epoch seconds of the oldest bar already loaded
+            max_bars: Maximum number of bars in the page
             
-    def _get_historical_bars_sync(self, symbol: str, duration: str, bar_size: str, max_bars: int) -> Optional[List[BarData]]:
+        Returns:
+            BarFrame of up to max_bars bars older than `before` (empty when history is exhausted)
+        """
+        try:
+            if timeframe not in self.CHART_TIMEFRAMES:
+                logger.error(f"Unsupported timeframe: {timeframe}")
+                return BarFrame.empty()
+                
+            bar_size = self.CHART_TIMEFRAMES[timeframe]
+            minutes = self.RESAMPLED_TIMEFRAMES.get(timeframe)
+            if minutes:
+                # Charts built from the 1-minute series page through it as well
+                base = self.bar_store.load(symbol, '1 min')
+                if base is not None and int(base['time'][0]) <= before:
+                    bar_size = '1 min'
+                del base
+            resample = minutes if minutes and bar_size == '1 min' else None
+            count = max_bars * (resample or 1)
+            
+            page, reached_start = self._stored_page(symbol, bar_size, before, count)
+            if reached_start and self._extend_history(symbol, bar_size):
+                page, _ = self._stored_page(symbol, bar_size, before, count)
+            if resample:
+                page = resample_bars(page, resample)
+                
+            page = page.tail(max_bars).copy()
+            logger.info(f"History page for {symbol} {timeframe}: {len(page)} bars before {before}")
+            return page
+            
+        except Exception as e:
+            logger.error(f"Error getting history page for {symbol} {timeframe}: {str(e)}")
+            return BarFrame.empty()
+            
+    def _stored_page(self, symbol: str, bar_size: str, before: int, count: int) -> Tuple[BarFrame, bool]:
+        """
+        Get up to count stored bars older than `before`
+        
+        A page that does not reach the start of the store begins on a session
+        boundary, so resampled buckets are never cut in half.
+        
+        Returns:
+            (bars viewing the store, True if the page reached the oldest stored bar)
+        """
+        stored = self.bar_store.load(symbol, bar_size)
+        if stored is None:
+            return BarFrame.empty(), True
+            
+        bars = BarFrame.from_columns(stored)
+        stop = int(np.searchsorted(bars.time, before, side='left'))
+        start = max(0, stop - count)
+        if start > 0:
+            boundaries = np.flatnonzero(np.diff(session_days(bars.time[start:stop])))
+            if len(boundaries):
+                start += int(boundaries[0]) + 1
+        return bars.slice(start, stop), start == 0
+        
+    def _extend_history(self, symbol: str, bar_size: str) -> bool:
+        """
+        Fetch the IB duration ending at the oldest stored bar and prepend it to the store
+        
+        Returns:
+            True if older bars were stored
+        """
+        series_key = f"{symbol}_{bar_size}"
+        if series_key in self._history_exhausted or not self.ib_manager.is_connected():
+            return False
+            
+        stored = self.bar_store.load(symbol, bar_size)
+        if stored is None:
+            return False
+        oldest = int(stored['time'][0])
+        del stored
+        
+        end = datetime.fromtimestamp(oldest, tz=pytz.utc)
+        logger.info(f"Fetching older {bar_size} history for {symbol} ending {end.strftime('%Y-%m-%d %H:%M')} UTC")
+        bars = self._get_historical_bars_sync(symbol, self.CHART_DURATIONS[bar_size], bar_size, None, end_date_time=end)
+        if not bars or not self.bar_store.prepend(symbol, bar_size, self._bars_to_frame(bars).columns()):
+            logger.info(f"No older {bar_size} history available for {symbol}")
+            self._history_exhausted.add(series_key)
+            return False
+        return True
+        
+    def _get_stored_bars(self, symbol: str, bar_size: str, duration: str) -> Optional[BarFrame]:
+        """
+        Get bars from the local store, topping up the tail from IB when stale
+        
+        Only bars after the last stored timestamp are requested. An empty
+        store, or one whose gap exceeds the bar size's duration, is filled
+        with the full duration for the bar size (replacing the old series).
+        
+        Returns:
+            BarFrame viewing the stored columns, or None if no data is available
+        """
+        series_key = f"{symbol}_{bar_size}"
+        stored = self.bar_store.load(symbol, bar_size)
+        
+        last_top_up = self._last_top_up.get(series_key)
+        if stored is not None and last_top_up and time.monotonic() - last_top_up < self.top_up_interval:
+            logger.info(f"Using stored chart data for {symbol} {bar_size}")
+            return BarFrame.from_columns(stored)
+            
+        top_up = None
+        if stored is not None:
+            top_up = self._top_up_duration(bar_size, int(stored['time'][-1]))
+            if top_up is None:
+                logger.info(f"Stored {bar_size} data for {symbol} is older than {duration}, refetching")
+            
+        bars = self._get_historical_bars_sync(symbol, top_up or duration, bar_size, None)
+        if bars:
+            columns = self._bars_to_frame(bars).columns()
+            if top_up is not None:
+                written = self.bar_store.append(symbol, bar_size, columns)
+            else:
+                # A full download must not be merged across a gap it does not cover
+                written = self.bar_store.replace(symbol, bar_size, columns)
+                self._history_exhausted.discard(series_key)
+            if written:
+                self._last_top_up[series_key] = time.monotonic()
+                stored = self.bar_store.load(symbol, bar_size)
+        elif stored is not None:
+            logger.info(f"Serving stored chart data for {symbol} {bar_size} without top-up")
+            
+        return BarFrame.from_columns(stored) if stored is not None else None
+        
+    def _get_resampled_bars(self, symbol: str, timeframe: str, duration: str) -> Optional[BarFrame]:
+        """
+        Build a timeframe from the stored 1-minute series
+        
+        Returns:
+            Resampled BarFrame, or None if the 1-minute history
+            does not cover the timeframe's duration
+        """
+        base = self._get_stored_bars(symbol, '1 min', self.CHART_DURATIONS['1 min'])
+        if base is None:
+            return None
+            
+        count, unit = duration.split()
+        sessions_needed = int(count) * self.DURATION_SESSIONS.get(unit, 1)
+        sessions_stored = count_sessions(base.time)
+        if sessions_stored < sessions_needed:
+            logger.info(f"1-minute history for {symbol} covers {sessions_stored}/{sessions_needed} sessions, "
+                        f"fetching {timeframe} from IB")
+            return None
+            
+        return resample_bars(base, self.RESAMPLED_TIMEFRAMES[timeframe])
+        
+    def _top_up_duration(self, bar_size: str, last_timestamp: int) -> Optional[str]:
+        """
+        Build an IB duration string covering the bars after last_timestamp
+        
+        Returns:
+            Duration string, or None if the gap is longer than the bar size's
+            configured duration and the series should be refetched instead
+        """
+        gap = int(time.time()) - last_timestamp + self.BAR_SECONDS[bar_size]
+        count, unit = self.CHART_DURATIONS[bar_size].split()
+        if gap > int(count) * self.DURATION_DAYS[unit] * 86400:
+            return None
+        if bar_size != '1 day' and gap <= 86400:
+            return f"{max(gap, 60)} S"
+        return f"{gap // 86400 + 1} D"
+            
+    def _get_historical_bars_sync(self, symbol: str, duration: str, bar_size: str, max_bars: Optional[int],
+                                  end_date_time: Any = '') -> Optional[List[BarData]]:
         """
         Get historical bars using synchronous method (optimized for Qt)
         Reuses the proven sync approach from data_fetcher
+        
+        Args:
+            end_date_time: End of the requested duration ('' for now, or a timezone-aware datetime)
         """
         try:
             if not self.ib_manager.is_connected():
@@ -131,19 +342,16 @@ class ChartDataService(BaseService):
                 logger.error("IB client not available for chart data")
                 return None
                 
-            # Create contract (same as data_fetcher approach)
-            contract = Stock(symbol, 'SMART', 'USD')
-            
-            try:
-                ib.qualifyContracts(contract)
-            except Exception as e:
-                logger.error(f"Error qualifying contract for {symbol}: {str(e)}")
+            # Qualified contract from the shared registry
+            contract = contract_registry.get_contract(symbol)
+            if not contract:
+                logger.error(f"Error qualifying contract for {symbol}")
                 return None
             
             # Request historical data
             bars = ib.reqHistoricalData(
                 contract,
-                endDateTime='',  # Up to now
+                endDateTime=end_date_time,
                 durationStr=duration,
                 barSizeSetting=bar_size,
                 whatToShow='TRADES',
@@ -154,7 +362,7 @@ class ChartDataService(BaseService):
             
             if bars:
                 # Limit to requested number of bars for performance
-                limited_bars = bars[-max_bars:] if len(bars) > max_bars else bars
+                limited_bars = bars[-max_bars:] if max_bars and len(bars) > max_bars else bars
                 logger.info(f"Retrieved {len(limited_bars)} chart bars for {symbol}")
                 return limited_bars
             else:
@@ -165,46 +373,63 @@ class ChartDataService(BaseService):
             logger.error(f"Error fetching chart bars for {symbol}: {str(e)}")
             return None
             
-    def _convert_to_chart_format(self, bars: List[BarData]) -> List[Dict[str, Any]]:
+    def _bars_to_frame(self, bars: List[BarData]) -> BarFrame:
         """
-        Convert IB BarData to lightweight-charts format
+        Convert IB BarData to a BarFrame
         
         Args:
             bars: List of IB BarData objects
             
         Returns:
-            List of dictionaries with time, open, high, low, close, volume
+            BarFrame with epoch-second times and OHLCV columns
         """
-        chart_data = []
-        
-        for bar in bars:
-            try:
-                # Convert to lightweight-charts format
-                chart_bar = {
-                    'time': int(bar.date.timestamp()),  # Unix timestamp
-                    'open': float(bar.open),
-                    'high': float(bar.high),
-                    'low': float(bar.low),
-                    'close': float(bar.close),
-                    'volume': int(bar.volume) if bar.volume else 0
-                }
-                chart_data.append(chart_bar)
-                
-            except Exception as e:
-                logger.warning(f"Error converting bar data: {str(e)}")
-                continue
-                
-        return chart_data
+        count = len(bars)
+        return BarFrame(
+            np.fromiter((self._bar_timestamp(bar.date) for bar in bars), dtype=np.int64, count=count),
+            np.fromiter((bar.open for bar in bars), dtype=np.float64, count=count),
+            np.fromiter((bar.high for bar in bars), dtype=np.float64, count=count),
+            np.fromiter((bar.low for bar in bars), dtype=np.float64, count=count),
+            np.fromiter((bar.close for bar in bars), dtype=np.float64, count=count),
+            np.fromiter((bar.volume or 0 for bar in bars), dtype=np.float64, count=count)
+        )
+        
+    def _bar_timestamp(self, bar_date) -> int:
+        """Unix timestamp for an IB bar date (daily bars carry a date at US/Eastern midnight)"""
+        if isinstance(bar_date, datetime):
+            return int(bar_date.timestamp())
+        return int(EASTERN.localize(datetime.combine(bar_date, dt_time())).timestamp())
+            
+    def _convert_to_chart_format(self, bars: BarFrame, max_bars: int) -> BarFrame:
+        """
+        Trim bars for display
+        
+        Args:
+            bars: BarFrame (possibly viewing memory-mapped storage)
+            max_bars: Number of most recent bars to keep
+            
+        Returns:
+            BarFrame with the last max_bars bars in private memory
+        """
+        return bars.tail(max_bars).copy()
         
     def get_available_timeframes(self) -> List[str]:
         """Get list of available timeframes"""
         return list(self.CHART_TIMEFRAMES.keys())
         
     def clear_cache(self):
-        """Clear cached chart data"""
-        self.cached_data.clear()
+        """Force the next request for each series to top up from IB"""
+        self._last_top_up.clear()
         logger.info("Chart data cache cleared")
         
+    def set_top_up_interval(self, seconds: Optional[float] = None):
+        """
+        Set the minimum time between IB top-ups of a series
+        
+        Args:
+            seconds: Interval (e.g. matching the chart's auto-refresh), or None for TOP_UP_INTERVAL
+        """
+        self.top_up_interval = self.TOP_UP_INTERVAL if seconds is None else seconds
+        
     def set_current_symbol(self, symbol: str):
         """Set current symbol for tracking"""
         if symbol != self.current_symbol:
@@ -237,9 +462,9 @@ class ChartDataManager:
         self.ib_manager = self._service.ib_manager
         self.current_symbol = self._service.current_symbol
         self.current_timeframe = self._service.current_timeframe
-        self.cached_data = self._service.cached_data
+        self.bar_store = self._service.bar_store
         
-    def get_chart_data(self, symbol: str, timeframe: str = '5m', max_bars: int = 500) -> List[Dict[str, Any]]:
+    def get_chart_data(self, symbol: str, timeframe: str = '5m', max_bars: int = 500) -> BarFrame:
         """Delegate to service"""
         return self._service.get_chart_data(symbol, timeframe, max_bars)
         
@@ -247,10 +472,18 @@ class ChartDataManager:
         """Delegate to service"""
         return self._service.get_available_timeframes()
         
+    def get_history_page(self, symbol: str, timeframe: str, before: int, max_bars: int = 500) -> BarFrame:
+        """Delegate to service"""
+        return self._service.get_history_page(symbol, timeframe, before, max_bars)
+        
     def clear_cache(self):
         """Delegate to service"""
         self._service.clear_cache()
         
+    def set_top_up_interval(self, seconds: Optional[float] = None):
+        """Delegate to service"""
+        self._service.set_top_up_interval(seconds)
+        
     def set_current_symbol(self, symbol: str):
         """Delegate to service"""
         self._service.set_current_symbol(symbol)
@@ -262,13 +495,14 @@ class ChartDataManager:
         self.current_timeframe = self._service.current_timeframe
         
     # Private method delegation
-    def _get_historical_bars_sync(self, symbol: str, duration: str, bar_size: str, max_bars: int) -> Optional[List[BarData]]:
+    def _get_historical_bars_sync(self, symbol: str, duration: str, bar_size: str, max_bars: Optional[int],
+                                  end_date_time: Any = '') -> Optional[List[BarData]]:
         """Delegate to service"""
-        return self._service._get_historical_bars_sync(symbol, duration, bar_size, max_bars)
+        return self._service._get_historical_bars_sync(symbol, duration, bar_size, max_bars, end_date_time)
         
-    def _convert_to_chart_format(self, bars: List[BarData]) -> List[Dict[str, Any]]:
+    def _convert_to_chart_format(self, bars: BarFrame, max_bars: int) -> BarFrame:
         """Delegate to service"""
-        return self._service._convert_to_chart_format(bars)
+        return self._service._convert_to_chart_format(bars, max_bars)
 
 
 # Create singleton instance for backward compatibility
@@ -0,0 +1,375 @@
+"""
+Contract Registry
+Shared, persistent registry of qualified IB contracts with tick size rules
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+from ib_async import Contract, Stock, util
+
+from src.services.base_service import BaseService
+from src.services.ib_connection_service import ib_connection_manager
+from src.utils.logger import logger
+from config import CACHE_DIR, CONTRACT_REGISTRY_CONFIG
+
+
+# Contract attributes persisted to disk
+CONTRACT_FIELDS = (
+    'conId', 'symbol', 'secType', 'exchange', 'primaryExchange',
+    'currency', 'localSymbol', 'tradingClass'
+)
+
+
+@dataclass
+class ContractInfo:
+    """Qualified contract with its tick size information"""
+    contract: Contract
+    min_tick: float = 0.0
+    market_rule_ids: List[int] = field(default_factory=list)
+    qualified_at: float = 0.0  # Unix timestamp
+
+
+class ContractRegistry(BaseService):
+    """
+    Registry of qualified contracts shared by all services
+    Keyed by symbol and conId, qualifies in batches, deduplicates
+    in-flight requests and persists results under CACHE_DIR
+    """
+
+    def __init__(self):
+        super().__init__("ContractRegistry")
+        self.ib_manager = ib_connection_manager
+        self.cache_path = os.path.join(CACHE_DIR, CONTRACT_REGISTRY_CONFIG['cache_file'])
+        self.max_age_seconds = CONTRACT_REGISTRY_CONFIG['max_age_days'] * 86400
+
+        self._by_symbol: Dict[str, ContractInfo] = {}
+        self._by_con_id: Dict[int, ContractInfo] = {}
+        self._market_rules: Dict[int, List[Tuple[float, float]]] = {}  # ruleId -> [(lowEdge, increment)]
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.RLock()
+
+    def initialize(self) -> bool:
+        """Initialize the registry and load persisted contracts"""
+        try:
+            if not super().initialize():
+                return False
+            self._load_from_disk()
+            self._initialized = True
+            logger.info(f"ContractRegistry initialized with {len(self._by_symbol)} cached contracts")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize ContractRegistry: {str(e)}")
+            return False
+
+    def cleanup(self):
+        """Persist the registry and release resources"""
+        try:
+            self._save_to_disk()
+            self._inflight.clear()
+            logger.info("ContractRegistry cleaned up")
+        except Exception as e:
+            logger.error(f"Error cleaning up ContractRegistry: {str(e)}")
+
+    # ============================================================================
+    # LOOKUPS
+    # ============================================================================
+
+    def get_cached(self, symbol: str) -> Optional[Contract]:
+        """
+        Get a qualified contract without touching the network
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Qualified contract or None if not registered
+        """
+        with self._lock:
+            info = self._by_symbol.get(symbol.upper())
+        return info.contract if info else None
+
+    def get_by_con_id(self, con_id: int) -> Optional[Contract]:
+        """Get a registered contract by its IB conId"""
+        with self._lock:
+            info = self._by_con_id.get(con_id)
+        return info.contract if info else None
+
+    def get_contract(self, symbol: str) -> Optional[Contract]:
+        """
+        Get a qualified contract, qualifying it with IB on a cache miss
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Qualified contract or None on failure
+        """
+        contract = self.get_cached(symbol)
+        if contract:
+            return contract
+        try:
+            return util.run(self.qualify_async(symbol))
+        except Exception as e:
+            logger.error(f"Error qualifying contract for {symbol}: {str(e)}")
+            return None
+
+    def qualify_symbols(self, symbols: Iterable[str]) -> Dict[str, Contract]:
+        """
+        Qualify several symbols in one batch (synchronous)
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict of symbol -> qualified contract for every symbol that qualified
+        """
+        try:
+            return util.run(self.qualify_many_async(symbols))
+        except Exception as e:
+            logger.error(f"Error qualifying contracts: {str(e)}")
+            return {}
+
+    async def qualify_async(self, symbol: str) -> Optional[Contract]:
+        """Qualify a single symbol, reusing cached or in-flight results"""
+        results = await self.qualify_many_async([symbol])
+        return results.get(symbol.upper())
+
+    async def qualify_many_async(self, symbols: Iterable[str]) -> Dict[str, Contract]:
+        """
+        Qualify symbols concurrently, requesting only unknown ones
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict of symbol -> qualified contract
+        """
+        results: Dict[str, Contract] = {}
+        pending: Dict[str, asyncio.Future] = {}
+        to_request: List[str] = []
+        loop = asyncio.get_event_loop()
+
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            contract = self.get_cached(symbol)
+            if contract:
+                results[symbol] = contract
+            elif symbol in self._inflight:
+                pending[symbol] = self._inflight[symbol]
+            else:
+                future = loop.create_future()
+                self._inflight[symbol] = future
+                pending[symbol] = future
+                to_request.append(symbol)
+
+        if to_request:
+            await self._request_contracts(to_request)
+
+        for symbol, future in pending.items():
+            try:
+                contract = await future
+            except Exception:
+                contract = None
+            if contract:
+                results[symbol] = contract
+
+        return results
+
+    # ============================================================================
+    # TICK SIZE RULES
+    # ============================================================================
+
+    def get_min_tick(self, symbol: str, price: Optional[float] = None) -> Optional[float]:
+        """
+        Get the price increment for a symbol from cached contract details
+
+        Args:
+            symbol: Stock symbol
+            price: Price level for market-rule lookup (uses minTick if omitted)
+
+        Returns:
+            Price increment or None if the symbol is not registered
+        """
+        with self._lock:
+            info = self._by_symbol.get(symbol.upper()) if symbol else None
+            if not info:
+                return None
+            if price is not None:
+                for rule_id in info.market_rule_ids:
+                    increments = self._market_rules.get(rule_id)
+                    if increments:
+                        increment = increments[0][1]
+                        for low_edge, rule_increment in increments:
+                            if price >= low_edge:
+                                increment = rule_increment
+                        return increment
+            return info.min_tick or None
+
+    def round_to_tick(self, symbol: str, price: float) -> Optional[float]:
+        """
+        Round a price to the instrument's valid increment
+
+        Args:
+            symbol: Stock symbol
+            price: Raw price
+
+        Returns:
+            Rounded price or None if no tick rule is known
+        """
+        increment = self.get_min_tick(symbol, price)
+        if not increment:
+            return None
+        decimals = max(0, len(f"{increment:.10f}".rstrip('0').split('.')[1]))
+        return round(round(price / increment) * increment, decimals)
+
+    def clear(self):
+        """Forget all registered contracts"""
+        with self._lock:
+            self._by_symbol.clear()
+            self._by_con_id.clear()
+            self._market_rules.clear()
+        self._save_to_disk()
+        logger.info("Contract registry cleared")
+
+    # ============================================================================
+    # IB REQUESTS
+    # ============================================================================
+
+    async def _request_contracts(self, symbols: List[str]):
+        """Request contract details and market rules for new symbols"""
+        try:
+            ib = self.ib_manager.ib
+            if not ib or not self.ib_manager.is_connected():
+                logger.error("Not connected to IB for contract qualification")
+                return
+
+            details_list = await asyncio.gather(
+                *(ib.reqContractDetailsAsync(Stock(symbol, 'SMART', 'USD')) for symbol in symbols),
+                return_exceptions=True
+            )
+
+            new_infos: List[ContractInfo] = []
+            for symbol, details in zip(symbols, details_list):
+                if isinstance(details, Exception) or not details:
+                    logger.warning(f"No contract details returned for {symbol}")
+                    continue
+                detail = next((d for d in details if d.contract.symbol == symbol), details[0])
+                if len(details) > 1:
+                    logger.debug(f"Ambiguous contract for {symbol}, using conId {detail.contract.conId}")
+                rule_ids = []
+                for rule_id in (detail.marketRuleIds or '').split(','):
+                    if rule_id.strip().isdigit() and int(rule_id) not in rule_ids:
+                        rule_ids.append(int(rule_id))
+                new_infos.append(ContractInfo(
+                    contract=detail.contract,
+                    min_tick=float(detail.minTick or 0.0),
+                    market_rule_ids=rule_ids,
+                    qualified_at=time.time()
+                ))
+
+            await self._request_market_rules(ib, new_infos)
+
+            with self._lock:
+                for info in new_infos:
+                    self._register(info)
+
+            if new_infos:
+                logger.info(f"Qualified {len(new_infos)}/{len(symbols)} contracts")
+                self._save_to_disk()
+
+        except Exception as e:
+            logger.error(f"Error requesting contract details: {str(e)}")
+        finally:
+            for symbol in symbols:
+                future = self._inflight.pop(symbol, None)
+                if future and not future.done():
+                    future.set_result(self.get_cached(symbol))
+
+    async def _request_market_rules(self, ib, infos: List[ContractInfo]):
+        """Fetch market rules not yet known for the given contracts"""
+        rule_ids = {rule_id for info in infos for rule_id in info.market_rule_ids}
+        with self._lock:
+            missing = [rule_id for rule_id in rule_ids if rule_id not in self._market_rules]
+        if not missing:
+            return
+
+        rules = await asyncio.gather(
+            *(ib.reqMarketRuleAsync(rule_id) for rule_id in missing),
+            return_exceptions=True
+        )
+        with self._lock:
+            for rule_id, increments in zip(missing, rules):
+                if isinstance(increments, Exception) or not increments:
+                    continue
+                self._market_rules[rule_id] = sorted(
+                    (float(inc.lowEdge), float(inc.increment)) for inc in increments
+                )
+
+    def _register(self, info: ContractInfo):
+        """Index a contract by symbol and conId (caller holds the lock)"""
+        self._by_symbol[info.contract.symbol.upper()] = info
+        if info.contract.conId:
+            self._by_con_id[info.contract.conId] = info
+
+    # ============================================================================
+    # PERSISTENCE
+    # ============================================================================
+
+    def _load_from_disk(self):
+        """Load persisted contracts, skipping expired entries"""
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                stored = json.load(f)
+
+            now = time.time()
+            with self._lock:
+                for rule_id, increments in stored.get('market_rules', {}).items():
+                    self._market_rules[int(rule_id)] = [tuple(inc) for inc in increments]
+                for entry in stored.get('contracts', {}).values():
+                    if now - entry.get('qualified_at', 0) > self.max_age_seconds:
+                        continue
+                    self._register(ContractInfo(
+                        contract=Contract(**entry['contract']),
+                        min_tick=entry.get('min_tick', 0.0),
+                        market_rule_ids=entry.get('market_rule_ids', []),
+                        qualified_at=entry['qualified_at']
+                    ))
+        except Exception as e:
+            logger.warning(f"Could not load contract cache {self.cache_path}: {str(e)}")
+
+    def _save_to_disk(self):
+        """Persist the registry atomically"""
+        try:
+            with self._lock:
+                stored: Dict[str, Any] = {
+                    'contracts': {
+                        symbol: {
+                            'contract': {name: getattr(info.contract, name) for name in CONTRACT_FIELDS},
+                            'min_tick': info.min_tick,
+                            'market_rule_ids': info.market_rule_ids,
+                            'qualified_at': info.qualified_at
+                        }
+                        for symbol, info in self._by_symbol.items()
+                    },
+                    'market_rules': {
+                        str(rule_id): increments for rule_id, increments in self._market_rules.items()
+                    }
+                }
+            temp_path = self.cache_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(stored, f)
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save contract cache {self.cache_path}: {str(e)}")
+
+
+# Create singleton instance for global access
+contract_registry = ContractRegistry()
+contract_registry.initialize()
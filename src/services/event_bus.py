@@ -3,14 +3,28 @@ Event Bus
 Provides publish-subscribe pattern for decoupled communication between services
 """
 
-from typing import Dict, List, Callable, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Callable, Any, Optional, Tuple, Union, Hashable, Iterator
+from array import array
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+import asyncio
+import json
+import logging
+import sys
 import threading
-import queue
+import time
+import traceback
 
 from src.utils.logger import logger
+from config import EVENT_BUS_CONFIG
+
+try:
+    from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
 
 
 class EventType(Enum):
@@ -28,6 +42,7 @@ class EventType(Enum):
     PRICE_UPDATE = "price_update"
     MARKET_DATA_ERROR = "market_data_error"
     STOP_LEVELS_UPDATE = "stop_levels_update"
+    BAR_CLOSED = "bar_closed"
     
     # Order events
     ORDER_SUBMITTED = "order_submitted"
@@ -47,33 +62,506 @@ class EventType(Enum):
     APPLICATION_SHUTDOWN = "application_shutdown"
 
 
-@dataclass
+class EventLane(IntEnum):
+    """Dispatch lanes, drained in priority order (lower value first)"""
+    CRITICAL = 0     # Orders and connection state
+    NORMAL = 1       # Account, UI and system events
+    MARKET_DATA = 2  # High-volume price updates
+
+
+# Lane per event type; unlisted types use NORMAL
+EVENT_LANES = {
+    EventType.CONNECTION_STATUS_CHANGED: EventLane.CRITICAL,
+    EventType.CONNECTION_ERROR: EventLane.CRITICAL,
+    EventType.ORDER_SUBMITTED: EventLane.CRITICAL,
+    EventType.ORDER_FILLED: EventLane.CRITICAL,
+    EventType.ORDER_CANCELLED: EventLane.CRITICAL,
+    EventType.ORDER_ERROR: EventLane.CRITICAL,
+    EventType.ORDER_STATUS_UPDATE: EventLane.CRITICAL,
+    EventType.PRICE_UPDATE: EventLane.MARKET_DATA,
+    EventType.MARKET_DATA_ERROR: EventLane.MARKET_DATA,
+    EventType.STOP_LEVELS_UPDATE: EventLane.MARKET_DATA,
+    EventType.BAR_CLOSED: EventLane.MARKET_DATA,
+}
+
+
+# Coalescing key: a data field name or a function of the event
+CoalesceKey = Union[str, Callable[['Event'], Hashable]]
+
+
+def _callback_name(callback: Callable) -> str:
+    return getattr(callback, '__qualname__', None) or str(callback)
+
+
+# ============================================================================
+# TYPED PAYLOADS
+# ============================================================================
+
+class EventPayload(Mapping):
+    """
+    Base class for slotted, typed event payloads
+    
+    Payloads are read-only Mappings over their fields, so subscribers written
+    for dict payloads (event.data['symbol'], event.data.get(...)) keep working.
+    """
+    
+    __slots__ = ()
+    event_type: EventType = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+        
+    def __len__(self) -> int:
+        return len(self.__slots__)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the fields into a plain dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+        
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class PriceUpdate(EventPayload):
+    """Price fetch result for a symbol, with the derived entry, stop and target"""
+    
+    __slots__ = ('symbol', 'current_price', 'entry_price', 'stop_loss', 'take_profit',
+                 'price_data', 'stop_levels', 'direction', 'timestamp')
+    event_type = EventType.PRICE_UPDATE
+    
+    def __init__(self, symbol: str, current_price: float, entry_price: float = 0.0,
+                 stop_loss: float = 0.0, take_profit: float = 0.0,
+                 price_data: Optional[Dict[str, Any]] = None,
+                 stop_levels: Optional[Dict[str, Any]] = None, direction: str = 'BUY',
+                 timestamp: Optional[datetime] = None):
+        self.symbol = symbol
+        self.current_price = current_price
+        self.entry_price = entry_price
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.price_data = price_data if price_data is not None else {}  # last/bid/ask/close quote
+        self.stop_levels = stop_levels if stop_levels is not None else {}
+        self.direction = direction
+        self.timestamp = timestamp
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PriceUpdate':
+        """Build from a price fetch result dict (unknown keys are ignored)"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+class BarClosed(EventPayload):
+    """A live candle completed for a symbol and timeframe"""
+    
+    __slots__ = ('symbol', 'timeframe', 'time', 'open', 'high', 'low', 'close', 'volume')
+    event_type = EventType.BAR_CLOSED
+    
+    def __init__(self, symbol: str, timeframe: str, time: int, open: float, high: float,
+                 low: float, close: float, volume: float):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.time = time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
 class Event:
-    """Event data structure"""
-    type: EventType
-    data: Dict[str, Any]
-    source: str  # Source service/component name
-    timestamp: datetime = None
+    """
+    Event data structure
+    
+    created_ns is time.monotonic_ns() at construction and dispatched_ns is set
+    when the worker hands the event to subscribers, so in-process latency is
+    exact. wall_time (epoch seconds) is optional and only used for display.
+    """
+    
+    __slots__ = ('type', 'data', 'source', 'created_ns', 'dispatched_ns', 'wall_time')
+    
+    def __init__(self, type: EventType, data: Union[Dict[str, Any], EventPayload], source: str,
+                 timestamp: Optional[datetime] = None, wall_time: bool = True):
+        self.type = type
+        self.data = data
+        self.source = source  # Source service/component name
+        self.created_ns = time.monotonic_ns()
+        self.dispatched_ns = 0
+        if timestamp is not None:
+            self.wall_time = timestamp.timestamp()
+        else:
+            self.wall_time = time.time() if wall_time else None
+            
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """Wall-clock creation time (built on demand)"""
+        return datetime.fromtimestamp(self.wall_time) if self.wall_time is not None else None
+        
+    @property
+    def queue_wait_ns(self) -> int:
+        """Time between publish and dispatch (0 until dispatched)"""
+        return self.dispatched_ns - self.created_ns if self.dispatched_ns else 0
+        
+    def as_dict(self) -> Dict[str, Any]:
+        """Payload as a dict, for dict-based consumers (dict payloads are returned as-is)"""
+        data = self.data
+        return data.to_dict() if isinstance(data, EventPayload) else data
+        
+    def __repr__(self) -> str:
+        return f"Event({self.type.value}, source={self.source!r}, data={self.data!r})"
+
+
+# ============================================================================
+# SUBSCRIPTIONS
+# ============================================================================
+
+class DeliveryMode(Enum):
+    """Where a subscriber's callback runs"""
+    INLINE = "inline"  # On the bus worker thread
+    QT = "qt"          # Queued to the Qt main thread
+
+
+class _QtCall:
+    """One queued Qt-thread delivery; coalesced calls get their event replaced while queued"""
+    
+    __slots__ = ('callback', 'event', 'key')
+    
+    def __init__(self, callback: Callable[[Event], None], event: Event, key: Optional[Hashable]):
+        self.callback = callback
+        self.event = event
+        self.key = key
+
+
+if QT_AVAILABLE:
+    class _QtDispatcher(QObject):
+        """
+        Receives queued deliveries on the Qt main thread
+        
+        Events of coalesced types keep at most one queued call per
+        (subscriber, coalescing key): a newer event replaces the event of the
+        call still waiting in the Qt event queue, so a slow GUI subscriber
+        sees the latest value instead of a backlog.
+        """
+        
+        deliver = pyqtSignal(object)  # _QtCall
+        
+        def __init__(self):
+            super().__init__()
+            self._pending: Dict[Hashable, _QtCall] = {}
+            self._lock = threading.Lock()
+            self.replaced: Dict[EventType, int] = {}
+            # Emitted from the bus worker, so the connection is queued to our thread
+            self.deliver.connect(self._call)
+            
+        def post(self, callback: Callable[[Event], None], event: Event, coalesce_value: Optional[Hashable]):
+            """Queue a call to the main thread (bus worker thread)"""
+            if coalesce_value is None:
+                self.deliver.emit(_QtCall(callback, event, None))
+                return
+            key = (callback, event.type, coalesce_value)
+            with self._lock:
+                call = self._pending.get(key)
+                if call is not None:
+                    call.event = event
+                    self.replaced[event.type] = self.replaced.get(event.type, 0) + 1
+                    return
+                call = self._pending[key] = _QtCall(callback, event, key)
+            self.deliver.emit(call)
+            
+        def pending_count(self) -> int:
+            return len(self._pending)
+            
+        def _call(self, call: _QtCall):
+            if call.key is not None:
+                # Unregister first so later events queue a new call
+                with self._lock:
+                    self._pending.pop(call.key, None)
+                    event = call.event
+            else:
+                event = call.event
+            try:
+                call.callback(event)
+            except Exception as e:
+                logger.error(f"Error in event subscriber {_callback_name(call.callback)}: {str(e)}")
+
+
+class _Subscription:
+    """A subscriber callback and how to deliver to it"""
+    
+    __slots__ = ('callback', 'mode', 'qt_dispatcher')
+    
+    def __init__(self, callback: Callable, mode: DeliveryMode, qt_dispatcher=None):
+        self.callback = callback
+        self.mode = mode
+        self.qt_dispatcher = qt_dispatcher
+        
+    def deliver(self, event: Event, coalesce_value: Optional[Hashable] = None):
+        """Run or hand off the callback (bus worker thread)"""
+        if self.mode is DeliveryMode.INLINE:
+            self.callback(event)
+        else:
+            self.qt_dispatcher.post(self.callback, event, coalesce_value)
+
+
+class _PendingSlot:
+    """Queue entry for a coalesced event; newer events with the same key replace its event"""
+    
+    __slots__ = ('key', 'event')
+    
+    def __init__(self, key: Tuple[EventType, Hashable], event: Event):
+        self.key = key
+        self.event = event
+
+
+class EventHistory:
+    """
+    Fixed-size ring of recently dispatched events
+    
+    Slots are preallocated, so appending is O(1) and never trims or copies.
+    Each event type also has a ring of global sequence numbers, so filtered
+    reads touch only the k events returned instead of scanning everything.
+    """
+    
+    def __init__(self, size: int, per_type_size: int):
+        self.size = max(1, size)
+        self.per_type_size = max(1, per_type_size)
+        self._events: List[Optional[Event]] = [None] * self.size
+        self._count = 0  # Total events appended (next sequence number)
+        self._by_type: Dict[EventType, array] = {}
+        self._type_counts: Dict[EventType, int] = {}
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return min(self._count, self.size)
+        
+    def append_batch(self, events: List[Event]):
+        """Append dispatched events (O(1) each)"""
+        with self._lock:
+            for event in events:
+                seq = self._count
+                self._events[seq % self.size] = event
+                self._count = seq + 1
+                
+                index = self._by_type.get(event.type)
+                if index is None:
+                    index = self._by_type[event.type] = array('q', bytes(8 * self.per_type_size))
+                type_count = self._type_counts.get(event.type, 0)
+                index[type_count % self.per_type_size] = seq
+                self._type_counts[event.type] = type_count + 1
+                
+    def latest(self, event_type: Optional[EventType] = None, limit: int = 100) -> List[Event]:
+        """
+        Get the most recent events, oldest first
+        
+        Args:
+            event_type: Filter by event type (None for all events)
+            limit: Maximum number of events to return
+            
+        Returns:
+            List of events
+        """
+        with self._lock:
+            oldest = max(0, self._count - self.size)
+            if event_type is None:
+                first = max(oldest, self._count - limit)
+                return [self._events[seq % self.size] for seq in range(first, self._count)]
+                
+            index = self._by_type.get(event_type)
+            type_count = self._type_counts.get(event_type, 0)
+            events = []
+            for n in range(type_count - 1, max(-1, type_count - 1 - min(limit, self.per_type_size)), -1):
+                seq = index[n % self.per_type_size]
+                if seq < oldest:
+                    break  # Overwritten in the main ring
+                events.append(self._events[seq % self.size])
+            events.reverse()
+            return events
+            
+    def clear(self):
+        """Drop all events (slots stay allocated)"""
+        with self._lock:
+            self._events = [None] * self.size
+            self._count = 0
+            self._by_type.clear()
+            self._type_counts.clear()
+            
+    def export_jsonl(self, path: str, event_type: Optional[EventType] = None) -> int:
+        """
+        Write history to a JSON Lines file for post-mortem analysis
+        
+        Args:
+            path: Output file path
+            event_type: Filter by event type (None for all events)
+            
+        Returns:
+            Number of events written
+        """
+        events = self.latest(event_type, limit=self.size)
+        with open(path, 'w') as f:
+            for event in events:
+                record = {
+                    'type': event.type.value,
+                    'source': event.source,
+                    'timestamp': event.wall_time,
+                    'created_ns': event.created_ns,
+                    'queue_wait_ns': event.queue_wait_ns,
+                    'data': event.as_dict(),
+                }
+                f.write(json.dumps(record, default=str))
+                f.write('\n')
+        return len(events)
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+class LatencyHistogram:
+    """
+    Fixed log2 buckets of durations (bucket i holds durations below 2**i microseconds)
+    
+    Recording is a couple of integer operations and never allocates, so it
+    is cheap enough to run for every event and subscriber call.
+    """
+    
+    BUCKETS = 26  # Up to ~33s; longer durations land in the last bucket
+    
+    __slots__ = ('counts', 'count', 'total_ns', 'max_ns')
+    
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        
+    def record(self, duration_ns: int):
+        self.counts[min(self.BUCKETS - 1, (duration_ns // 1000).bit_length())] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+            
+    def percentile_ms(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket containing the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min((1 << index) / 1000, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+        
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'p50_ms': self.percentile_ms(0.5),
+            'p99_ms': self.percentile_ms(0.99),
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+class EventBusMetrics:
+    """
+    Queue depth, queue wait and subscriber timing for an EventBus
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    Recorded by the worker thread without locking; snapshots taken from other
+    threads may be off by the events dispatched while they are built.
+    """
+    
+    def __init__(self):
+        self.dispatched = 0
+        self.slow_calls = 0
+        self.peak_depth = [0] * len(EventLane)
+        self.queue_wait: Dict[EventType, LatencyHistogram] = {}
+        self.lane_wait = [LatencyHistogram() for _ in EventLane]
+        self.subscriber_time: Dict[Tuple[EventType, str], LatencyHistogram] = {}
+        self.slow_by_subscriber: Dict[str, int] = {}
+        
+    def record_wait(self, event_type: EventType, wait_ns: int):
+        histogram = self.queue_wait.get(event_type)
+        if histogram is None:
+            histogram = self.queue_wait[event_type] = LatencyHistogram()
+        histogram.record(wait_ns)
+        self.lane_wait[EVENT_LANES.get(event_type, EventLane.NORMAL)].record(wait_ns)
+        self.dispatched += 1
+        
+    def record_call(self, event_type: EventType, name: str, duration_ns: int):
+        key = (event_type, name)
+        histogram = self.subscriber_time.get(key)
+        if histogram is None:
+            histogram = self.subscriber_time[key] = LatencyHistogram()
+        histogram.record(duration_ns)
+        
+    def record_slow(self, name: str):
+        self.slow_calls += 1
+        self.slow_by_subscriber[name] = self.slow_by_subscriber.get(name, 0) + 1
+        
+    def reset(self):
+        self.__init__()
 
 
 class EventBus:
     """
     Central event bus for publish-subscribe communication
-    Thread-safe implementation
+    
+    Thread-safe implementation. Events are queued per priority lane and a
+    single worker drains them in batches, always taking the highest-priority
+    pending event next, so order and connection events never wait behind a
+    burst of market data. Subscriber lists are immutable tuples replaced on
+    (un)subscribe, so dispatch reads them without locking.
+    
+    Event types with a coalescing key are latest-wins: publishing while an
+    event with the same key is still queued replaces that event in place, so
+    a slow subscriber sees the newest value instead of a growing backlog.
+    
+    Each subscription has a delivery mode: INLINE runs on the worker and QT
+    queues the call to the Qt main thread, so widget handlers neither block
+    the worker nor touch widgets from it.
+    
+    Built-in metrics track queue depth, queue wait and per-subscriber time by
+    event type. A watchdog samples the worker's stack when a subscriber call
+    runs longer than slow_subscriber_ms, naming the callback that stalls it.
     """
     
     def __init__(self):
-        self._subscribers: Dict[EventType, List[Callable]] = {}
+        self._subscribers: Dict[EventType, Tuple[_Subscription, ...]] = {}
+        self._qt_dispatcher = None
         self._lock = threading.RLock()
-        self._event_queue = queue.Queue()
+        self._lanes = tuple(deque() for _ in EventLane)
+        self._wakeup = threading.Event()
+        self._batch_size = EVENT_BUS_CONFIG['batch_size']
         self._running = False
         self._worker_thread = None
-        self._event_history: List[Event] = []
-        self._max_history_size = 1000
+        self._history = EventHistory(
+            EVENT_BUS_CONFIG['max_history_size'], EVENT_BUS_CONFIG['history_per_type_size']
+        )
+        
+        # Latest-wins coalescing
+        self._coalesce_keys: Dict[EventType, CoalesceKey] = {
+            EventType(event_type): key for event_type, key in EVENT_BUS_CONFIG['coalesce'].items()
+        }
+        self._pending: Dict[Tuple[EventType, Hashable], _PendingSlot] = {}
+        self._pending_lock = threading.Lock()
+        self._replaced: Dict[EventType, int] = {}
+        
+        # Instrumentation
+        self._metrics = EventBusMetrics()
+        self._slow_ns = int(EVENT_BUS_CONFIG['slow_subscriber_ms'] * 1e6)
+        self._current_call: Optional[Tuple[str, EventType, int]] = None  # (subscriber, event type, start ns)
+        self._reported_call = None  # Last call the watchdog logged
+        self._watchdog_thread = None
         
     def start(self):
         """Start the event bus worker thread"""
@@ -82,6 +570,8 @@ class EventBus:
                 self._running = True
                 self._worker_thread = threading.Thread(target=self._process_events, daemon=True)
                 self._worker_thread.start()
+                self._watchdog_thread = threading.Thread(target=self._watch_slow_subscribers, daemon=True)
+                self._watchdog_thread.start()
                 logger.info("EventBus started")
                 
     def stop(self):
@@ -89,27 +579,44 @@ class EventBus:
         with self._lock:
             if self._running:
                 self._running = False
-                self._event_queue.put(None)  # Sentinel to wake up the thread
+                self._wakeup.set()  # Wake up the thread so it can exit
                 if self._worker_thread:
                     self._worker_thread.join(timeout=5)
+                if self._watchdog_thread:
+                    self._watchdog_thread.join(timeout=5)
                 logger.info("EventBus stopped")
                 
-    def subscribe(self, event_type: EventType, callback: Callable[[Event], None]):
+    def subscribe(self, event_type: EventType, callback: Callable[[Event], None],
+                  mode: DeliveryMode = DeliveryMode.INLINE):
         """
         Subscribe to an event type
         
+        Coroutine functions are rejected: the ib_async loop only runs inside
+        util.run() calls (it is not integrated with the Qt loop), so scheduled
+        coroutines would stall until some unrelated request spun it.
+        
         Args:
             event_type: Type of event to subscribe to
             callback: Function to call when event occurs
+            mode: Delivery mode; use QT for callbacks that touch widgets
         """
+        if asyncio.iscoroutinefunction(callback):
+            logger.error(f"Cannot subscribe coroutine {_callback_name(callback)} to {event_type.value}: "
+                         f"the ib_async loop is not running between requests")
+            return
+            
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
+            subscribers = self._subscribers.get(event_type, ())
+            if any(sub.callback == callback for sub in subscribers):
+                return
                 
-            # Simply store the callback directly
-            if callback not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(callback)
-                logger.info(f"Subscribed {callback} to {event_type.value}")
+            subscription = _Subscription(callback, mode)
+            if mode is DeliveryMode.QT:
+                subscription.qt_dispatcher = self._get_qt_dispatcher()
+                
+            # Replace the tuple so in-flight dispatches keep their snapshot
+            self._subscribers[event_type] = subscribers + (subscription,)
+            logger.info(f"Subscribed {_callback_name(callback)} to {event_type.value} ({mode.value})")
                 
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]):
         """
@@ -120,10 +627,62 @@ class EventBus:
             callback: Function to remove from subscribers
         """
         with self._lock:
-            if event_type in self._subscribers and callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                logger.info(f"Unsubscribed {callback} from {event_type.value}")
+            subscribers = self._subscribers.get(event_type, ())
+            remaining = tuple(sub for sub in subscribers if sub.callback != callback)
+            if len(remaining) != len(subscribers):
+                self._subscribers[event_type] = remaining
+                logger.info(f"Unsubscribed {_callback_name(callback)} from {event_type.value}")
+                
+    def _get_qt_dispatcher(self):
+        """Get the main-thread receiver for QT deliveries (created on first use)"""
+        if not QT_AVAILABLE:
+            raise RuntimeError("PyQt6 is required for DeliveryMode.QT")
+        if self._qt_dispatcher is None:
+            self._qt_dispatcher = _QtDispatcher()
+            app = QCoreApplication.instance()
+            if app is not None:
+                self._qt_dispatcher.moveToThread(app.thread())
+        return self._qt_dispatcher
                 
+    def enable_coalescing(self, event_type: EventType, key: CoalesceKey = 'symbol'):
+        """
+        Make an event type latest-wins per key
+        
+        Args:
+            event_type: Event type to coalesce
+            key: Data field name, or a function returning a hashable key for an
+                event (events whose key is None are never coalesced)
+        """
+        self._coalesce_keys[event_type] = key
+        logger.info(f"Coalescing {event_type.value} events")
+        
+    def disable_coalescing(self, event_type: EventType):
+        """Queue every event of a type again (already queued events are still delivered)"""
+        self._coalesce_keys.pop(event_type, None)
+        
+    def get_coalescing_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get pending and replaced counts per coalesced event type (bus queue and Qt deliveries)"""
+        qt_replaced = self._qt_dispatcher.replaced if self._qt_dispatcher is not None else {}
+        with self._pending_lock:
+            pending: Dict[EventType, int] = {}
+            for event_type, _ in self._pending:
+                pending[event_type] = pending.get(event_type, 0) + 1
+            return {
+                event_type.value: {
+                    'pending': pending.get(event_type, 0),
+                    'replaced': self._replaced.get(event_type, 0),
+                    'qt_replaced': qt_replaced.get(event_type, 0),
+                }
+                for event_type in set(self._coalesce_keys) | set(self._replaced) | set(qt_replaced)
+            }
+            
+    def _coalesce_value(self, event: Event) -> Optional[Hashable]:
+        """Get an event's coalescing key value, or None if it is not coalesced"""
+        key = self._coalesce_keys.get(event.type)
+        if key is None:
+            return None
+        return key(event) if callable(key) else event.data.get(key)
+            
     def publish(self, event: Event):
         """
         Publish an event
@@ -132,8 +691,27 @@ class EventBus:
             event: Event to publish
         """
         if self._running:
-            self._event_queue.put(event)
-            logger.debug(f"Published event: {event.type.value} from {event.source}")
+            entry = event
+            value = self._coalesce_value(event)
+            if value is not None:
+                slot_key = (event.type, value)
+                with self._pending_lock:
+                    slot = self._pending.get(slot_key)
+                    if slot is not None:
+                        # Still queued: replace in place, keeping its position
+                        slot.event = event
+                        self._replaced[event.type] = self._replaced.get(event.type, 0) + 1
+                        return
+                    entry = self._pending[slot_key] = _PendingSlot(slot_key, event)
+                    
+            lane_index = EVENT_LANES.get(event.type, EventLane.NORMAL)
+            lane = self._lanes[lane_index]
+            lane.append(entry)
+            if len(lane) > self._metrics.peak_depth[lane_index]:
+                self._metrics.peak_depth[lane_index] = len(lane)
+            self._wakeup.set()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Published event: {event.type.value} from {event.source}")
         else:
             logger.warning(f"EventBus not running, event dropped: {event.type.value}")
             
@@ -149,52 +727,152 @@ class EventBus:
         event = Event(type=event_type, data=data, source=source)
         self.publish(event)
         
+    def publish_payload(self, payload: EventPayload, source: str):
+        """
+        Publish a typed payload under its event type
+        
+        Args:
+            payload: Slotted payload (PriceUpdate, BarClosed, ...)
+            source: Source of the event
+        """
+        self.publish(Event(payload.event_type, payload, source))
+        
     def _process_events(self):
-        """Process events from the queue (runs in worker thread)"""
+        """Process events from the lanes (runs in worker thread)"""
         while self._running:
             try:
-                # Get event from queue with timeout
-                event = self._event_queue.get(timeout=1)
-                
-                if event is None:  # Sentinel value
-                    break
-                    
-                # Process the event
-                self._dispatch_event(event)
-                
-                # Add to history
-                self._add_to_history(event)
-                
-            except queue.Empty:
-                continue
+                self._wakeup.wait(timeout=1)
+                # Clear before draining: a publish racing the drain re-sets it
+                self._wakeup.clear()
+                while self._running and self._drain_batch():
+                    pass
             except Exception as e:
                 logger.error(f"Error processing event: {str(e)}")
                 
+    def _next_event(self) -> Optional[Event]:
+        """Pop the oldest event from the highest-priority non-empty lane"""
+        for lane in self._lanes:
+            if lane:
+                try:
+                    entry = lane.popleft()
+                except IndexError:
+                    continue
+                if entry.__class__ is _PendingSlot:
+                    # Unregister first so later publishes queue a new event
+                    with self._pending_lock:
+                        del self._pending[entry.key]
+                        return entry.event
+                return entry
+        return None
+        
+    def _drain_batch(self) -> bool:
+        """
+        Dispatch up to batch_size events
+        
+        Returns:
+            True if the batch filled up (more events may be pending)
+        """
+        batch = []
+        while len(batch) < self._batch_size:
+            event = self._next_event()
+            if event is None:
+                break
+            self._dispatch_event(event)
+            batch.append(event)
+            
+        if batch:
+            self._history.append_batch(batch)
+        return len(batch) == self._batch_size
+                
     def _dispatch_event(self, event: Event):
         """Dispatch an event to all subscribers"""
-        with self._lock:
-            subscribers = self._subscribers.get(event.type, []).copy()
-            logger.info(f"Dispatching {event.type.value} event to {len(subscribers)} subscribers")
+        # Tuples are replaced, never mutated, so no lock or copy is needed
+        subscribers = self._subscribers.get(event.type, ())
+        metrics = self._metrics
+        event.dispatched_ns = time.monotonic_ns()
+        metrics.record_wait(event.type, event.queue_wait_ns)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Dispatching {event.type.value} event to {len(subscribers)} subscribers "
+                         f"after {event.queue_wait_ns / 1e6:.2f}ms in queue")
             
-        # Dispatch outside the lock to avoid deadlocks
-        for callback in subscribers:
+        # Qt deliveries of coalesced types stay latest-wins in the Qt event queue too
+        coalesce_value = self._coalesce_value(event)
+        for subscription in subscribers:
+            name = _callback_name(subscription.callback)
+            started = time.monotonic_ns()
+            call = self._current_call = (name, event.type, started)
             try:
-                logger.info(f"Calling subscriber {callback.__name__ if hasattr(callback, '__name__') else str(callback)}")
-                callback(event)
-                logger.info(f"Successfully called subscriber {callback.__name__ if hasattr(callback, '__name__') else str(callback)}")
+                subscription.deliver(event, coalesce_value)
             except Exception as e:
-                logger.error(f"Error in event subscriber {callback}: {str(e)}")
-                import traceback
+                logger.error(f"Error in event subscriber {name}: {str(e)}")
                 logger.error(f"Traceback: {traceback.format_exc()}")
+            finally:
+                self._current_call = None
                 
-    def _add_to_history(self, event: Event):
-        """Add event to history for debugging/monitoring"""
-        with self._lock:
-            self._event_history.append(event)
-            
-            # Trim history if it gets too large
-            if len(self._event_history) > self._max_history_size:
-                self._event_history = self._event_history[-self._max_history_size:]
+            elapsed = time.monotonic_ns() - started
+            metrics.record_call(event.type, name, elapsed)
+            if elapsed > self._slow_ns:
+                metrics.record_slow(name)
+                if call is not self._reported_call:
+                    # Finished between watchdog samples - no stack, but still name it
+                    logger.warning(f"Slow event subscriber {name} took {elapsed / 1e6:.1f}ms "
+                                   f"for {event.type.value}")
+                                   
+    def _watch_slow_subscribers(self):
+        """Log a stack sample of the worker while a subscriber overruns (watchdog thread)"""
+        interval = max(0.005, self._slow_ns / 2e9)
+        while self._running:
+            time.sleep(interval)
+            call = self._current_call
+            if call is None or call is self._reported_call:
+                continue
+            name, event_type, started = call
+            elapsed = time.monotonic_ns() - started
+            if elapsed <= self._slow_ns:
+                continue
+            self._reported_call = call
+            frame = sys._current_frames().get(self._worker_thread.ident) if self._worker_thread else None
+            stack = ''.join(traceback.format_stack(frame)) if frame is not None else '(no stack available)'
+            logger.warning(f"Slow event subscriber {name} has been running {elapsed / 1e6:.1f}ms "
+                           f"for {event_type.value}, worker stack:\n{stack}")
+                                   
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of bus performance
+        
+        Returns:
+            Dict with queue depth (current and peak per lane), dispatch count,
+            queue wait by lane and by event type, per-subscriber time
+            summaries, and slow call counts
+        """
+        metrics = self._metrics
+        subscriber_time = {
+            f"{event_type.value}:{name}": histogram.summary()
+            for (event_type, name), histogram in list(metrics.subscriber_time.items())
+        }
+        slowest = max(subscriber_time.items(), key=lambda item: item[1]['max_ms'], default=(None, None))
+        return {
+            'queue_depth': self.get_queue_depth(),
+            'peak_queue_depth': {lane.name.lower(): metrics.peak_depth[lane] for lane in EventLane},
+            'dispatched': metrics.dispatched,
+            'slow_calls': metrics.slow_calls,
+            'slow_by_subscriber': dict(metrics.slow_by_subscriber),
+            'lane_wait': {lane.name.lower(): metrics.lane_wait[lane].summary() for lane in EventLane},
+            'queue_wait': {
+                event_type.value: histogram.summary()
+                for event_type, histogram in list(metrics.queue_wait.items())
+            },
+            'subscriber_time': subscriber_time,
+            'slowest_subscriber': slowest[0],
+        }
+        
+    def reset_metrics(self):
+        """Clear all counters and histograms"""
+        self._metrics.reset()
+                
+    def get_queue_depth(self) -> Dict[str, int]:
+        """Get the number of pending events per lane"""
+        return {lane.name.lower(): len(self._lanes[lane]) for lane in EventLane}
                 
     def get_event_history(self, event_type: Optional[EventType] = None, 
                          limit: int = 100) -> List[Event]:
@@ -208,17 +886,30 @@ class EventBus:
         Returns:
             List of events
         """
-        with self._lock:
-            if event_type:
-                filtered = [e for e in self._event_history if e.type == event_type]
-                return filtered[-limit:]
-            else:
-                return self._event_history[-limit:]
+        return self._history.latest(event_type, limit)
                 
     def clear_history(self):
         """Clear event history"""
-        with self._lock:
-            self._event_history.clear()
+        self._history.clear()
+        
+    def export_history(self, path: str, event_type: Optional[EventType] = None) -> int:
+        """
+        Dump event history to a JSON Lines file
+        
+        Args:
+            path: Output file path
+            event_type: Filter by event type (None for all events)
+            
+        Returns:
+            Number of events written
+        """
+        try:
+            count = self._history.export_jsonl(path, event_type)
+            logger.info(f"Exported {count} events to {path}")
+            return count
+        except Exception as e:
+            logger.error(f"Error exporting event history: {str(e)}")
+            return 0
             
     def get_subscriber_count(self, event_type: Optional[EventType] = None) -> Dict[str, int]:
         """
@@ -230,17 +921,10 @@ class EventBus:
         Returns:
             Dictionary of event types to subscriber counts
         """
-        with self._lock:
-            if event_type:
-                subscribers = self._subscribers.get(event_type, [])
-                live_count = sum(1 for ref in subscribers if ref() is not None)
-                return {event_type.value: live_count}
-            else:
-                counts = {}
-                for evt_type, subscribers in self._subscribers.items():
-                    live_count = sum(1 for ref in subscribers if ref() is not None)
-                    counts[evt_type.value] = live_count
-                return counts
+        subscribers = self._subscribers
+        if event_type:
+            return {event_type.value: len(subscribers.get(event_type, ()))}
+        return {evt_type.value: len(callbacks) for evt_type, callbacks in subscribers.items()}
 
 
 # Global event bus instance
@@ -253,9 +937,10 @@ def get_event_bus() -> EventBus:
     return _event_bus
 
 
-def subscribe(event_type: EventType, callback: Callable[[Event], None]):
+def subscribe(event_type: EventType, callback: Callable[[Event], None],
+              mode: DeliveryMode = DeliveryMode.INLINE):
     """Subscribe to an event on the global event bus"""
-    _event_bus.subscribe(event_type, callback)
+    _event_bus.subscribe(event_type, callback, mode)
 
 
 def unsubscribe(event_type: EventType, callback: Callable[[Event], None]):
@@ -273,6 +958,11 @@ def publish_event(event_type: EventType, data: Dict[str, Any], source: str):
     _event_bus.publish_event(event_type, data, source)
 
 
+def publish_payload(payload: EventPayload, source: str):
+    """Publish a typed payload to the global event bus"""
+    _event_bus.publish_payload(payload, source)
+
+
 def start_event_bus():
     """Start the global event bus"""
     _event_bus.start()
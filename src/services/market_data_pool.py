@@ -0,0 +1,160 @@
+"""
+Market Data Pool
+Reference-counted pool of shared reqMktData lines with LRU eviction
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Any
+
+from ib_async import Contract, Stock, Ticker
+
+from src.services.base_service import BaseService
+from src.services.ib_connection_service import ib_connection_manager
+from src.services.contract_registry import contract_registry
+from src.utils.logger import logger
+from config import MARKET_DATA_POOL_CONFIG
+
+
+@dataclass
+class PooledLine:
+    """A market data line shared between consumers"""
+    symbol: str
+    contract: Contract
+    ticker: Ticker
+    ref_count: int = 0
+    last_used: float = 0.0
+
+
+class MarketDataPool(BaseService):
+    """
+    Central owner of streaming market data lines
+    Consumers acquire shared Ticker handles and release them when done;
+    released lines stay subscribed (warm) until evicted to respect IB's line limit
+    """
+
+    def __init__(self):
+        super().__init__("MarketDataPool")
+        self.ib_manager = ib_connection_manager
+        self.max_lines = MARKET_DATA_POOL_CONFIG['max_lines']
+        self._lines: "OrderedDict[str, PooledLine]" = OrderedDict()  # LRU order, most recent last
+        self._evictions = 0
+
+    def initialize(self) -> bool:
+        """Initialize the pool and track disconnects"""
+        try:
+            if not super().initialize():
+                return False
+            if self.ib_manager.ib:
+                self.ib_manager.ib.disconnectedEvent += self._on_disconnected
+            self._initialized = True
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize MarketDataPool: {str(e)}")
+            return False
+
+    def cleanup(self):
+        """Cancel every pooled line"""
+        try:
+            for symbol in list(self._lines):
+                self._cancel_line(symbol)
+            logger.info("MarketDataPool cleaned up")
+        except Exception as e:
+            logger.error(f"Error cleaning up MarketDataPool: {str(e)}")
+
+    def acquire(self, symbol: str, contract: Optional[Contract] = None) -> Optional[Ticker]:
+        """
+        Get a shared streaming Ticker for a symbol, subscribing if needed
+
+        Args:
+            symbol: Stock symbol
+            contract: Contract to subscribe with (registry/SMART default if omitted)
+
+        Returns:
+            Live Ticker or None if no line is available
+        """
+        try:
+            symbol = symbol.upper()
+            line = self._lines.get(symbol)
+            if line:
+                self._lines.move_to_end(symbol)
+            else:
+                if not self.ib_manager.is_connected() or not self.ib_manager.ib:
+                    logger.error("Not connected to IB for market data")
+                    return None
+                if len(self._lines) >= self.max_lines and not self._evict_one():
+                    logger.warning(f"Market data line limit ({self.max_lines}) reached, cannot subscribe {symbol}")
+                    return None
+
+                contract = contract or contract_registry.get_cached(symbol) or Stock(symbol, 'SMART', 'USD')
+                ticker = self.ib_manager.ib.reqMktData(contract, '', False, False)
+                line = PooledLine(symbol=symbol, contract=contract, ticker=ticker)
+                self._lines[symbol] = line
+                logger.debug(f"Opened market data line for {symbol} ({len(self._lines)}/{self.max_lines})")
+
+            line.ref_count += 1
+            line.last_used = time.time()
+            return line.ticker
+
+        except Exception as e:
+            logger.error(f"Error acquiring market data for {symbol}: {str(e)}")
+            return None
+
+    def release(self, symbol: str):
+        """
+        Drop a consumer reference; the line stays warm until evicted
+
+        Args:
+            symbol: Stock symbol previously acquired
+        """
+        line = self._lines.get(symbol.upper())
+        if line and line.ref_count > 0:
+            line.ref_count -= 1
+            line.last_used = time.time()
+
+    def get_ticker(self, symbol: str) -> Optional[Ticker]:
+        """Get the pooled Ticker for a symbol without taking a reference"""
+        line = self._lines.get(symbol.upper())
+        return line.ticker if line else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool usage statistics"""
+        return {
+            'lines': len(self._lines),
+            'max_lines': self.max_lines,
+            'in_use': sum(1 for line in self._lines.values() if line.ref_count > 0),
+            'evictions': self._evictions
+        }
+
+    def _evict_one(self) -> bool:
+        """Cancel the least recently used idle line"""
+        for symbol, line in self._lines.items():
+            if line.ref_count == 0:
+                self._cancel_line(symbol)
+                self._evictions += 1
+                logger.debug(f"Evicted idle market data line for {symbol}")
+                return True
+        return False
+
+    def _cancel_line(self, symbol: str):
+        """Cancel a pooled subscription and forget it"""
+        line = self._lines.pop(symbol, None)
+        if not line:
+            return
+        try:
+            if self.ib_manager.is_connected():
+                self.ib_manager.ib.cancelMktData(line.contract)
+        except Exception as e:
+            logger.warning(f"Error canceling market data for {symbol}: {str(e)}")
+
+    def _on_disconnected(self):
+        """Subscriptions die with the connection - forget them"""
+        if self._lines:
+            logger.info(f"Dropping {len(self._lines)} pooled market data lines after disconnect")
+        self._lines.clear()
+
+
+# Create singleton instance for global access
+market_data_pool = MarketDataPool()
+market_data_pool.initialize()
@@ -5,12 +5,77 @@ Migrated from src/core/chart_performance_optimizer.py as part of architecture co
 """
 
 import numpy as np
-from typing import Optional
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+
+import pytz
+
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
 
 from src.services.base_service import BaseService
+from src.core.bar_frame import BarFrame, EASTERN
 from src.utils.logger import logger
 
 
+def _ema_kernel(prices: np.ndarray, alpha: float) -> np.ndarray:
+    """Run the EMA recursion over a non-empty float64 array, seeded with prices[0]"""
+    decay = 1.0 - alpha
+    if SCIPY_AVAILABLE:
+        ema, _ = lfilter([alpha], [1.0, -decay], prices, zi=[decay * prices[0]])
+        return ema
+    
+    ema = np.empty_like(prices)
+    ema[0] = prices[0]
+    for i in range(1, len(prices)):
+        ema[i] = alpha * prices[i] + decay * ema[i-1]
+    return ema
+
+
+def stack_series(series: Sequence[np.ndarray], length: Optional[int] = None) -> np.ndarray:
+    """
+    Stack ragged 1-D series into a right-aligned symbols x bars matrix
+    
+    The newest bar of every series lands in the last column; shorter
+    histories are padded with leading NaNs.
+    
+    Args:
+        series: One array per symbol, oldest bar first
+        length: Number of columns (defaults to the longest series)
+        
+    Returns:
+        float64 matrix of shape (len(series), length)
+    """
+    length = length if length is not None else max((len(values) for values in series), default=0)
+    matrix = np.full((len(series), length), np.nan)
+    for row, values in enumerate(series):
+        values = np.asarray(values, dtype=np.float64)[-length:] if length else values[:0]
+        if len(values):
+            matrix[row, length - len(values):] = values
+    return matrix
+
+
+def _leading_fill(matrix: np.ndarray):
+    """
+    Fill each row's leading NaN padding with its first real value
+    
+    Returns:
+        (filled matrix, padding mask, index of the first real value per row)
+    """
+    valid = np.isfinite(matrix)
+    first = np.where(valid.any(axis=1), valid.argmax(axis=1), matrix.shape[1])
+    columns = np.arange(matrix.shape[1])
+    padding = columns[None, :] < first[:, None]
+    seed = matrix[np.arange(matrix.shape[0]), np.minimum(first, matrix.shape[1] - 1)]
+    filled = np.where(padding, seed[:, None], matrix)
+    return filled, padding, first
+
+
 class TechnicalIndicatorService(BaseService):
     """
     Service for optimized technical indicator calculations
@@ -39,6 +104,10 @@ class TechnicalIndicatorService(BaseService):
         """
         Calculate EMA using vectorized operations
         
+        The recursion ema[i] = alpha * price[i] + (1 - alpha) * ema[i-1] is a
+        first-order IIR filter, so it runs in C via scipy.signal.lfilter with
+        the initial state chosen so that ema[0] == price[0].
+        
         Args:
             prices: Array of price values
             period: EMA period
@@ -50,14 +119,7 @@ class TechnicalIndicatorService(BaseService):
             if len(prices) < period:
                 return np.full(len(prices), np.nan)
             
-            alpha = 2.0 / (period + 1)
-            ema = np.zeros_like(prices)
-            ema[0] = prices[0]
-            
-            for i in range(1, len(prices)):
-                ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
-            
-            return ema
+            return _ema_kernel(np.asarray(prices, dtype=np.float64), 2.0 / (period + 1))
             
         except Exception as e:
             logger.error(f"Error calculating EMA (period={period}): {str(e)}")
@@ -67,20 +129,35 @@ class TechnicalIndicatorService(BaseService):
         """
         Calculate SMA using vectorized operations
         
+        Window sums are differences of one cumulative sum, so each value
+        costs O(1) regardless of period. Missing prices are summed as zero and
+        counted separately, so a NaN only blanks the windows containing it
+        (a plain cumsum would carry it into every later window).
+        
         Args:
             prices: Array of price values
             period: SMA period
             
         Returns:
-            Array of SMA values
+            Array of SMA values (NaN for the first period-1 bars and for
+            windows with a missing price)
         """
         try:
             if len(prices) < period:
                 return np.full(len(prices), np.nan)
             
+            prices = np.asarray(prices, dtype=np.float64)
+            valid = np.isfinite(prices)
+            cumulative = np.zeros(len(prices) + 1)
+            np.cumsum(np.where(valid, prices, 0.0), out=cumulative[1:])
+            counts = np.zeros(len(prices) + 1, dtype=np.int64)
+            np.cumsum(valid, out=counts[1:])
+            
+            window_sums = cumulative[period:] - cumulative[:-period]
+            window_counts = counts[period:] - counts[:-period]
+            
             sma = np.full(len(prices), np.nan)
-            for i in range(period - 1, len(prices)):
-                sma[i] = np.mean(prices[i - period + 1:i + 1])
+            sma[period - 1:] = np.where(window_counts == period, window_sums / period, np.nan)
             
             return sma
             
@@ -124,6 +201,617 @@ class TechnicalIndicatorService(BaseService):
         except Exception as e:
             logger.error(f"Error calculating VWAP: {str(e)}")
             return np.full(len(closes), np.nan)
+    
+    def calculate_session_vwap_optimized(self, highs: np.ndarray, lows: np.ndarray,
+                                         closes: np.ndarray, volumes: np.ndarray,
+                                         days: np.ndarray) -> np.ndarray:
+        """
+        Calculate VWAP that resets at each new session using vectorized operations
+        
+        Args:
+            highs: Array of high prices
+            lows: Array of low prices
+            closes: Array of close prices
+            volumes: Array of volumes
+            days: Session day number for each bar (e.g. BarFrame.session_days())
+            
+        Returns:
+            Array of VWAP values
+        """
+        try:
+            if len(closes) == 0:
+                return np.array([])
+            
+            pv = (highs + lows + closes) / 3 * volumes
+            cumulative_pv = np.cumsum(pv)
+            cumulative_volume = np.cumsum(volumes, dtype=np.float64)
+            
+            # Subtract the running totals as of each session's first bar
+            new_session = np.empty(len(closes), dtype=bool)
+            new_session[0] = True
+            np.not_equal(days[1:], days[:-1], out=new_session[1:])
+            starts = np.flatnonzero(new_session)
+            session_index = np.cumsum(new_session) - 1
+            
+            base_pv = np.concatenate(([0.0], cumulative_pv))[starts][session_index]
+            base_volume = np.concatenate(([0.0], cumulative_volume))[starts][session_index]
+            session_pv = cumulative_pv - base_pv
+            session_volume = cumulative_volume - base_volume
+            
+            vwap = np.full(len(closes), np.nan)
+            np.divide(session_pv, session_volume, out=vwap, where=session_volume > 0)
+            
+            return vwap
+            
+        except Exception as e:
+            logger.error(f"Error calculating session VWAP: {str(e)}")
+            return np.full(len(closes), np.nan)
+    
+    # ============================================================================
+    # BATCH (SYMBOLS x BARS) CALCULATIONS
+    # ============================================================================
+    # Inputs are right-aligned matrices (see stack_series): one row per symbol,
+    # newest bar in the last column, leading NaN padding for short histories.
+    # Padding positions come back as NaN; rows follow the 1-D methods' rules.
+    
+    def calculate_ema_batch(self, prices: np.ndarray, period: int) -> np.ndarray:
+        """
+        Calculate EMA for every row of a symbols x bars matrix in one pass
+        
+        Args:
+            prices: Right-aligned price matrix
+            period: EMA period
+            
+        Returns:
+            EMA matrix (rows with fewer than period bars are all NaN)
+        """
+        try:
+            prices = np.asarray(prices, dtype=np.float64)
+            if prices.size == 0:
+                return np.full(prices.shape, np.nan)
+            
+            # Repeating the first price through the padding leaves an EMA seeded
+            # with that price unchanged, so every row can be filtered together
+            filled, padding, first = _leading_fill(prices)
+            alpha = 2.0 / (period + 1)
+            decay = 1.0 - alpha
+            
+            if SCIPY_AVAILABLE:
+                ema, _ = lfilter([alpha], [1.0, -decay], filled, axis=1, zi=decay * filled[:, :1])
+            else:
+                ema = np.empty_like(filled)
+                ema[:, 0] = filled[:, 0]
+                for column in range(1, filled.shape[1]):
+                    ema[:, column] = alpha * filled[:, column] + decay * ema[:, column - 1]
+                    
+            ema[padding] = np.nan
+            ema[prices.shape[1] - first < period] = np.nan
+            return ema
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch EMA (period={period}): {str(e)}")
+            return np.full(np.shape(prices), np.nan)
+    
+    def calculate_sma_batch(self, prices: np.ndarray, period: int) -> np.ndarray:
+        """
+        Calculate SMA for every row of a symbols x bars matrix in one pass
+        
+        Args:
+            prices: Right-aligned price matrix
+            period: SMA period
+            
+        Returns:
+            SMA matrix (NaN until a row has period real bars)
+        """
+        try:
+            prices = np.asarray(prices, dtype=np.float64)
+            rows, columns = prices.shape
+            sma = np.full((rows, columns), np.nan)
+            if columns < period:
+                return sma
+            
+            valid = np.isfinite(prices)
+            cumulative = np.zeros((rows, columns + 1))
+            np.cumsum(np.where(valid, prices, 0.0), axis=1, out=cumulative[:, 1:])
+            counts = np.zeros((rows, columns + 1), dtype=np.int64)
+            np.cumsum(valid, axis=1, out=counts[:, 1:])
+            
+            window_sums = cumulative[:, period:] - cumulative[:, :-period]
+            window_counts = counts[:, period:] - counts[:, :-period]
+            sma[:, period - 1:] = np.where(window_counts == period, window_sums / period, np.nan)
+            return sma
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch SMA (period={period}): {str(e)}")
+            return np.full(np.shape(prices), np.nan)
+    
+    def calculate_vwap_batch(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                             volumes: np.ndarray, days: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate VWAP for every row of symbols x bars matrices in one pass
+        
+        Args:
+            highs: Right-aligned high matrix
+            lows: Right-aligned low matrix
+            closes: Right-aligned close matrix
+            volumes: Right-aligned volume matrix
+            days: Optional session day matrix; VWAP resets where a row's day changes
+            
+        Returns:
+            VWAP matrix
+        """
+        try:
+            closes = np.asarray(closes, dtype=np.float64)
+            rows, columns = closes.shape
+            if columns == 0:
+                return np.full((rows, 0), np.nan)
+            
+            valid = np.isfinite(closes)
+            pv = np.where(valid, (highs + lows + closes) / 3 * volumes, 0.0)
+            volume = np.where(valid, volumes, 0.0)
+            
+            cumulative_pv = np.zeros((rows, columns + 1))
+            np.cumsum(pv, axis=1, out=cumulative_pv[:, 1:])
+            cumulative_volume = np.zeros((rows, columns + 1))
+            np.cumsum(volume, axis=1, out=cumulative_volume[:, 1:])
+            
+            if days is None:
+                session_start = np.zeros((rows, columns), dtype=np.int64)
+            else:
+                # Column of each bar's session start, carried forward along the row
+                new_session = np.zeros((rows, columns), dtype=bool)
+                new_session[:, 1:] = days[:, 1:] != days[:, :-1]
+                session_start = np.maximum.accumulate(
+                    np.where(new_session, np.arange(columns)[None, :], 0), axis=1)
+                
+            session_pv = cumulative_pv[:, 1:] - np.take_along_axis(cumulative_pv, session_start, axis=1)
+            session_volume = cumulative_volume[:, 1:] - np.take_along_axis(cumulative_volume, session_start, axis=1)
+            
+            vwap = np.full((rows, columns), np.nan)
+            np.divide(session_pv, session_volume, out=vwap, where=valid & (session_volume > 0))
+            return vwap
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch VWAP: {str(e)}")
+            return np.full(np.shape(closes), np.nan)
+    
+    def calculate_atr_batch(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                            period: int = 14) -> np.ndarray:
+        """
+        Calculate Average True Range (Wilder smoothing) for every row in one pass
+        
+        The first true range of each row is high - low; smoothing is seeded
+        with it and the first period-1 values are NaN.
+        
+        Args:
+            highs: Right-aligned high matrix
+            lows: Right-aligned low matrix
+            closes: Right-aligned close matrix
+            period: ATR period
+            
+        Returns:
+            ATR matrix
+        """
+        try:
+            highs = np.asarray(highs, dtype=np.float64)
+            lows = np.asarray(lows, dtype=np.float64)
+            closes = np.asarray(closes, dtype=np.float64)
+            rows, columns = closes.shape
+            if columns == 0:
+                return np.full((rows, 0), np.nan)
+            
+            previous_close = np.full((rows, columns), np.nan)
+            previous_close[:, 1:] = closes[:, :-1]
+            true_range = highs - lows
+            np.fmax(true_range, np.abs(highs - previous_close), out=true_range)
+            np.fmax(true_range, np.abs(lows - previous_close), out=true_range)
+            
+            filled, padding, first = _leading_fill(true_range)
+            alpha = 1.0 / period
+            decay = 1.0 - alpha
+            
+            if SCIPY_AVAILABLE:
+                atr, _ = lfilter([alpha], [1.0, -decay], filled, axis=1, zi=decay * filled[:, :1])
+            else:
+                atr = np.empty_like(filled)
+                atr[:, 0] = filled[:, 0]
+                for column in range(1, columns):
+                    atr[:, column] = alpha * filled[:, column] + decay * atr[:, column - 1]
+                    
+            atr[padding] = np.nan
+            warmup = np.arange(columns)[None, :] < (first + period - 1)[:, None]
+            atr[warmup] = np.nan
+            return atr
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch ATR (period={period}): {str(e)}")
+            return np.full(np.shape(closes), np.nan)
+    
+    def create_streaming_indicators(self, bars: BarFrame) -> 'StreamingIndicatorSet':
+        """
+        Create the chart's indicator set seeded from history
+        
+        Args:
+            bars: Historical bars
+            
+        Returns:
+            StreamingIndicatorSet ready for per-bar updates
+        """
+        indicators = StreamingIndicatorSet()
+        indicators.seed(bars)
+        return indicators
+
+
+# ============================================================================
+# STREAMING INDICATORS
+# ============================================================================
+
+class GrowableArray:
+    """Float array with amortized O(1) appends, exposed as a view of the filled part"""
+    
+    def __init__(self):
+        self._data = np.empty(0)
+        self._length = 0
+        
+    @property
+    def values(self) -> np.ndarray:
+        """Filled values (a view - copy before storing)"""
+        return self._data[:self._length]
+    
+    @property
+    def last(self) -> float:
+        """Newest value, or NaN when empty"""
+        return float(self._data[self._length - 1]) if self._length else np.nan
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def reset(self, values: np.ndarray):
+        """Replace all values, leaving headroom for appends"""
+        self._length = len(values)
+        self._data = np.empty(max(64, self._length * 2))
+        self._data[:self._length] = values
+        
+    def push(self, value: float):
+        """Append one value, doubling capacity when full"""
+        if self._length == len(self._data):
+            grown = np.empty(max(64, len(self._data) * 2))
+            grown[:self._length] = self._data[:self._length]
+            self._data = grown
+        self._data[self._length] = value
+        self._length += 1
+        
+    def set_last(self, value: float):
+        """Overwrite the newest value"""
+        self._data[self._length - 1] = value
+
+
+class StreamingIndicator(ABC):
+    """
+    Base class for incrementally updated indicators
+    
+    Seed once from history with seed(), then feed the live bar with
+    update_last_bar() (forming bar changed) or append_bar() (new bar opened).
+    Both run in constant (amortized) time. Values are kept in a GrowableArray
+    and exposed as a view through the values property.
+    """
+    
+    def __init__(self):
+        self._series = GrowableArray()
+        
+    @property
+    def values(self) -> np.ndarray:
+        """Indicator value per bar (a view - copy before storing)"""
+        return self._series.values
+    
+    @property
+    def last(self) -> float:
+        """Indicator value of the newest bar"""
+        return self._series.last
+    
+    def __len__(self) -> int:
+        return len(self._series)
+    
+    @abstractmethod
+    def seed(self, bars: BarFrame):
+        """Rebuild state from historical bars"""
+    
+    @abstractmethod
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        """Recompute the newest value after the forming bar changed"""
+    
+    @abstractmethod
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        """Add a value for a newly opened bar"""
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average of closes"""
+    
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self._previous = np.nan  # EMA as of the bar before the forming one
+        
+    def seed(self, bars: BarFrame):
+        if len(bars) == 0:
+            self._series.reset(np.empty(0))
+            self._previous = np.nan
+            return
+        self._series.reset(_ema_kernel(np.asarray(bars.close, dtype=np.float64), self.alpha))
+        self._previous = self.values[-2] if len(self) > 1 else np.nan
+        
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        if not len(self):
+            self.append_bar(high, low, close, volume, time)
+            return
+        self._series.set_last(self._next(close))
+        
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        self._previous = self.last
+        self._series.push(self._next(close))
+        
+    def _next(self, close: float) -> float:
+        if np.isnan(self._previous):
+            return close
+        return self.alpha * close + (1.0 - self.alpha) * self._previous
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average of closes backed by a ring buffer of the window"""
+    
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self._window = np.zeros(period)
+        self._head = 0       # Slot of the newest close
+        self._count = 0      # Closes in the window (<= period)
+        self._sum = 0.0
+        self._appends = 0
+        
+    def seed(self, bars: BarFrame):
+        closes = np.asarray(bars.close, dtype=np.float64)
+        self._series.reset(indicator_optimizer.calculate_sma_optimized(closes, self.period))
+        tail = closes[-self.period:]
+        self._window[:] = 0.0
+        self._window[:len(tail)] = tail
+        self._count = len(tail)
+        self._head = len(tail) - 1 if len(tail) else self.period - 1
+        self._sum = float(np.sum(tail))
+        self._appends = 0
+        
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        if not self._count:
+            self.append_bar(high, low, close, volume, time)
+            return
+        self._sum += close - self._window[self._head]
+        self._window[self._head] = close
+        self._series.set_last(self._current())
+        
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        self._head = (self._head + 1) % self.period
+        if self._count == self.period:
+            self._sum -= self._window[self._head]
+        else:
+            self._count += 1
+        self._window[self._head] = close
+        self._sum += close
+        
+        # Re-sum the window once per period to cancel floating-point drift
+        self._appends += 1
+        if self._appends >= self.period:
+            self._sum = float(np.sum(self._window[:self._count]))
+            self._appends = 0
+            
+        self._series.push(self._current())
+        
+    def _current(self) -> float:
+        return self._sum / self.period if self._count == self.period else np.nan
+
+
+class StreamingVWAP(StreamingIndicator):
+    """VWAP that resets at the start of each US/Eastern session day"""
+    
+    def __init__(self):
+        super().__init__()
+        self._day = None
+        self._session_pv = 0.0
+        self._session_volume = 0.0
+        self._last_pv = 0.0       # Forming bar's contribution to the session sums
+        self._last_volume = 0.0
+        
+    def seed(self, bars: BarFrame):
+        if len(bars) == 0:
+            self._series.reset(np.empty(0))
+            self._day = None
+            self._session_pv = self._session_volume = 0.0
+            self._last_pv = self._last_volume = 0.0
+            return
+            
+        days = bars.session_days()
+        self._series.reset(indicator_optimizer.calculate_session_vwap_optimized(
+            bars.high, bars.low, bars.close, bars.volume, days))
+        
+        # Session sums from the last session's bars only
+        session_start = int(np.searchsorted(days, days[-1], side='left'))
+        pv = (bars.high[session_start:] + bars.low[session_start:] + bars.close[session_start:]) / 3 * bars.volume[session_start:]
+        self._day = int(days[-1])
+        self._session_pv = float(np.sum(pv))
+        self._session_volume = float(np.sum(bars.volume[session_start:]))
+        self._last_pv = float(pv[-1])
+        self._last_volume = float(bars.volume[-1])
+        
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        if not len(self):
+            self.append_bar(high, low, close, volume, time)
+            return
+        self._session_pv -= self._last_pv
+        self._session_volume -= self._last_volume
+        self._add(high, low, close, volume)
+        self._series.set_last(self._current())
+        
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        day = self._session_day(time)
+        if day != self._day:
+            self._day = day
+            self._session_pv = 0.0
+            self._session_volume = 0.0
+        self._add(high, low, close, volume)
+        self._series.push(self._current())
+        
+    def _add(self, high: float, low: float, close: float, volume: float):
+        self._last_pv = (high + low + close) / 3 * volume
+        self._last_volume = float(volume)
+        self._session_pv += self._last_pv
+        self._session_volume += self._last_volume
+        
+    def _current(self) -> float:
+        return self._session_pv / self._session_volume if self._session_volume > 0 else np.nan
+    
+    @staticmethod
+    def _session_day(time: int) -> int:
+        local = datetime.fromtimestamp(int(time), tz=pytz.utc).astimezone(EASTERN)
+        return (int(time) + int(local.utcoffset().total_seconds())) // 86400
+
+
+class RollingHighLow:
+    """
+    Highest high and lowest low over the last N bars
+    
+    Closed bars live in monotonic deques (amortized O(1) per bar); the
+    forming bar is kept aside so tick updates never touch the deques.
+    """
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.highs = GrowableArray()
+        self.lows = GrowableArray()
+        self._max_deque = deque()  # (bar index, high), highs decreasing
+        self._min_deque = deque()  # (bar index, low), lows increasing
+        self._forming_high = np.nan
+        self._forming_low = np.nan
+        self._count = 0            # Bars seen, including the forming bar
+        
+    def __len__(self) -> int:
+        return self._count
+    
+    def seed(self, bars: BarFrame):
+        self._max_deque.clear()
+        self._min_deque.clear()
+        self._count = 0
+        self.highs.reset(np.empty(0))
+        self.lows.reset(np.empty(0))
+        
+        count = len(bars)
+        if count == 0:
+            return
+        
+        # Seed in bulk; only the last period-1 closed bars can still matter
+        highs = np.asarray(bars.high, dtype=np.float64)
+        lows = np.asarray(bars.low, dtype=np.float64)
+        self.highs.reset(self._rolling(highs, np.fmax))
+        self.lows.reset(self._rolling(lows, np.fmin))
+        
+        start = max(0, count - self.period)
+        for index in range(start, count - 1):
+            self._close_bar(index, highs[index], lows[index])
+        self._forming_high = highs[-1]
+        self._forming_low = lows[-1]
+        self._count = count
+        
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        if not self._count:
+            self.append_bar(high, low, close, volume, time)
+            return
+        self._forming_high = high
+        self._forming_low = low
+        self.highs.set_last(self._current_high())
+        self.lows.set_last(self._current_low())
+        
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        if self._count:
+            self._close_bar(self._count - 1, self._forming_high, self._forming_low)
+        self._count += 1
+        self._forming_high = high
+        self._forming_low = low
+        
+        # Drop closed bars that fell out of the window ending at the forming bar
+        oldest = self._count - self.period
+        while self._max_deque and self._max_deque[0][0] < oldest:
+            self._max_deque.popleft()
+        while self._min_deque and self._min_deque[0][0] < oldest:
+            self._min_deque.popleft()
+            
+        self.highs.push(self._current_high())
+        self.lows.push(self._current_low())
+        
+    def _close_bar(self, index: int, high: float, low: float):
+        while self._max_deque and self._max_deque[-1][1] <= high:
+            self._max_deque.pop()
+        self._max_deque.append((index, high))
+        while self._min_deque and self._min_deque[-1][1] >= low:
+            self._min_deque.pop()
+        self._min_deque.append((index, low))
+        
+    def _current_high(self) -> float:
+        return max(self._max_deque[0][1], self._forming_high) if self._max_deque else self._forming_high
+    
+    def _current_low(self) -> float:
+        return min(self._min_deque[0][1], self._forming_low) if self._min_deque else self._forming_low
+    
+    def _rolling(self, values: np.ndarray, reduce) -> np.ndarray:
+        """Trailing window reduction (partial windows at the start)"""
+        result = values.copy()
+        for offset in range(1, min(self.period, len(values))):
+            result[offset:] = reduce(result[offset:], values[:-offset])
+        return result
+
+
+class StreamingIndicatorSet:
+    """The chart's indicator lines (EMA 5/10/21, SMA 50/100/200, session VWAP) kept current per bar"""
+    
+    EMA_PERIODS = (5, 10, 21)
+    SMA_PERIODS = (50, 100, 200)
+    
+    def __init__(self):
+        self.emas = {period: StreamingEMA(period) for period in self.EMA_PERIODS}
+        self.smas = {period: StreamingSMA(period) for period in self.SMA_PERIODS}
+        self.vwap = StreamingVWAP()
+        
+    def _all(self):
+        return [*self.emas.values(), *self.smas.values(), self.vwap]
+    
+    def seed(self, bars: BarFrame):
+        """Rebuild every indicator from historical bars"""
+        for indicator in self._all():
+            indicator.seed(bars)
+            
+    def update_last_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        """Apply a change to the forming bar"""
+        for indicator in self._all():
+            indicator.update_last_bar(high, low, close, volume, time)
+            
+    def append_bar(self, high: float, low: float, close: float, volume: float, time: int):
+        """Apply a newly opened bar"""
+        for indicator in self._all():
+            indicator.append_bar(high, low, close, volume, time)
+            
+    def __len__(self) -> int:
+        return len(self.vwap)
+    
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Current indicator arrays keyed by legend label (same conventions as the batch methods)"""
+        result = {}
+        for period, ema in self.emas.items():
+            values = ema.values.copy()
+            if len(values) < period:
+                values[:] = np.nan
+            result[f'EMA {period}'] = values
+        for period, sma in self.smas.items():
+            result[f'SMA {period}'] = sma.values.copy()
+        result['VWAP'] = self.vwap.values.copy()
+        return result
 
 
 # Legacy compatibility class for smooth migration
@@ -147,6 +835,28 @@ class TechnicalIndicatorOptimizer:
                                closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
         return self._service.calculate_vwap_optimized(highs, lows, closes, volumes)
     
+    def calculate_session_vwap_optimized(self, highs: np.ndarray, lows: np.ndarray,
+                                         closes: np.ndarray, volumes: np.ndarray,
+                                         days: np.ndarray) -> np.ndarray:
+        return self._service.calculate_session_vwap_optimized(highs, lows, closes, volumes, days)
+    
+    def create_streaming_indicators(self, bars: BarFrame) -> 'StreamingIndicatorSet':
+        return self._service.create_streaming_indicators(bars)
+    
+    def calculate_ema_batch(self, prices: np.ndarray, period: int) -> np.ndarray:
+        return self._service.calculate_ema_batch(prices, period)
+    
+    def calculate_sma_batch(self, prices: np.ndarray, period: int) -> np.ndarray:
+        return self._service.calculate_sma_batch(prices, period)
+    
+    def calculate_vwap_batch(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                             volumes: np.ndarray, days: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._service.calculate_vwap_batch(highs, lows, closes, volumes, days)
+    
+    def calculate_atr_batch(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                            period: int = 14) -> np.ndarray:
+        return self._service.calculate_atr_batch(highs, lows, closes, period)
+    
     # Static method compatibility (delegates to instance methods)
     @staticmethod
     def calculate_ema_optimized_static(prices: np.ndarray, period: int) -> np.ndarray:
@@ -7,17 +7,21 @@ Consolidated market data service combining functionality from:
 """
 
 import asyncio
+import time
 from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime, timedelta
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtWidgets import QApplication
-from ib_async import Stock, Contract, BarData, Ticker, util
+from ib_async import Stock, BarData, Ticker, util
 
 from src.services.base_service import BaseService
-from src.services.event_bus import EventType, publish_event
+from src.services.event_bus import EventType, PriceUpdate, publish_event, publish_payload
 from src.services.ib_connection_service import ib_connection_manager
+from src.services.contract_registry import contract_registry
+from src.services.market_data_pool import market_data_pool
 from src.core.market_screener import market_screener, ScreeningCriteria
 from src.utils.logger import logger
+from config import PRICE_FETCH_CONFIG
 
 
 class UnifiedDataService(BaseService, QObject):
@@ -148,8 +152,32 @@ class UnifiedDataService(BaseService, QObject):
     def _fetch_price_and_stops_sync(self, symbol: str, direction: str = 'BUY') -> Optional[Dict[str, Any]]:
         """
         Synchronous price fetch with comprehensive data collection
-        Consolidated from data_fetcher._get_price_and_stops_sync and data_service logic
+        Runs fetch_price_data_async to completion on the ib_async event loop
         """
+        try:
+            return util.run(self.fetch_price_data_async(symbol, direction))
+        except Exception as e:
+            logger.error(f"Error fetching price and stops for {symbol}: {str(e)}")
+            return None
+            
+    async def fetch_price_data_async(self, symbol: str, direction: str = 'BUY') -> Optional[Dict[str, Any]]:
+        """
+        Fetch current price and stop levels for a symbol without polling
+        
+        Contract qualification, market data and both historical requests are
+        issued together; the market data leg completes on the first ticker
+        update carrying a valid bid, ask or last price. The whole batch is
+        bounded by PRICE_FETCH_CONFIG['timeout_seconds'], since the caller
+        blocks the GUI thread while it runs.
+        
+        Args:
+            symbol: Stock symbol
+            direction: Trading direction ('BUY' or 'SELL')
+            
+        Returns:
+            Dict with price, entry, stop loss and take profit data, or None on failure
+        """
+        ticker = None
         try:
             if not self.ib_manager.is_connected():
                 logger.error("Not connected to IB for price fetch")
@@ -160,42 +188,61 @@ class UnifiedDataService(BaseService, QObject):
                 logger.error("IB client not available")
                 return None
                 
-            # Create and qualify contract
-            contract = Stock(symbol, 'SMART', 'USD')
+            started = time.perf_counter()
+            # Registered contracts skip qualification; unknown ones resolve by symbol
+            contract = contract_registry.get_cached(symbol) or Stock(symbol, 'SMART', 'USD')
+            
+            # Fire all requests at once - IB resolves SMART/USD stocks without a conId.
+            # Pooled lines already streaming for this symbol answer immediately.
+            ticker = market_data_pool.acquire(symbol, contract)
+            if ticker is None:
+                logger.error(f"No market data line available for {symbol}")
+                return None
+            first_tick_timeout = PRICE_FETCH_CONFIG.get('first_tick_timeout_seconds', 1.0)
+            fetch_timeout = PRICE_FETCH_CONFIG.get('timeout_seconds', 5)
+            
+            requests = asyncio.gather(
+                contract_registry.qualify_async(symbol),
+                ib.reqHistoricalDataAsync(
+                    contract,
+                    endDateTime='',
+                    durationStr='1 D',
+                    barSizeSetting='5 mins',
+                    whatToShow='TRADES',
+                    useRTH=True,
+                    formatDate=1,
+                    keepUpToDate=False
+                ),
+                ib.reqHistoricalDataAsync(
+                    contract,
+                    endDateTime='',
+                    durationStr='5 D',
+                    barSizeSetting='1 day',
+                    whatToShow='TRADES',
+                    useRTH=True,
+                    formatDate=1
+                ),
+                self._wait_for_first_tick(ticker, first_tick_timeout),
+                return_exceptions=True
+            )
             try:
-                qualified_contracts = ib.qualifyContracts(contract)
-                if qualified_contracts:
-                    contract = qualified_contracts[0]
-                    logger.info(f"Contract qualified for {symbol}")
-                else:
-                    logger.warning(f"No qualified contracts returned for {symbol}")
-                    return None
-            except Exception as e:
-                logger.error(f"Error qualifying contract for {symbol}: {str(e)}")
+                qualified_contract, bars_5min, bars_daily, _ = await asyncio.wait_for(requests, fetch_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Price fetch for {symbol} timed out after {fetch_timeout}s")
                 return None
             
-            # Request market data with responsive waiting
-            ticker = ib.reqMktData(contract, '', False, False)
-            logger.info(f"Requested market data for {symbol}")
-            
-            # Wait for data with UI responsiveness
-            self._wait_for_market_data(ticker, symbol)
+            if isinstance(qualified_contract, Exception) or not qualified_contract:
+                logger.warning(f"No qualified contracts returned for {symbol}")
+                return None
             
             # Extract current price using validation
             current_price = self._extract_current_price(ticker, symbol)
-            
-            # Cancel subscription
-            try:
-                ib.cancelMktData(contract)
-            except Exception as cancel_error:
-                logger.warning(f"Error canceling market data for {symbol}: {cancel_error}")
-            
             if not current_price:
                 logger.error(f"No valid price data for {symbol}")
                 return None
                 
-            # Get historical data for stop loss calculations
-            stop_levels = self._fetch_historical_stop_levels(ib, contract, symbol, direction)
+            # Historical data for stop loss calculations
+            stop_levels = self._extract_stop_levels(bars_5min, bars_daily, symbol)
             
             # Calculate business logic values
             entry_price = self._calculate_entry_price(ticker, direction, current_price)
@@ -223,31 +270,55 @@ class UnifiedDataService(BaseService, QObject):
                 'timestamp': datetime.now()
             }
             
-            logger.info(f"Successfully fetched comprehensive data for {symbol}: ${current_price:.2f}")
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"Successfully fetched comprehensive data for {symbol}: ${current_price:.2f} ({elapsed_ms:.0f}ms)")
             return result
             
         except Exception as e:
             logger.error(f"Error fetching price and stops for {symbol}: {str(e)}")
             return None
+        finally:
+            # Line stays warm in the pool for the chart and repeat fetches
+            if ticker is not None:
+                market_data_pool.release(symbol)
             
-    def _wait_for_market_data(self, ticker: Ticker, symbol: str):
-        """Wait for market data with UI responsiveness"""
-        max_wait_attempts = 3
-        wait_times = [0.3, 0.3, 0.2]  # Total 0.8s
+    async def _wait_for_first_tick(self, ticker: Ticker, timeout: float) -> bool:
+        """
+        Wait for the first ticker update carrying a valid bid, ask or last price
         
-        for attempt, wait_time in enumerate(wait_times):
-            has_valid_data = (
-                self._is_valid_price(ticker.last) or
-                self._is_valid_price(ticker.bid) or
-                self._is_valid_price(ticker.ask) or
-                self._is_valid_price(ticker.close)
-            )
+        Args:
+            ticker: Ticker returned by reqMktData
+            timeout: Maximum seconds to wait
             
-            if has_valid_data:
-                logger.info(f"Got valid price data for {symbol} on attempt {attempt + 1}")
-                break
+        Returns:
+            True if a valid price arrived, False on timeout
+        """
+        if self._has_live_price(ticker):
+            return True
+            
+        first_tick = asyncio.get_event_loop().create_future()
+        
+        def on_update(updated_ticker):
+            if not first_tick.done() and self._has_live_price(updated_ticker):
+                first_tick.set_result(True)
                 
-            self._responsive_wait(wait_time)
+        ticker.updateEvent += on_update
+        try:
+            return await asyncio.wait_for(first_tick, timeout)
+        except asyncio.TimeoutError:
+            # Fall back to whatever arrived (e.g. close only after hours)
+            logger.warning(f"No live tick for {ticker.contract.symbol} within {timeout:.1f}s")
+            return False
+        finally:
+            ticker.updateEvent -= on_update
+            
+    def _has_live_price(self, ticker: Ticker) -> bool:
+        """Check if a ticker carries a valid bid, ask or last price"""
+        return (
+            self._is_valid_price(ticker.last) or
+            self._is_valid_price(ticker.bid) or
+            self._is_valid_price(ticker.ask)
+        )
             
     def _extract_current_price(self, ticker: Ticker, symbol: str) -> Optional[float]:
         """Extract current price with fallback logic"""
@@ -264,42 +335,23 @@ class UnifiedDataService(BaseService, QObject):
         logger.error(f"No valid price found for {symbol}")
         return None
         
-    def _fetch_historical_stop_levels(self, ib, contract: Contract, symbol: str, direction: str) -> Dict[str, float]:
-        """Fetch historical data for stop loss calculations"""
+    def _extract_stop_levels(self, bars_5min, bars_daily, symbol: str) -> Dict[str, float]:
+        """Extract stop loss reference levels from 5-minute and daily bars"""
         stop_levels = {}
         
         try:
-            # Get 5-minute bars for prior bar analysis
-            bars_5min = ib.reqHistoricalData(
-                contract,
-                endDateTime='',
-                durationStr='1 D',
-                barSizeSetting='5 mins',
-                whatToShow='TRADES',
-                useRTH=True,
-                formatDate=1,
-                keepUpToDate=False
-            )
-            
-            if bars_5min and len(bars_5min) >= 2:
+            if isinstance(bars_5min, Exception):
+                logger.error(f"Error fetching 5min bars for {symbol}: {str(bars_5min)}")
+            elif bars_5min and len(bars_5min) >= 2:
                 prior_bar = bars_5min[-2]
                 current_bar = bars_5min[-1]
                 stop_levels['prior_5min_low'] = prior_bar.low
                 stop_levels['current_5min_low'] = current_bar.low
                 logger.info(f"5min bars: Prior=${prior_bar.low:.2f}, Current=${current_bar.low:.2f}")
             
-            # Get daily bars for day low analysis
-            bars_daily = ib.reqHistoricalData(
-                contract,
-                endDateTime='',
-                durationStr='5 D',
-                barSizeSetting='1 day',
-                whatToShow='TRADES',
-                useRTH=True,
-                formatDate=1
-            )
-            
-            if bars_daily and len(bars_daily) >= 1:
+            if isinstance(bars_daily, Exception):
+                logger.error(f"Error fetching daily bars for {symbol}: {str(bars_daily)}")
+            elif bars_daily and len(bars_daily) >= 1:
                 current_day = bars_daily[-1]
                 stop_levels['day_low'] = current_day.low
                 if len(bars_daily) >= 2:
@@ -307,7 +359,7 @@ class UnifiedDataService(BaseService, QObject):
                     stop_levels['prior_day_low'] = prior_day.low
                     
         except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
+            logger.error(f"Error processing historical data for {symbol}: {str(e)}")
             
         # Add percentage-based fallback
         if 'prior_5min_low' not in stop_levels:
@@ -487,11 +539,7 @@ class UnifiedDataService(BaseService, QObject):
                 return
                 
             # Publish processed data
-            publish_event(
-                EventType.PRICE_UPDATE,
-                price_data,
-                'UnifiedDataService'
-            )
+            publish_payload(PriceUpdate.from_dict(price_data), 'UnifiedDataService')
             
             # Notify direct callbacks for backward compatibility
             for callback in self.price_update_callbacks:
@@ -600,29 +648,6 @@ class UnifiedDataService(BaseService, QObject):
         except (ValueError, TypeError):
             return False
             
-    def _responsive_wait(self, seconds: float):
-        """Non-blocking wait that keeps UI responsive"""
-        try:
-            import time
-            chunk_size = 0.05  # 50ms chunks
-            total_chunks = int(seconds / chunk_size)
-            remaining_time = seconds % chunk_size
-            
-            QApplication.processEvents()
-            
-            for _ in range(total_chunks):
-                time.sleep(chunk_size)
-                QApplication.processEvents()
-                
-            if remaining_time > 0:
-                time.sleep(remaining_time)
-                QApplication.processEvents()
-                
-        except Exception as e:
-            logger.warning(f"Error in responsive wait: {e}")
-            import time
-            time.sleep(seconds)
-            
     def cleanup_subscriptions(self):
         """Clean up any active market data subscriptions"""
         try:
@@ -0,0 +1,369 @@
+"""
+Chart Backend Interface
+Contract between ChartWidget and the candlestick renderers it can embed
+"""
+
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QObject
+
+from src.utils.logger import logger
+from src.core.bar_frame import BarFrame
+from src.services.technical_indicator_service import indicator_optimizer
+from src.ui.chart_optimizer import chart_optimizer
+from config import CHART_WIDGET_CONFIG
+
+
+# Candle colors shared by every backend
+UP_COLOR = '#26a69a'
+DOWN_COLOR = '#ef5350'
+
+# Indicator lines: label -> (color, linewidth, alpha)
+INDICATOR_STYLES = {
+    'EMA 5': ('#FFFFFF', 1.0, 0.8),
+    'EMA 10': ('#FF69B4', 1.0, 0.8),
+    'EMA 21': ('#FFD700', 1.0, 0.8),
+    'SMA 50': ('#32CD32', 1.0, 0.7),
+    'SMA 100': ('#6A5ACD', 1.0, 0.7),
+    'SMA 200': ('#00FFFF', 1.0, 0.7),
+    'VWAP': ('#FFA500', 1.2, 0.9),
+}
+
+
+def compute_indicator_lines(bars: BarFrame, days: np.ndarray, timeframe: str, show_emas: bool,
+                            show_smas: bool, show_vwap: bool) -> Dict[str, np.ndarray]:
+    """
+    Calculate the enabled indicator lines for a render
+
+    Args:
+        bars: Bars being rendered
+        days: Session day per bar (bars.session_days())
+        timeframe: Chart timeframe ('1d' uses cumulative VWAP, intraday resets per session)
+        show_emas, show_smas, show_vwap: Enabled indicator groups
+
+    Returns:
+        Dict of legend label -> values, in INDICATOR_STYLES order
+    """
+    closes = bars.close
+    lines = {}
+    if show_emas:
+        for period in (5, 10, 21):
+            lines[f'EMA {period}'] = indicator_optimizer.calculate_ema_optimized(closes, period)
+    if show_smas:
+        for period in (50, 100, 200):
+            lines[f'SMA {period}'] = indicator_optimizer.calculate_sma_optimized(closes, period)
+    if show_vwap:
+        if timeframe == '1d':
+            lines['VWAP'] = indicator_optimizer.calculate_vwap_optimized(bars.high, bars.low, closes, bars.volume)
+        else:
+            lines['VWAP'] = indicator_optimizer.calculate_session_vwap_optimized(
+                bars.high, bars.low, closes, bars.volume, days)
+    return lines
+
+
+def time_axis_ticks(local_times: np.ndarray, timeframe: str) -> Tuple[List[int], List[str]]:
+    """
+    Choose x-axis tick positions and labels that do not overlap
+    
+    Args:
+        local_times: Eastern wall-clock bar times as datetime64[s]
+        timeframe: Chart timeframe
+        
+    Returns:
+        (bar indices, labels)
+    """
+    try:
+        total_bars = len(local_times)
+        
+        # Define optimal intervals based on timeframe to avoid overlapping (1-hour spacing)
+        timeframe_intervals = {
+            '1m': 60,   # Every 1 hour = 60 bars
+            '3m': 20,   # Every 1 hour = 20 bars  
+            '5m': 12,   # Every 1 hour = 12 bars
+            '15m': 4,   # Every 1 hour = 4 bars
+            '30m': 2,   # Every 1 hour = 2 bars
+            '1h': 1,    # Every 1 hour = 1 bar
+            '4h': 1,    # Every 4 hours = 1 bar
+            '1d': 1     # Every day = 1 bar
+        }
+        
+        # Get the optimal step for this timeframe
+        optimal_step = timeframe_intervals.get(timeframe, 12)  # Default to 12 for 5m (1 hour)
+        
+        # For very small datasets, show more labels
+        if total_bars <= 10:
+            step = 1
+        elif total_bars <= 20:
+            step = max(2, optimal_step // 2)
+        else:
+            step = optimal_step
+        
+        # Ensure we don't skip too many bars for small datasets
+        step = min(step, max(1, total_bars // 4))
+        
+        # Find the best starting point (try to start on clean time boundaries)
+        start_index = 0
+        if total_bars > step:
+            # Try to find a nice starting time (prioritize hour boundaries :00)
+            minutes = local_times[:step].astype('datetime64[m]').astype(np.int64) % 60
+            for i in range(min(step, total_bars)):
+                minute = minutes[i]
+                if minute == 0:  # Start on hour boundary
+                    start_index = i
+                    break
+                elif minute == 30 and start_index == 0:  # Fallback to half-hour if no hour found
+                    start_index = i
+        
+        # Add indices at regular intervals
+        indices = list(range(start_index, total_bars, step))
+        
+        # Always include the last bar if it's not too close to the previous one
+        if indices and total_bars - 1 - indices[-1] >= step // 2:
+            indices.append(total_bars - 1)
+        
+        # Format labels based on timeframe and time span (only labeled bars become datetimes)
+        multi_day = local_times[-1].astype('datetime64[D]') != local_times[0].astype('datetime64[D]')
+        labels = []
+        for time_obj in local_times[indices].astype(object):
+            # For intraday timeframes, show time in Eastern Time (no timezone indicator)
+            if timeframe in ['1m', '3m', '5m', '15m', '30m', '1h']:
+                if total_bars > 50 and multi_day:
+                    # Multiple days - show date and time
+                    labels.append(time_obj.strftime('%m/%d %H:%M'))
+                else:
+                    # Single day - show time only
+                    labels.append(time_obj.strftime('%H:%M'))
+            else:
+                # For daily+ timeframes, show date
+                labels.append(time_obj.strftime('%m/%d'))
+        return indices, labels
+        
+    except Exception as e:
+        logger.error(f"Error formatting time axis: {e}")
+        # Fallback to simple labeling
+        step = max(1, len(local_times) // 6)
+        indices = list(range(0, len(local_times), step))
+        return indices, [t.strftime('%H:%M') for t in local_times[indices].astype(object)]
+
+
+class RenderPayload:
+    """
+    Ready-to-draw chart state for one full render
+    
+    Built by build_render_payload (normally on the render worker thread) so
+    the GUI thread only has to push arrays into existing artists.
+    
+    Attributes:
+        generation: Request number; payloads from superseded requests are dropped
+        source_data: Full-resolution bars
+        data: Bars actually rendered (LOD-downsampled when large)
+        lod_bucket: Source bars per rendered candle
+        local_times: Eastern wall-clock times of the rendered bars
+        indicators: Legend label -> indicator values
+        boundaries: x positions of the session separators
+        tick_indices, tick_labels: Time axis ticks
+        x_range: Initial visible x-range in rendered bar indices
+        price_range: (lowest low, highest high) of the visible bars
+        max_volume: Highest volume of the visible bars
+        geometry: Backend-specific arrays filled by ChartBackend.prepare_geometry
+    """
+    
+    __slots__ = ('generation', 'symbol', 'timeframe', 'show_emas', 'show_smas', 'show_vwap',
+                 'source_data', 'data', 'lod_bucket', 'local_times', 'indicators', 'boundaries',
+                 'tick_indices', 'tick_labels', 'x_range', 'price_range', 'max_volume', 'geometry')
+    
+    def __init__(self, generation: int, symbol: str, timeframe: str, show_emas: bool, show_smas: bool,
+                 show_vwap: bool, source_data: BarFrame):
+        self.generation = generation
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.show_emas = show_emas
+        self.show_smas = show_smas
+        self.show_vwap = show_vwap
+        self.source_data = source_data
+        self.data = source_data
+        self.lod_bucket = 1
+        self.local_times = None
+        self.indicators: Dict[str, np.ndarray] = {}
+        self.boundaries = np.zeros(0)
+        self.tick_indices: List[int] = []
+        self.tick_labels: List[str] = []
+        self.x_range = (-0.5, len(source_data) - 0.5)
+        self.price_range = (0.0, 0.0)
+        self.max_volume = 0.0
+        self.geometry: Any = None
+        
+    @property
+    def render_key(self) -> Tuple[str, str, bool, bool, bool]:
+        """Identity compared by delta updates"""
+        return (self.symbol, self.timeframe, self.show_emas, self.show_smas, self.show_vwap)
+
+
+def visible_ranges(bars: BarFrame, x_min: float, x_max: float) -> Optional[Tuple[float, float, float]]:
+    """
+    Get the price and volume extent of the bars inside an x-range
+    
+    Args:
+        bars: Rendered bars
+        x_min, x_max: Visible range in bar indices
+        
+    Returns:
+        (lowest low, highest high, highest volume), or None if no bar is visible
+    """
+    first = max(0, int(np.ceil(x_min)))
+    stop = min(len(bars), int(np.floor(x_max)) + 1)
+    if stop <= first:
+        return None
+    visible = bars.slice(first, stop)
+    price_min, price_max = visible.price_range()
+    return price_min, price_max, float(np.max(visible.volume))
+
+
+def build_render_payload(data: BarFrame, symbol: str, timeframe: str, show_emas: bool = True,
+                         show_smas: bool = True, show_vwap: bool = True,
+                         pixel_width: Optional[float] = None, generation: int = 0,
+                         view_range: Optional[Tuple[float, float]] = None) -> RenderPayload:
+    """
+    Do all the per-render preparation that does not touch widgets
+    
+    Safe to call from a worker thread.
+    
+    Args:
+        data: Full-resolution bars
+        symbol, timeframe: Chart identity
+        show_emas, show_smas, show_vwap: Enabled indicator groups
+        pixel_width: Plot width in pixels for level-of-detail downsampling (None disables it)
+        generation: Request number carried through to the payload
+        view_range: Visible range in data indices to show (None fits all bars)
+        
+    Returns:
+        RenderPayload without backend geometry
+    """
+    payload = RenderPayload(generation, symbol, timeframe, show_emas, show_smas, show_vwap, data)
+    
+    # Large datasets are rendered at a level of detail that fits the visible bars into the pixel width
+    x_min, x_max = view_range if view_range is not None else (0, len(data))
+    if pixel_width and len(data) > CHART_WIDGET_CONFIG['performance']['downsample_threshold']:
+        payload.data, payload.lod_bucket = chart_optimizer.level_for_view(
+            data, x_min, x_max, pixel_width, key=(symbol, timeframe))
+        logger.info(f"Large dataset ({len(data)} bars), rendering {len(payload.data)} bars at {payload.lod_bucket} bars per candle")
+    bars = payload.data
+    
+    # Eastern wall times and session days are converted in one vectorized pass
+    payload.local_times = bars.local_times()
+    days = bars.session_days()
+    payload.indicators = compute_indicator_lines(bars, days, timeframe, show_emas, show_smas, show_vwap)
+    
+    # Day separators only for intraday timeframes
+    if timeframe not in ['1d', '1w', '1M']:
+        payload.boundaries = np.flatnonzero(np.diff(days)) + 0.5
+    payload.tick_indices, payload.tick_labels = time_axis_ticks(payload.local_times, timeframe)
+    
+    # Initial view, with the y-range fitted to the bars inside it
+    extent = None
+    if view_range is not None:
+        payload.x_range = (x_min / payload.lod_bucket, x_max / payload.lod_bucket)
+        extent = visible_ranges(bars, *payload.x_range)
+    else:
+        payload.x_range = (-0.5, len(bars) - 0.5)
+    if extent is None:
+        price_min, price_max = bars.price_range()
+        extent = (price_min, price_max, float(np.max(bars.volume)))
+    payload.price_range = extent[:2]
+    payload.max_volume = extent[2]
+    return payload
+
+
+class _ChartBackendMeta(type(QObject), ABCMeta):
+    """Lets ChartBackend be abstract while backends also derive from Qt widgets"""
+
+
+class ChartBackend(metaclass=_ChartBackendMeta):
+    """
+    Interface implemented by chart renderers embedded in ChartWidget
+
+    Implementations render candles, volume, indicator lines, day separators
+    and a crosshair, and supply a PriceLevelManager wired to their own
+    artists so the widget's price-level signals work unchanged. User pans
+    and zooms are reported through a bar_range_changed(first, last) Qt
+    signal in source bar indices. Backends missing an abstract method fail
+    at construction.
+
+    Attributes:
+        current_data: BarFrame currently rendered (None before the first plot)
+        source_data: Full-resolution bars behind current_data
+        lod_bucket: Source bars per rendered candle (x * lod_bucket is a source index)
+        price_ax: Price plot handed to PriceLevelManager.set_chart_references
+    """
+
+    current_data: Optional[BarFrame] = None
+    source_data: Optional[BarFrame] = None
+    lod_bucket = 1
+    price_ax = None
+
+    def plot_candlestick_data(self, data: BarFrame, symbol: str, timeframe: str, show_emas: bool = True,
+                              show_smas: bool = True, show_vwap: bool = True,
+                              view_range: Optional[Tuple[float, float]] = None):
+        """Render a full dataset synchronously on the calling (GUI) thread"""
+        try:
+            if not data:
+                return
+            payload = build_render_payload(data, symbol, timeframe, show_emas, show_smas, show_vwap,
+                                           pixel_width=self.lod_pixel_width(), view_range=view_range)
+            self.prepare_geometry(payload)
+            self.apply_render(payload)
+            
+        except Exception as e:
+            logger.error(f"Error plotting candlestick data: {str(e)}")
+            
+    def lod_pixel_width(self) -> Optional[float]:
+        """Plot width used to pick a level of detail, or None to always render every bar"""
+        return None
+        
+    def prepare_geometry(self, payload: RenderPayload):
+        """
+        Fill payload.geometry with backend-specific arrays
+        
+        Runs on the render worker thread, so it must only read the payload
+        and immutable class constants, never widget or artist state.
+        """
+        pass
+        
+    @abstractmethod
+    def apply_render(self, payload: RenderPayload):
+        """Swap a prepared payload into the artists and fit the view (GUI thread)"""
+
+    def update_incremental(self, data: BarFrame, symbol: str, timeframe: str, show_emas: bool = True,
+                           show_smas: bool = True, show_vwap: bool = True) -> bool:
+        """Apply a refresh that only touches the newest bars; False if a full render is needed"""
+        return False
+
+    @abstractmethod
+    def get_price_range(self) -> Tuple[float, float]:
+        """Get the visible (low, high) price range"""
+
+    @abstractmethod
+    def set_price_range(self, low: float, high: float):
+        """Set the visible price range"""
+
+    @abstractmethod
+    def set_volume_range(self, max_volume: float):
+        """Set the volume axis to 0..max_volume"""
+
+    @abstractmethod
+    def set_bar_range(self, first: float, last: float):
+        """Set the visible x-range in bar indices"""
+
+    @abstractmethod
+    def redraw(self):
+        """Schedule a repaint after range changes"""
+
+    @abstractmethod
+    def create_price_level_manager(self):
+        """Create a PriceLevelManager that draws on this backend"""
+
+    def release(self):
+        """Release renderer resources (figures, timers) when the widget is torn down"""
+        pass
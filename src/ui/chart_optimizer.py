@@ -0,0 +1,180 @@
+"""
+Chart Optimizer
+OHLC-preserving level-of-detail (LOD) downsampling for candlestick rendering
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from src.core.bar_frame import BarFrame
+from src.utils.logger import logger
+from config import CHART_WIDGET_CONFIG
+
+
+class ChartOptimizer:
+    """
+    Builds and caches downsampled views of bar data
+    
+    Consecutive bars are merged into fixed-size buckets (open of the first,
+    max high, min low, close of the last, summed volume), so candles stay
+    truthful at any zoom. Bucket sizes are powers of two chosen from the
+    axes' pixel width and the visible bar range, and each level is cached per
+    dataset. Appending to or updating the end of a dataset only re-aggregates
+    the trailing bucket. The cache is locked because levels are built on the
+    render worker thread.
+    """
+    
+    def __init__(self):
+        performance = CHART_WIDGET_CONFIG['performance']
+        self.min_pixels_per_bar = performance['lod_min_pixels_per_bar']
+        self.max_points = performance['downsample_max_points']
+        self.cache_levels = performance['lod_cache_levels']
+        # (dataset key, bucket) -> (first time, source length, boundary time, LOD frame)
+        self._cache: "OrderedDict[Tuple[Any, int], Tuple[int, int, int, BarFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    @staticmethod
+    def aggregate(data: BarFrame, bucket: int) -> BarFrame:
+        """
+        Merge every `bucket` consecutive bars into one (the last bucket may be partial)
+        
+        Args:
+            data: Bars sorted by time
+            bucket: Bars per output bar
+            
+        Returns:
+            Aggregated bars, each labeled with its first bar's time
+        """
+        if bucket <= 1 or len(data) == 0:
+            return data
+        starts = np.arange(0, len(data), bucket)
+        ends = np.minimum(starts + bucket, len(data)) - 1
+        return BarFrame(
+            data.time[starts],
+            data.open[starts],
+            np.maximum.reduceat(data.high, starts),
+            np.minimum.reduceat(data.low, starts),
+            data.close[ends],
+            np.add.reduceat(data.volume, starts)
+        )
+        
+    def bucket_for_view(self, visible_bars: float, pixel_width: float, total_bars: Optional[int] = None) -> int:
+        """
+        Choose the bucket size for a view
+        
+        Args:
+            visible_bars: Number of source bars across the visible x-range
+            pixel_width: Width of the axes in pixels
+            total_bars: Dataset length, to also cap the rendered count at max_points
+            
+        Returns:
+            Bars per rendered candle (power of two, >= 1)
+        """
+        fit = max(1.0, pixel_width / self.min_pixels_per_bar)
+        bucket = math.ceil(visible_bars / fit)
+        if total_bars:
+            bucket = max(bucket, math.ceil(total_bars / self.max_points))
+        return 1 if bucket <= 1 else 1 << (bucket - 1).bit_length()
+    
+    def level_for_view(self, data: BarFrame, x_min: float, x_max: float, pixel_width: float,
+                       key: Any = None) -> Tuple[BarFrame, int]:
+        """
+        Get the LOD level that fits the visible range into the axes' pixel width
+        
+        Args:
+            data: Full-resolution bars
+            x_min, x_max: Visible range in source bar indices
+            pixel_width: Width of the axes in pixels
+            key: Dataset identity for caching (e.g. (symbol, timeframe))
+            
+        Returns:
+            (downsampled bars, bucket size); source index i maps to LOD index i // bucket
+        """
+        bucket = self.bucket_for_view(max(1.0, x_max - x_min), pixel_width, len(data))
+        return self.get_level(data, bucket, key), bucket
+    
+    def downsample_data(self, data: BarFrame, max_points: int = 800, key: Any = None) -> BarFrame:
+        """
+        Downsample to at most max_points bars
+        
+        Args:
+            data: Full-resolution bars
+            max_points: Maximum bars to render
+            key: Dataset identity for caching
+            
+        Returns:
+            Downsampled bars
+        """
+        bucket = max(1, math.ceil(len(data) / max(1, max_points)))
+        if bucket > 1:
+            bucket = 1 << (bucket - 1).bit_length()
+        return self.get_level(data, bucket, key)
+    
+    def get_level(self, data: BarFrame, bucket: int, key: Any = None) -> BarFrame:
+        """
+        Get one LOD level, reusing the cached aggregation where the data is unchanged
+        
+        Args:
+            data: Full-resolution bars
+            bucket: Bars per output bar
+            key: Dataset identity (no caching if None)
+            
+        Returns:
+            Aggregated bars
+        """
+        try:
+            if bucket <= 1 or len(data) == 0:
+                return data
+            if key is None:
+                return self.aggregate(data, bucket)
+            
+            cache_key = (key, bucket)
+            with self._lock:
+                cached = self._cache.get(cache_key)
+                level = None
+                if cached:
+                    first_time, source_length, boundary_time, cached_level = cached
+                    complete = source_length // bucket
+                    boundary = complete * bucket
+                    # Same history through the last complete bucket: only the tail changed
+                    if (int(data.time[0]) == first_time and len(data) >= source_length
+                            and (complete == 0 or int(data.time[boundary - 1]) == boundary_time)):
+                        tail = self.aggregate(data.slice(boundary, None), bucket)
+                        level = cached_level.slice(0, complete).merge(tail) if complete else tail
+                    
+                if level is None:
+                    level = self.aggregate(data, bucket)
+                
+                complete = len(data) // bucket
+                boundary_time = int(data.time[complete * bucket - 1]) if complete else 0
+                self._cache[cache_key] = (int(data.time[0]), len(data), boundary_time, level)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_levels:
+                    self._cache.popitem(last=False)
+            return level
+            
+        except Exception as e:
+            logger.error(f"Error building LOD level (bucket={bucket}): {str(e)}")
+            return data
+        
+    def clear(self, key: Any = None):
+        """
+        Drop cached LOD levels
+        
+        Args:
+            key: Dataset to drop, or None for all
+        """
+        with self._lock:
+            if key is None:
+                self._cache.clear()
+                return
+            for cache_key in [cache_key for cache_key in self._cache if cache_key[0] == key]:
+                del self._cache[cache_key]
+
+
+# Create singleton instance for global access
+chart_optimizer = ChartOptimizer()
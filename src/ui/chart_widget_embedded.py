@@ -3,7 +3,7 @@ Embedded Chart Widget
 Interactive candlestick chart using matplotlib for PyQt6 embedding
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import numpy as np
 import pytz
@@ -21,7 +21,8 @@ try:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
     from matplotlib.figure import Figure
     import matplotlib.pyplot as plt
-    from matplotlib.patches import Rectangle
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import to_rgba
     import pandas as pd
     CHARTS_AVAILABLE = True
 except ImportError:
@@ -32,16 +33,37 @@ except ImportError:
 # We draw candlesticks manually using matplotlib for better control
 
 from src.utils.logger import logger
+from src.core.bar_frame import BarFrame, EASTERN
 from src.services.chart_data_service import chart_data_manager
 from src.ui.price_levels import PriceLevelManager
+from src.ui.chart_backend import (
+    ChartBackend, RenderPayload, time_axis_ticks, visible_ranges, UP_COLOR, DOWN_COLOR, INDICATOR_STYLES
+)
+from src.ui.pyqtgraph_chart import PyQtGraphCandlestickChart, PYQTGRAPH_AVAILABLE
 from src.services.technical_indicator_service import indicator_optimizer
 from src.ui.non_blocking_chart_updater import NonBlockingChartMixin
 from src.ui.optimized_chart_mixin import OptimizedChartMixin
+from config import CHART_CONFIG, CHART_WIDGET_CONFIG
 
 
-class CandlestickChart(FigureCanvas):
+class CandlestickChart(FigureCanvas, ChartBackend):
     """Custom matplotlib canvas for candlestick charts"""
     
+    # User zoomed or panned the time axis (first, last visible source bar index)
+    bar_range_changed = pyqtSignal(float, float)
+    
+    # Most bars a delta update may append before falling back to a full render
+    MAX_APPENDED_BARS = 2
+    
+    # Mouse wheel: zoom factor per step, pan fraction of the visible span (with Shift)
+    SCROLL_ZOOM = 1.25
+    SCROLL_PAN = 0.1
+    MIN_VISIBLE_BARS = 10
+    
+    UP_COLOR = UP_COLOR
+    DOWN_COLOR = DOWN_COLOR
+    INDICATOR_STYLES = INDICATOR_STYLES
+    
     def __init__(self, parent=None):
         # Create figure with dark background
         self.fig = Figure(figsize=(10, 6), facecolor='#1e1e1e')
@@ -60,24 +82,89 @@ class CandlestickChart(FigureCanvas):
         # Style the axes
         self._style_axes()
         
-        # Crosshair variables
-        self.crosshair_v_price = None  # Vertical line in price chart
-        self.crosshair_v_volume = None # Vertical line in volume chart
-        self.crosshair_h = None       # Horizontal line in price chart
-        self.ohlc_text = None         # OHLC display text
+        # Overlay layer: animated artists blitted over a cached static background.
+        # The background is re-captured on every full draw (new data, pan/zoom, resize).
+        self._background = None
+        self._use_blitting = True
+        self._overlay_artists = []
+        self.mpl_connect('draw_event', self._on_draw)
+        for ax in (self.price_ax, self.volume_ax):
+            ax.callbacks.connect('xlim_changed', self._invalidate_background)
+            ax.callbacks.connect('ylim_changed', self._invalidate_background)
+        
+        # Persistent artists - updated in place on every redraw
+        self._create_artists()
         self.current_data = None      # Store current chart data
         
         # Connect mouse events for crosshair with optimized handling
         self.fig.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
         self.fig.canvas.mpl_connect('axes_leave_event', self._on_mouse_leave)
+        self.mpl_connect('scroll_event', self._on_scroll)
         
         # Performance optimization flags - reduced throttling for smoother experience
         self._last_crosshair_update = 0
         self._crosshair_throttle_ms = 16.67  # 60fps (1000ms/60fps = 16.67ms) - good balance
         
-        # Blitting optimization disabled - causing dual chart rendering issue
-        self._background = None
-        self._use_blitting = False
+    def _create_artists(self):
+        """Create the collections and lines reused by every redraw"""
+        self._up_rgba = to_rgba(self.UP_COLOR)
+        self._down_rgba = to_rgba(self.DOWN_COLOR)
+        
+        # Candles: one collection for wicks, one for bodies; volume bars in a third
+        self.wick_collection = LineCollection([], linewidths=1)
+        self.body_collection = PolyCollection([], linewidths=0.5)
+        self.volume_collection = PolyCollection([], linewidths=0, alpha=0.7)
+        self.price_ax.add_collection(self.wick_collection)
+        self.price_ax.add_collection(self.body_collection)
+        self.volume_ax.add_collection(self.volume_collection)
+        
+        # Day separators span the full axes height (x in data, y in axes coordinates)
+        separator_style = {'colors': '#555555', 'linestyles': '--', 'alpha': 0.7, 'linewidths': 1}
+        self.price_separators = LineCollection([], transform=self.price_ax.get_xaxis_transform(), **separator_style)
+        self.volume_separators = LineCollection([], transform=self.volume_ax.get_xaxis_transform(), **separator_style)
+        self.price_ax.add_collection(self.price_separators)
+        self.volume_ax.add_collection(self.volume_separators)
+        
+        self.indicator_lines = {}
+        for label, (color, linewidth, alpha) in self.INDICATOR_STYLES.items():
+            line, = self.price_ax.plot([], [], color=color, linewidth=linewidth, alpha=alpha, label=label)
+            line.set_visible(False)
+            self.indicator_lines[label] = line
+        self._legend_labels = None
+        
+        # Crosshair (overlay artists, hidden until the mouse enters the axes)
+        crosshair_props = {'color': '#888888', 'linestyle': '-', 'linewidth': 0.8, 'alpha': 0.8, 'visible': False}
+        self.crosshair_v_price = self.price_ax.axvline(x=0, **crosshair_props)   # Vertical line in price chart
+        self.crosshair_v_volume = self.volume_ax.axvline(x=0, **crosshair_props) # Vertical line in volume chart
+        self.crosshair_h = self.price_ax.axhline(y=0, **crosshair_props)         # Horizontal line in price chart
+        self.ohlc_text = self.price_ax.text(0.5, 0.99, '',                       # OHLC display text
+                                           transform=self.price_ax.transAxes,
+                                           fontsize=8,
+                                           fontfamily='monospace',
+                                           color='white',
+                                           bbox=dict(boxstyle='round,pad=0.2', 
+                                                   facecolor='#2e2e2e', 
+                                                   alpha=0.9,
+                                                   edgecolor='none'),
+                                           verticalalignment='top',
+                                           horizontalalignment='center',
+                                           visible=False)
+        for artist in (self.crosshair_v_price, self.crosshair_v_volume, self.crosshair_h, self.ohlc_text):
+            self.add_overlay_artist(artist)
+        
+        # Full-resolution bars behind the rendered (possibly LOD) current_data
+        self.source_data = None
+        self.lod_bucket = 1
+        
+        # Delta-update state: what the last full render showed
+        self._render_key = None
+        self._streaming_indicators = None
+        
+        self.title_text = self.price_ax.set_title('', color='white', fontsize=14, pad=10)
+        self.price_ax.set_ylabel('Price ($)', color='white')
+        self.volume_ax.set_ylabel('Volume', color='white')
+        self.volume_ax.set_xlabel('Time', color='white')
+        self._layout_done = False
         
     def _style_axes(self):
         """Apply dark theme styling to axes"""
@@ -92,401 +179,374 @@ class CandlestickChart(FigureCanvas):
             ax.xaxis.label.set_color('white')
             ax.yaxis.label.set_color('white')
     
-    def plot_candlestick_data(self, data: List[Dict[str, Any]], symbol: str, timeframe: str, show_emas: bool = True, show_smas: bool = True, show_vwap: bool = True):
-        """Plot candlestick and volume data with technical indicators"""
+    def lod_pixel_width(self) -> Optional[float]:
+        return self.price_ax.bbox.width
+    
+    def prepare_geometry(self, payload: RenderPayload):
+        """Build wick, body and volume vertices and colors (render worker thread)"""
+        data = payload.data
+        payload.geometry = self._candle_geometry(data.open, data.high, data.low, data.close, data.volume)
+    
+    def apply_render(self, payload: RenderPayload):
+        """Swap a prepared payload into the persistent artists and fit the view"""
         try:
-            # Clear previous plots
-            self.price_ax.clear()
-            self.volume_ax.clear()
-            
-            if not data:
-                return
-            
-            # Optimize data for large datasets
-            if len(data) > 1000:
-                logger.info(f"Large dataset ({len(data)} points), downsampling for performance")
-                data = chart_optimizer.downsample_data(data, max_points=800)
+            data = payload.data
+            symbol, timeframe = payload.symbol, payload.timeframe
             
             # Store data for crosshair
+            self.source_data = payload.source_data
+            self.lod_bucket = payload.lod_bucket
             self.current_data = data
-            
-            # Convert to arrays for easier manipulation (convert to Eastern Time)
-            eastern = pytz.timezone('US/Eastern')
-            times = [datetime.fromtimestamp(d['time'], tz=pytz.UTC).astimezone(eastern) for d in data]
-            opens = np.array([d['open'] for d in data])
-            highs = np.array([d['high'] for d in data])
-            lows = np.array([d['low'] for d in data])
-            closes = np.array([d['close'] for d in data])
-            volumes = np.array([d['volume'] for d in data])
-            
-            # Create candlestick chart with optimized drawing
-            # Pre-calculate all colors for better performance
-            colors = ['#26a69a' if closes[i] >= opens[i] else '#ef5350' for i in range(len(data))]
-            
-            # Draw all high-low lines at once for better performance
-            for i in range(len(data)):
-                # Draw high-low line
-                self.price_ax.plot([i, i], [lows[i], highs[i]], color=colors[i], linewidth=1)
-                
-                # Draw open-close rectangle
-                height = abs(closes[i] - opens[i])
-                bottom = min(opens[i], closes[i])
-                rect = Rectangle((i - 0.3, bottom), 0.6, height, 
-                               facecolor=colors[i], edgecolor=colors[i])
-                self.price_ax.add_patch(rect)
-            
-            # Plot volume bars with better visibility (reuse colors)
-            self.volume_ax.bar(range(len(data)), volumes, color=colors, alpha=0.7, width=0.8)
-            
-            # Set labels and title
-            self.price_ax.set_title(f'{symbol} - {timeframe}', color='white', fontsize=14, pad=10)
-            self.price_ax.set_ylabel('Price ($)', color='white')
-            self.volume_ax.set_ylabel('Volume', color='white')
-            self.volume_ax.set_xlabel('Time', color='white')
-            
-            # Calculate and plot technical indicators
-            self._plot_technical_indicators(closes, highs, lows, volumes, times, len(data), show_emas, show_smas, show_vwap, timeframe)
-            
-            # Add day separator lines (only for intraday timeframes)
-            if timeframe not in ['1d', '1w', '1M']:  # Skip for daily and higher timeframes
-                current_day = None
-                for i, time in enumerate(times):
-                    day = time.date()
-                    if current_day is not None and day != current_day:
-                        # Add vertical dashed line for new day
-                        self.price_ax.axvline(x=i-0.5, color='#555555', linestyle='--', alpha=0.7, linewidth=1)
-                        self.volume_ax.axvline(x=i-0.5, color='#555555', linestyle='--', alpha=0.7, linewidth=1)
-                    current_day = day
-            
-            # Format x-axis with intelligent time labeling
-            self._format_time_axis(times, timeframe)
-            
-            # Apply styling
-            self._style_axes()
+            self._render_key = payload.render_key
+            self._streaming_indicators = None  # Re-seeded lazily by the first delta update
+            
+            # Update candle and volume geometry in place (no per-bar artists)
+            if payload.geometry is None:
+                self.prepare_geometry(payload)
+            self._set_candle_geometry(*payload.geometry)
+            self.title_text.set_text(f'{symbol} - {timeframe}')
+            
+            # Technical indicators were calculated with the payload
+            self._plot_technical_indicators(payload.indicators, len(data))
+            
+            # Day separator lines (empty for daily and higher timeframes)
+            boundaries = payload.boundaries
+            segments = np.empty((len(boundaries), 2, 2))
+            segments[:, :, 0] = boundaries[:, None]
+            segments[:, 0, 1] = 0.0
+            segments[:, 1, 1] = 1.0
+            self.price_separators.set_segments(segments)
+            self.volume_separators.set_segments(segments)
+            
+            # Time labels were chosen with the payload
+            self._set_time_ticks(payload.tick_indices, payload.tick_labels)
             
             # Smart rescaling to new data range
             logger.info(f"Setting chart limits for {symbol} - Data range: {len(data)} bars")
-            if data:
-                price_min = min(d['low'] for d in data)
-                price_max = max(d['high'] for d in data)
-                logger.info(f"Price range: ${price_min:.2f} - ${price_max:.2f}")
-                
-                # Calculate reasonable margins
-                price_range = price_max - price_min
-                y_margin = max(price_range * 0.05, 0.01)  # 5% margin or minimum 1 cent
-                
-                # Set explicit, safe limits
-                self.price_ax.set_xlim(-0.5, len(data) - 0.5)
-                self.price_ax.set_ylim(price_min - y_margin, price_max + y_margin)
-                
-                # Volume limits
-                max_volume = max(d['volume'] for d in data) if data else 1000
-                self.volume_ax.set_xlim(-0.5, len(data) - 0.5)
-                self.volume_ax.set_ylim(0, max_volume * 1.1)  # 10% margin above max volume
-                
-                logger.info(f"Chart limits set - Price Y: {self.price_ax.get_ylim()}, X: {self.price_ax.get_xlim()}")
-            else:
-                logger.warning("No data available for chart scaling")
-            
-            # Redraw with optimized margins - use tight_layout for better performance
-            self.fig.tight_layout()
-            self.draw()
+            price_min, price_max = payload.price_range
+            logger.info(f"Price range: ${price_min:.2f} - ${price_max:.2f}")
             
-            # Blitting disabled - using optimized draw_idle() instead for stable rendering
-            
-        except Exception as e:
-            logger.error(f"Error plotting candlestick data: {str(e)}")
-    
-    def _format_time_axis(self, times: list, timeframe: str):
-        """Format x-axis with appropriate time labels based on timeframe to avoid overlapping"""
-        try:
-            total_bars = len(times)
-            
-            # Define optimal intervals based on timeframe to avoid overlapping (1-hour spacing)
-            timeframe_intervals = {
-                '1m': 60,   # Every 1 hour = 60 bars
-                '3m': 20,   # Every 1 hour = 20 bars  
-                '5m': 12,   # Every 1 hour = 12 bars
-                '15m': 4,   # Every 1 hour = 4 bars
-                '30m': 2,   # Every 1 hour = 2 bars
-                '1h': 1,    # Every 1 hour = 1 bar
-                '4h': 1,    # Every 4 hours = 1 bar
-                '1d': 1     # Every day = 1 bar
-            }
+            # Calculate reasonable margins
+            price_range = price_max - price_min
+            y_margin = max(price_range * 0.05, 0.01)  # 5% margin or minimum 1 cent
             
-            # Get the optimal step for this timeframe
-            optimal_step = timeframe_intervals.get(timeframe, 12)  # Default to 12 for 5m (1 hour)
+            # Set explicit, safe limits (the whole dataset unless the payload carries a view)
+            self.set_bar_range(*payload.x_range)
+            self.price_ax.set_ylim(price_min - y_margin, price_max + y_margin)
             
-            # For very small datasets, show more labels
-            if total_bars <= 10:
-                step = 1
-            elif total_bars <= 20:
-                step = max(2, optimal_step // 2)
-            else:
-                step = optimal_step
-            
-            # Ensure we don't skip too many bars for small datasets
-            step = min(step, max(1, total_bars // 4))
-            
-            # Create indices for labels starting from a good time boundary
-            indices = []
-            
-            # Find the best starting point (try to start on clean time boundaries)
-            start_index = 0
-            if total_bars > step:
-                # Try to find a nice starting time (prioritize hour boundaries :00)
-                for i in range(min(step, total_bars)):
-                    time_obj = times[i]
-                    minute = time_obj.minute
-                    if minute == 0:  # Start on hour boundary
-                        start_index = i
-                        break
-                    elif minute == 30 and start_index == 0:  # Fallback to half-hour if no hour found
-                        start_index = i
-            
-            # Add indices at regular intervals
-            for i in range(start_index, total_bars, step):
-                indices.append(i)
-            
-            # Always include the last bar if it's not too close to the previous one
-            if indices and total_bars - 1 - indices[-1] >= step // 2:
-                indices.append(total_bars - 1)
-            
-            # Format labels based on timeframe and time span
-            labels = []
-            for i in indices:
-                time_obj = times[i]
-                
-                # For intraday timeframes, show time in Eastern Time (no timezone indicator)
-                if timeframe in ['1m', '3m', '5m', '15m', '30m', '1h']:
-                    # Check if we're spanning multiple days
-                    if total_bars > 50 and (times[-1].date() != times[0].date()):
-                        # Multiple days - show date and time
-                        labels.append(time_obj.strftime('%m/%d %H:%M'))
-                    else:
-                        # Single day - show time only
-                        labels.append(time_obj.strftime('%H:%M'))
-                else:
-                    # For daily+ timeframes, show date
-                    labels.append(time_obj.strftime('%m/%d'))
+            # Volume limits
+            max_volume = payload.max_volume or 1000
+            self.volume_ax.set_ylim(0, max_volume * 1.1)  # 10% margin above max volume
             
-            # Apply labels to the volume axis (which controls x-axis for both charts)
-            self.volume_ax.set_xticks(indices)
-            self.volume_ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=7)
+            logger.info(f"Chart limits set - Price Y: {self.price_ax.get_ylim()}, X: {self.price_ax.get_xlim()}")
             
-            # Reduce number of minor ticks for cleaner appearance
-            self.volume_ax.tick_params(axis='x', which='minor', length=0)
+            # Layout only needs computing once - the axes are never recreated
+            if not self._layout_done:
+                self.fig.tight_layout()
+                self._layout_done = True
+            self._invalidate_background()
+            self.draw_idle()
             
         except Exception as e:
-            logger.error(f"Error formatting time axis: {e}")
-            # Fallback to simple labeling
-            step = max(1, len(times) // 6)
-            indices = list(range(0, len(times), step))
-            labels = [times[i].strftime('%H:%M') for i in indices]
-            self.volume_ax.set_xticks(indices)
-            self.volume_ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=7)
+            logger.error(f"Error plotting candlestick data: {str(e)}")
     
-    def _calculate_ema(self, prices: np.ndarray, period: int) -> np.ndarray:
-        """Calculate Exponential Moving Average"""
-        try:
-            if len(prices) < period:
-                return np.full(len(prices), np.nan)
-            
-            alpha = 2.0 / (period + 1)
-            ema = np.zeros_like(prices)
-            ema[0] = prices[0]
-            
-            for i in range(1, len(prices)):
-                ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
-                
-            # Set first period-1 values to NaN
-            ema[:period-1] = np.nan
-            return ema
-            
-        except Exception as e:
-            logger.error(f"Error calculating EMA: {e}")
-            return np.full(len(prices), np.nan)
+    def _candle_geometry(self, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                         closes: np.ndarray, volumes: np.ndarray, start: int = 0):
+        """
+        Compute wick segments, body and volume vertices and colors for bars[start:]
+        
+        Only reads the candle colors, so it is safe on the render worker thread.
+        
+        Returns:
+            (wicks, bodies, volume_bars, colors)
+        """
+        x = np.arange(start, len(opens), dtype=np.float64)
+        o, h, l, c, v = (column[start:] for column in (opens, highs, lows, closes, volumes))
+        colors = np.where((c >= o)[:, None], self._up_rgba, self._down_rgba)
+        
+        wicks = np.empty((len(x), 2, 2))
+        wicks[:, :, 0] = x[:, None]
+        wicks[:, 0, 1] = l
+        wicks[:, 1, 1] = h
+        bodies = self._bar_verts(x, 0.3, np.minimum(o, c), np.maximum(o, c))
+        volume_bars = self._bar_verts(x, 0.4, np.zeros(len(x)), v)
+        return wicks, bodies, volume_bars, colors
     
-    def _calculate_sma(self, prices: np.ndarray, period: int) -> np.ndarray:
-        """Calculate Simple Moving Average"""
+    def _set_candles(self, opens: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                     closes: np.ndarray, volumes: np.ndarray, start: int = 0):
+        """
+        Set wick, body and volume geometry
+        
+        Args:
+            opens, highs, lows, closes, volumes: Columns for all bars
+            start: First bar whose geometry changed; earlier bars are reused
+        """
+        wicks, bodies, volume_bars, colors = self._candle_geometry(opens, highs, lows, closes, volumes, start)
+        if start:
+            wicks = np.concatenate((self._wicks[:start], wicks))
+            bodies = np.concatenate((self._bodies[:start], bodies))
+            volume_bars = np.concatenate((self._volume_bars[:start], volume_bars))
+            colors = np.concatenate((self._candle_colors[:start], colors))
+        self._set_candle_geometry(wicks, bodies, volume_bars, colors)
+        
+    def _set_candle_geometry(self, wicks: np.ndarray, bodies: np.ndarray, volume_bars: np.ndarray, colors: np.ndarray):
+        """Push complete candle geometry into the collections"""
+        self._wicks, self._bodies, self._volume_bars, self._candle_colors = wicks, bodies, volume_bars, colors
+        
+        self.wick_collection.set_segments(wicks)
+        self.wick_collection.set_color(colors)
+        self.body_collection.set_verts(bodies)
+        self.body_collection.set_facecolor(colors)
+        self.body_collection.set_edgecolor(colors)
+        self.volume_collection.set_verts(volume_bars)
+        self.volume_collection.set_facecolor(colors)
+        
+    def update_incremental(self, data: BarFrame, symbol: str, timeframe: str, show_emas: bool = True,
+                           show_smas: bool = True, show_vwap: bool = True) -> bool:
+        """
+        Apply a refresh that only changed the last bar or appended a few bars
+        
+        Only the affected candles and indicator tails are recomputed; axes,
+        legend and price-level artists stay in place and the canvas is
+        redrawn once.
+        
+        Returns:
+            True if handled, False if the caller needs a full plot_candlestick_data
+        """
         try:
-            if len(prices) < period:
-                return np.full(len(prices), np.nan)
-            
-            sma = np.full(len(prices), np.nan)
-            for i in range(period-1, len(prices)):
-                sma[i] = np.mean(prices[i-period+1:i+1])
-                
-            return sma
+            old = self.current_data
+            if (old is None or not len(old) or not data or timeframe == '1d' or self.lod_bucket > 1
+                    or len(data) > CHART_WIDGET_CONFIG['performance']['downsample_threshold']
+                    or self._render_key != (symbol, timeframe, show_emas, show_smas, show_vwap)):
+                return False
+            
+            # Same history up to the previously forming bar, at most MAX_APPENDED new bars
+            start = len(old) - 1
+            appended = len(data) - len(old)
+            if (not 0 <= appended <= self.MAX_APPENDED_BARS
+                    or data.time[0] != old.time[0] or data.time[start] != old.time[start]):
+                return False
+            
+            self.current_data = self.source_data = data
+            self._set_candles(data.open, data.high, data.low, data.close, data.volume, start)
+            self._update_indicator_tails(data, start)
+            
+            if appended:
+                # Grow a view anchored at the first bar, slide one following the live edge,
+                # leave a view of older bars alone
+                x_min, x_max = self.price_ax.get_xlim()
+                if x_max >= len(old) - 1:
+                    self.set_bar_range(x_min if x_min <= -0.5 else x_min + appended, x_max + appended)
+                self._format_time_axis(data.local_times(), timeframe)
+            
+            # Grow the y-range if the changed bars moved outside it
+            y_min, y_max = self.price_ax.get_ylim()
+            tail_low = float(np.min(data.low[start:]))
+            tail_high = float(np.max(data.high[start:]))
+            if tail_low < y_min or tail_high > y_max:
+                margin = max((max(tail_high, y_max) - min(tail_low, y_min)) * 0.05, 0.01)
+                self.price_ax.set_ylim(min(y_min, tail_low - margin), max(y_max, tail_high + margin))
+            tail_volume = float(np.max(data.volume[start:]))
+            if tail_volume > self.volume_ax.get_ylim()[1]:
+                self.volume_ax.set_ylim(0, tail_volume * 1.1)
+            
+            self._invalidate_background()
+            self.draw_idle()
+            return True
             
         except Exception as e:
-            logger.error(f"Error calculating SMA: {e}")
-            return np.full(len(prices), np.nan)
+            logger.error(f"Error applying incremental chart update: {str(e)}")
+            return False
     
-    def _calculate_vwap(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray) -> np.ndarray:
-        """Calculate Volume Weighted Average Price"""
-        try:
-            typical_prices = (highs + lows + closes) / 3
-            vwap = np.full(len(closes), np.nan)
-            
-            cumulative_volume = 0
-            cumulative_pv = 0
-            
-            for i in range(len(closes)):
-                cumulative_pv += typical_prices[i] * volumes[i]
-                cumulative_volume += volumes[i]
-                
-                if cumulative_volume > 0:
-                    vwap[i] = cumulative_pv / cumulative_volume
-                    
-            return vwap
+    def _update_indicator_tails(self, data: BarFrame, start: int):
+        """Advance the streaming indicators over bars[start:] and refresh the visible lines"""
+        _, _, show_emas, show_smas, show_vwap = self._render_key
+        if not (show_emas or show_smas or show_vwap):
+            return
             
-        except Exception as e:
-            logger.error(f"Error calculating VWAP: {e}")
-            return np.full(len(closes), np.nan)
+        indicators = self._streaming_indicators
+        if indicators is None or len(indicators) != start + 1:
+            indicators = indicator_optimizer.create_streaming_indicators(data.slice(0, start))
+            self._streaming_indicators = indicators
+        else:
+            indicators.update_last_bar(data.high[start], data.low[start], data.close[start],
+                                       data.volume[start], int(data.time[start]))
+            start += 1
+        for i in range(start, len(data)):
+            indicators.append_bar(data.high[i], data.low[i], data.close[i], data.volume[i], int(data.time[i]))
+            
+        x_indices = np.arange(len(data))
+        for label, values in indicators.arrays().items():
+            line = self.indicator_lines[label]
+            if line.get_visible():
+                line.set_data(x_indices, values)
+        
+    @staticmethod
+    def _bar_verts(x: np.ndarray, half_width: float, bottoms: np.ndarray, tops: np.ndarray) -> np.ndarray:
+        """Rectangle vertices (bars x 4 corners x xy) for a PolyCollection"""
+        verts = np.empty((len(x), 4, 2))
+        verts[:, 0, 0] = verts[:, 3, 0] = x - half_width
+        verts[:, 1, 0] = verts[:, 2, 0] = x + half_width
+        verts[:, 0, 1] = verts[:, 1, 1] = bottoms
+        verts[:, 2, 1] = verts[:, 3, 1] = tops
+        return verts
     
-    def _calculate_daily_vwap(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray, times: list) -> np.ndarray:
-        """Calculate VWAP separately for each day"""
+    def _on_scroll(self, event):
+        """Zoom the time axis around the cursor with the wheel; Shift+wheel pans"""
         try:
-            typical_prices = (highs + lows + closes) / 3
-            vwap = np.full(len(closes), np.nan)
-            
-            # Group data by day and calculate VWAP for each day
-            current_day = None
-            day_cumulative_pv = 0
-            day_cumulative_volume = 0
-            day_start_index = 0
-            
-            for i in range(len(closes)):
-                time_obj = times[i]
-                day = time_obj.date()
-                
-                # Check if we've moved to a new day
-                if current_day is not None and day != current_day:
-                    # Reset cumulative values for new day
-                    day_cumulative_pv = 0
-                    day_cumulative_volume = 0
-                    day_start_index = i
-                
-                # Add current bar to daily calculation
-                day_cumulative_pv += typical_prices[i] * volumes[i]
-                day_cumulative_volume += volumes[i]
+            if event.inaxes not in (self.price_ax, self.volume_ax) or self.current_data is None:
+                return
                 
-                # Calculate VWAP for current bar
-                if day_cumulative_volume > 0:
-                    vwap[i] = day_cumulative_pv / day_cumulative_volume
+            x_min, x_max = self.price_ax.get_xlim()
+            span = x_max - x_min
+            if event.key == 'shift':
+                shift = span * self.SCROLL_PAN * (-1 if event.button == 'up' else 1)
+                x_min, x_max = x_min + shift, x_max + shift
+            else:
+                scale = 1 / self.SCROLL_ZOOM if event.button == 'up' else self.SCROLL_ZOOM
+                if span * scale < self.MIN_VISIBLE_BARS:
+                    return
+                anchor = event.xdata
+                x_min = anchor - (anchor - x_min) * scale
+                x_max = anchor + (x_max - anchor) * scale
                 
-                current_day = day
-                    
-            return vwap
+            self.set_bar_range(x_min, x_max)
+            self._fit_price_to_view()
+            self.draw_idle()
+            self.bar_range_changed.emit(x_min * self.lod_bucket, x_max * self.lod_bucket)
             
         except Exception as e:
-            logger.error(f"Error calculating daily VWAP: {e}")
-            return np.full(len(closes), np.nan)
+            logger.error(f"Error handling chart scroll: {e}")
+            
+    def _fit_price_to_view(self):
+        """Fit the price and volume axes to the bars inside the visible x-range"""
+        extent = visible_ranges(self.current_data, *self.price_ax.get_xlim())
+        if extent is None:
+            return
+        price_min, price_max, max_volume = extent
+        y_margin = max((price_max - price_min) * 0.05, 0.01)
+        self.price_ax.set_ylim(price_min - y_margin, price_max + y_margin)
+        self.volume_ax.set_ylim(0, (max_volume or 1000) * 1.1)
+    
+    # ============================================================================
+    # CHART BACKEND INTERFACE
+    # ============================================================================
+    
+    def get_price_range(self) -> Tuple[float, float]:
+        return self.price_ax.get_ylim()
     
-    def _plot_technical_indicators(self, closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, volumes: np.ndarray, times: list, data_length: int, show_emas: bool, show_smas: bool, show_vwap: bool, timeframe: str):
-        """Plot technical indicators on the price chart with optimized calculations"""
+    def set_price_range(self, low: float, high: float):
+        self.price_ax.set_ylim(low, high)
+        
+    def set_volume_range(self, max_volume: float):
+        self.volume_ax.set_ylim(0, max_volume)
+        
+    def set_bar_range(self, first: float, last: float):
+        self.price_ax.set_xlim(first, last)
+        self.volume_ax.set_xlim(first, last)
+        
+    def redraw(self):
+        self.draw_idle()
+        
+    def create_price_level_manager(self) -> PriceLevelManager:
+        return PriceLevelManager()
+    
+    def release(self):
+        plt.close(self.fig)
+    
+    def _format_time_axis(self, local_times: np.ndarray, timeframe: str):
+        """Format x-axis with appropriate time labels based on timeframe to avoid overlapping
+        
+        Args:
+            local_times: Eastern wall-clock bar times as datetime64[s]
+            timeframe: Chart timeframe
+        """
+        self._set_time_ticks(*time_axis_ticks(local_times, timeframe))
+        
+    def _set_time_ticks(self, indices: List[int], labels: List[str]):
+        """Apply tick labels to the volume axis (which controls x-axis for both charts)"""
+        self.volume_ax.set_xticks(indices)
+        self.volume_ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=7)
+        
+        # Reduce number of minor ticks for cleaner appearance
+        self.volume_ax.tick_params(axis='x', which='minor', length=0)
+    
+    def _plot_technical_indicators(self, series: Dict[str, np.ndarray], data_length: int):
+        """Plot precomputed technical indicators on the price chart"""
         try:
-            x_indices = range(data_length)
+            # Update the persistent indicator lines
+            x_indices = np.arange(data_length)
             labels = []
-            
-            # Check cache first
-            data_dict = {
-                'closes': closes.tolist(),
-                'highs': highs.tolist(), 
-                'lows': lows.tolist(),
-                'volumes': volumes.tolist(),
-                'times': [t.timestamp() for t in times]
-            }
-            
-            # Chart cache was removed during consolidation - skip caching for now
-            cached_indicators = None
-            
-            if cached_indicators:
-                # Use cached calculations
-                if show_emas and 'emas' in cached_indicators:
-                    ema5, ema10, ema21 = cached_indicators['emas']
-                else:
-                    ema5 = ema10 = ema21 = None
-                    
-                if show_smas and 'smas' in cached_indicators:
-                    sma50, sma100, sma200 = cached_indicators['smas']
-                else:
-                    sma50 = sma100 = sma200 = None
-                    
-                if show_vwap and 'vwap' in cached_indicators:
-                    vwap = cached_indicators['vwap']
-                else:
-                    vwap = None
-            else:
-                # Calculate indicators with optimized methods
-                calculations = {}
-                
-                # Plot EMAs if enabled
-                if show_emas:
-                    ema5 = indicator_optimizer.calculate_ema_optimized(closes, 5)
-                    ema10 = indicator_optimizer.calculate_ema_optimized(closes, 10)
-                    ema21 = indicator_optimizer.calculate_ema_optimized(closes, 21)
-                    calculations['emas'] = (ema5, ema10, ema21)
-                else:
-                    ema5 = ema10 = ema21 = None
-                    
-                # Calculate SMAs if enabled
-                if show_smas:
-                    sma50 = indicator_optimizer.calculate_sma_optimized(closes, 50)
-                    sma100 = indicator_optimizer.calculate_sma_optimized(closes, 100)
-                    sma200 = indicator_optimizer.calculate_sma_optimized(closes, 200)
-                    calculations['smas'] = (sma50, sma100, sma200)
-                else:
-                    sma50 = sma100 = sma200 = None
-                    
-                # Calculate VWAP if enabled
-                if show_vwap:
-                    if timeframe == '1d':
-                        vwap = indicator_optimizer.calculate_vwap_optimized(highs, lows, closes, volumes)
-                    else:
-                        vwap = self._calculate_daily_vwap(highs, lows, closes, volumes, times)
-                    calculations['vwap'] = vwap
-                else:
-                    vwap = None
-                
-                # Chart cache was removed during consolidation - skip caching for now
-                # chart_cache.store_calculations("indicators", timeframe, [data_dict], calculations)
-            
-            # Plot EMAs if enabled
-            if show_emas and ema5 is not None:
-                self.price_ax.plot(x_indices, ema5, color='#FFFFFF', linewidth=1.0, alpha=0.8, label='EMA 5')
-                self.price_ax.plot(x_indices, ema10, color='#FF69B4', linewidth=1.0, alpha=0.8, label='EMA 10')
-                self.price_ax.plot(x_indices, ema21, color='#FFD700', linewidth=1.0, alpha=0.8, label='EMA 21')
-                labels.extend(['EMA 5', 'EMA 10', 'EMA 21'])
-            
-            # Plot SMAs if enabled
-            if show_smas and sma50 is not None:
-                self.price_ax.plot(x_indices, sma50, color='#32CD32', linewidth=1.0, alpha=0.7, label='SMA 50')
-                self.price_ax.plot(x_indices, sma100, color='#6A5ACD', linewidth=1.0, alpha=0.7, label='SMA 100')
-                self.price_ax.plot(x_indices, sma200, color='#00FFFF', linewidth=1.0, alpha=0.7, label='SMA 200')
-                labels.extend(['SMA 50', 'SMA 100', 'SMA 200'])
-            
-            # Plot VWAP if enabled
-            if show_vwap and vwap is not None:
-                self.price_ax.plot(x_indices, vwap, color='#FFA500', linewidth=1.2, alpha=0.9, label='VWAP')
-                labels.append('VWAP')
-            
-            # Add legend only if there are indicators to show
-            if labels:
-                self.price_ax.legend(loc='upper left', fontsize=6, facecolor='#2e2e2e', 
-                                   edgecolor='#666666', labelcolor='white', 
-                                   framealpha=0.8, handlelength=1.0, handletextpad=0.3)
+            for label, line in self.indicator_lines.items():
+                values = series.get(label)
+                line.set_visible(values is not None)
+                if values is not None:
+                    line.set_data(x_indices, values)
+                    labels.append(label)
+            
+            # Legend only changes when the set of visible indicators does
+            if labels != self._legend_labels:
+                legend = self.price_ax.get_legend()
+                if legend:
+                    legend.remove()
+                if labels:
+                    self.price_ax.legend([self.indicator_lines[label] for label in labels], labels,
+                                       loc='upper left', fontsize=6, facecolor='#2e2e2e', 
+                                       edgecolor='#666666', labelcolor='white', 
+                                       framealpha=0.8, handlelength=1.0, handletextpad=0.3)
+                self._legend_labels = labels
             
         except Exception as e:
             logger.error(f"Error plotting technical indicators: {e}")
             
+    # ============================================================================
+    # OVERLAY LAYER (BLITTING)
+    # ============================================================================
+    
+    def add_overlay_artist(self, artist):
+        """Register an artist drawn by refresh_overlays() instead of full redraws"""
+        if self._use_blitting:
+            artist.set_animated(True)
+        if artist not in self._overlay_artists:
+            self._overlay_artists.append(artist)
+            
+    def remove_overlay_artist(self, artist):
+        """Stop managing an overlay artist"""
+        if artist in self._overlay_artists:
+            self._overlay_artists.remove(artist)
+            
+    def refresh_overlays(self):
+        """Redraw only the overlay artists on top of the cached background"""
+        if not self._use_blitting or self._background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        self._draw_overlays()
+        self.blit(self.fig.bbox)
+        
+    def _invalidate_background(self, *args):
+        """Forget the cached background; overlays fall back to a full redraw until the next draw"""
+        self._background = None
+        
+    def _draw_overlays(self):
+        """Draw visible overlay artists (skipping any removed from their axes)"""
+        for artist in self._overlay_artists:
+            if artist.axes is not None and artist.get_visible():
+                artist.axes.draw_artist(artist)
+                
+    def _on_draw(self, event):
+        """Capture the static background after a full draw, then put the overlays back"""
+        if not self._use_blitting:
+            return
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_overlays()
+        
     def _on_mouse_move(self, event):
         """Handle mouse movement for crosshair with throttling"""
-        if event.inaxes not in [self.price_ax, self.volume_ax] or not self.current_data:
+        if event.inaxes not in [self.price_ax, self.volume_ax] or self.current_data is None or not len(self.current_data):
             return
             
-        # Throttle crosshair updates to 120fps for ultra-smooth performance
+        # Throttle crosshair updates to 60fps
         import time
         current_time = time.time() * 1000  # milliseconds
         if current_time - self._last_crosshair_update < self._crosshair_throttle_ms:
@@ -501,76 +561,31 @@ class CandlestickChart(FigureCanvas):
         # Round to nearest integer (bar index) - optimized
         bar_idx = max(0, min(int(x + 0.5), len(self.current_data) - 1))
         
-        # Remove existing crosshair efficiently
-        for element in [self.crosshair_v_price, self.crosshair_v_volume, self.crosshair_h, self.ohlc_text]:
-            if element:
-                try:
-                    element.remove()
-                except:
-                    pass  # Ignore removal errors
-            
-        # Draw crosshair lines efficiently
-        crosshair_color = '#888888'
-        crosshair_props = {'color': crosshair_color, 'linestyle': '-', 'linewidth': 0.8, 'alpha': 0.8}
-        
-        self.crosshair_v_price = self.price_ax.axvline(x=bar_idx, **crosshair_props)
-        self.crosshair_v_volume = self.volume_ax.axvline(x=bar_idx, **crosshair_props)
-        self.crosshair_h = self.price_ax.axhline(y=event.ydata, **crosshair_props)
+        # Move the persistent crosshair artists
+        self.crosshair_v_price.set_xdata([bar_idx, bar_idx])
+        self.crosshair_v_volume.set_xdata([bar_idx, bar_idx])
+        self.crosshair_v_price.set_visible(True)
+        self.crosshair_v_volume.set_visible(True)
+        if event.inaxes is self.price_ax:
+            self.crosshair_h.set_ydata([event.ydata, event.ydata])
+        self.crosshair_h.set_visible(event.inaxes is self.price_ax)
         
         # Get OHLC data for this bar
-        bar_data = self.current_data[bar_idx]
-        eastern = pytz.timezone('US/Eastern')
-        bar_time = datetime.fromtimestamp(bar_data['time'], tz=pytz.UTC).astimezone(eastern)
+        bar_data = self.current_data.bar(bar_idx)
+        bar_time = datetime.fromtimestamp(bar_data['time'], tz=pytz.UTC).astimezone(EASTERN)
         
         # Optimized OHLC text formatting
-        ohlc_text = f"{bar_time.strftime('%m/%d %H:%M')} O:${bar_data['open']:.2f} H:${bar_data['high']:.2f} L:${bar_data['low']:.2f} C:${bar_data['close']:.2f} V:{bar_data['volume']:,}"
-        
-        # Add OHLC text with simpler styling
-        self.ohlc_text = self.price_ax.text(0.5, 0.99, ohlc_text,
-                                           transform=self.price_ax.transAxes,
-                                           fontsize=8,
-                                           fontfamily='monospace',
-                                           color='white',
-                                           bbox=dict(boxstyle='round,pad=0.2', 
-                                                   facecolor='#2e2e2e', 
-                                                   alpha=0.9,
-                                                   edgecolor='none'),
-                                           verticalalignment='top',
-                                           horizontalalignment='center')
+        self.ohlc_text.set_text(f"{bar_time.strftime('%m/%d %H:%M')} O:${bar_data['open']:.2f} H:${bar_data['high']:.2f} L:${bar_data['low']:.2f} C:${bar_data['close']:.2f} V:{bar_data['volume']:,}")
+        self.ohlc_text.set_visible(True)
         
-        # Use optimized drawing for smooth crosshair (120fps throttling active)
-        self.draw_idle()
+        # Blit the overlay layer only - the candles are not redrawn
+        self.refresh_overlays()
         
     def _on_mouse_leave(self, event):
         """Handle mouse leaving the axes"""
-        # Remove crosshair when mouse leaves - safely
-        if self.crosshair_v_price:
-            try:
-                self.crosshair_v_price.remove()
-            except:
-                pass  # Ignore removal errors
-            self.crosshair_v_price = None
-        if self.crosshair_v_volume:
-            try:
-                self.crosshair_v_volume.remove()
-            except:
-                pass  # Ignore removal errors
-            self.crosshair_v_volume = None
-        if self.crosshair_h:
-            try:
-                self.crosshair_h.remove()
-            except:
-                pass  # Ignore removal errors
-            self.crosshair_h = None
-        if self.ohlc_text:
-            try:
-                self.ohlc_text.remove()
-            except:
-                pass  # Ignore removal errors
-            self.ohlc_text = None
-            
-        # Use optimized drawing for crosshair removal
-        self.draw_idle()
+        for artist in (self.crosshair_v_price, self.crosshair_v_volume, self.crosshair_h, self.ohlc_text):
+            artist.set_visible(False)
+        self.refresh_overlays()
 
 
 class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
@@ -612,6 +627,18 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         self._min_refresh_interval = 2000  # Minimum 2 seconds between refreshes
         self._is_loading = False  # Prevent concurrent loads
         
+        # Scroll-back paging: every bar loaded for the chart, and the window of it rendered
+        self._history: Optional[BarFrame] = None
+        self._history_key = None
+        self._window_start = 0            # History index of the first rendered bar
+        self._window_stop = 0             # History index after the last rendered bar
+        self._view_range = None           # Last user view in history indices
+        self._history_exhausted = False
+        self._paging = False
+        self._view_timer = QTimer()
+        self._view_timer.setSingleShot(True)
+        self._view_timer.timeout.connect(self._on_view_settled)
+        
         # Initialize non-blocking and real-time optimizations
         self.init_non_blocking_updates()
         self.init_real_time_optimization()
@@ -773,11 +800,12 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         self.chart_layout.setContentsMargins(0, 0, 0, 0)  # No margins for maximum chart space
         
         if CHARTS_AVAILABLE:
-            # Create matplotlib canvas
-            self.chart_canvas = CandlestickChart()
+            # Create the configured chart backend
+            self.chart_canvas = self._create_chart_backend()
             
             # Add only the chart canvas (toolbar removed for more space)
             self.chart_layout.addWidget(self.chart_canvas)
+            self.chart_canvas.bar_range_changed.connect(self._on_chart_range_changed)
         else:
             # Show error message
             error_label = QLabel("matplotlib not available - install with: pip install matplotlib")
@@ -794,6 +822,16 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             
         return chart_container
         
+    def _create_chart_backend(self) -> ChartBackend:
+        """Create the renderer selected by CHART_CONFIG['backend'] (matplotlib fallback)"""
+        backend = CHART_CONFIG.get('backend', 'matplotlib')
+        if backend == 'pyqtgraph':
+            if PYQTGRAPH_AVAILABLE:
+                logger.info("Using pyqtgraph chart backend")
+                return PyQtGraphCandlestickChart()
+            logger.warning("pyqtgraph not available - falling back to matplotlib chart backend")
+        return CandlestickChart()
+        
     def create_status_section(self) -> QWidget:
         """Create compact status section"""
         status_widget = QWidget()
@@ -833,7 +871,7 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
     def setup_connections(self):
         """Setup signal connections"""
         self.timeframe_combo.currentTextChanged.connect(self.on_timeframe_changed)
-        self.refresh_button.clicked.connect(self.refresh_chart)
+        self.refresh_button.clicked.connect(self.force_refresh_chart)
         self.rescale_button.clicked.connect(self.rescale_chart)
         self.auto_refresh_combo.currentTextChanged.connect(self.on_auto_refresh_changed)
         self.update_timer.timeout.connect(self.refresh_chart)
@@ -881,13 +919,11 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         try:
             self.current_symbol = symbol.upper()
             self.symbol_label.setText(self.current_symbol)
+            self.cancel_pending_renders()  # Never show a late render of the previous symbol
             self.chart_manager.set_current_symbol(self.current_symbol)
             
             logger.info(f"Chart symbol set to: {self.current_symbol}")
             
-            # Clear cache to force fresh data for new symbol
-            self.chart_manager.clear_cache()
-            
             # Enable real-time mode for improved performance 
             if hasattr(self, 'enable_real_time_mode'):
                 real_time_success = self.enable_real_time_mode(self.current_symbol)
@@ -912,6 +948,7 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             if timeframe != self.current_timeframe:
                 self.current_timeframe = timeframe
                 self.chart_manager.set_current_timeframe(timeframe)
+                self.cancel_pending_renders()
                 
                 logger.info(f"Chart timeframe changed to: {timeframe}")
                 
@@ -932,17 +969,15 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             self.update_timer.stop()
             
             if interval == 'Off':
+                self.chart_manager.set_top_up_interval(None)
                 logger.info("Chart auto-refresh disabled")
             else:
                 # Parse interval and start timer
-                if interval == '5s':
-                    self.update_timer.start(5000)
-                elif interval == '10s':
-                    self.update_timer.start(10000)
-                elif interval == '30s':
-                    self.update_timer.start(30000)
-                elif interval == '1m':
-                    self.update_timer.start(60000)
+                interval_ms = {'5s': 5000, '10s': 10000, '30s': 30000, '1m': 60000}.get(interval)
+                if interval_ms:
+                    self.update_timer.start(interval_ms)
+                    # Every refresh tops up the tail (half the period absorbs timer jitter)
+                    self.chart_manager.set_top_up_interval(interval_ms / 2000)
                     
                 logger.info(f"Chart auto-refresh set to: {interval}")
                 
@@ -963,8 +998,9 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             self._is_loading = True
             self.status_label.setText("Loading chart data...")
             
-            # Defer the actual loading to avoid blocking
-            QTimer.singleShot(500, self._do_load_chart_data)
+            # Load on the next event loop pass; rendering is prepared on the
+            # render worker, so there is no freeze to postpone
+            QTimer.singleShot(0, self._do_load_chart_data)
             
         except Exception as e:
             logger.error(f"Error initiating chart data load: {str(e)}")
@@ -981,9 +1017,19 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             )
             
             if chart_data:
+                key = (self.current_symbol, self.current_timeframe)
+                previous_key = self._history_key
+                previous_last = int(self._history.time[-1]) if self._history is not None and len(self._history) else None
                 self.update_chart_display(chart_data)
+                
+                # Continue the last loaded bar from live ticks and 5s bars; reloads of the
+                # same chart only re-seed when they reach past the bars already shown
+                if key != previous_key or previous_last is None:
+                    self.sync_bar_builder(self._history)
+                elif int(chart_data.time[-1]) > previous_last:
+                    self.sync_bar_builder(self._history, continuing=True)
                 self.status_label.setText("Chart data loaded successfully")
-                self.bars_count_label.setText(f"{len(chart_data)} bars")
+                self.bars_count_label.setText(f"{len(self._history) if self._history else len(chart_data)} bars")
                 self.last_update_label.setText(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
             else:
                 self.status_label.setText("No chart data available")
@@ -995,17 +1041,52 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         finally:
             self._is_loading = False
             
-    def update_chart_display(self, chart_data: List[Dict[str, Any]]):
+    def update_chart_display(self, chart_data: BarFrame, live: bool = False):
         """
         Update the chart display with new data
         
         Args:
-            chart_data: List of OHLCV data in lightweight-charts format
+            chart_data: OHLCV bars as a BarFrame
+            live: Bars come from the real-time bar builder rather than a load
         """
         try:
             if not CHARTS_AVAILABLE or not chart_data or not self.chart_canvas:
                 return
                 
+            # Fold the new bars into the loaded history (older pages are kept)
+            window = self._merge_history(chart_data, live)
+            if window is None:
+                logger.debug(f"Viewing older history - {len(chart_data)} refreshed bars kept off-screen")
+                return
+                
+            # Keep a view the user panned/zoomed to across full re-renders
+            view_range = None
+            if self._view_range is not None:
+                view_range = (self._view_range[0] - self._window_start, self._view_range[1] - self._window_start)
+            self._display_window(window, view_range)
+            
+        except Exception as e:
+            logger.error(f"Error updating chart display: {str(e)}")
+            
+    def _display_window(self, chart_data: BarFrame, view_range: Optional[Tuple[float, float]] = None):
+        """
+        Render bars, trying the delta path first
+        
+        Args:
+            chart_data: Bars to render
+            view_range: Visible range in chart_data indices (None fits all bars)
+        """
+        try:
+            # Refreshes that only touch the last bar(s) skip the full render and
+            # leave price levels in place
+            if isinstance(self.chart_canvas, ChartBackend) and self.chart_canvas.update_incremental(
+                    chart_data, self.current_symbol, self.current_timeframe,
+                    show_emas=self.show_emas, show_smas=self.show_smas, show_vwap=self.show_vwap):
+                logger.debug(f"Incremental chart update: {len(chart_data)} bars for {self.current_symbol} {self.current_timeframe}")
+                # Any full render still in flight holds older bars
+                self.cancel_pending_renders()
+                return
+                
             logger.info(f"Updating chart display: {len(chart_data)} bars for {self.current_symbol} {self.current_timeframe}")
             
             # Store current price levels before plotting
@@ -1022,11 +1103,14 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 saved_limit_price = self.price_level_manager.limit_price
                 saved_target_prices = self.price_level_manager.target_prices.copy() if self.price_level_manager.target_prices else None
             
-            # Use non-blocking chart updates to eliminate UI freeze
-            logger.info("Using non-blocking chart update to eliminate UI freeze")
+            # Preparation runs on the render worker; only the artist swap happens here
+            logger.info("Queueing chart render on the render worker")
             
-            # Store chart data for later price level restoration
-            self._pending_chart_data = chart_data
+            # Store the bars that will be in view for later price level restoration
+            if view_range is not None:
+                self._pending_chart_data = chart_data.slice(max(0, int(view_range[0])), max(1, int(view_range[1]) + 1))
+            else:
+                self._pending_chart_data = chart_data
             self._pending_price_levels = {
                 'entry': saved_entry,
                 'stop_loss': saved_stop_loss, 
@@ -1035,26 +1119,15 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 'target_prices': saved_target_prices
             }
             
-            # Convert chart data format for non-blocking updater if needed
-            formatted_data = []
-            for bar in chart_data:
-                formatted_data.append({
-                    'time': bar.get('time', 0),
-                    'open': bar.get('open', 0),
-                    'high': bar.get('high', 0), 
-                    'low': bar.get('low', 0),
-                    'close': bar.get('close', 0),
-                    'volume': bar.get('volume', 0)
-                })
-            
-            # Update chart without blocking UI - this eliminates the 0.5s freeze
+            # Update chart without blocking UI - the payload is applied when ready
             self.update_chart_non_blocking(
-                formatted_data,
+                chart_data,
                 self.current_symbol, 
                 self.current_timeframe,
                 show_emas=self.show_emas,
                 show_smas=self.show_smas,
-                show_vwap=self.show_vwap
+                show_vwap=self.show_vwap,
+                view_range=view_range
             )
             
             # Price level restoration will be handled asynchronously after chart completes
@@ -1062,7 +1135,130 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             logger.info(f"Price levels stored for async restoration: Entry: {saved_entry}, SL: {saved_stop_loss}, TP: {saved_take_profit}, Limit: {saved_limit_price}")
                 
         except Exception as e:
-            logger.error(f"Error updating chart display: {str(e)}")
+            logger.error(f"Error displaying chart window: {str(e)}")
+            
+    # ============================================================================
+    # SCROLL-BACK PAGING
+    # ============================================================================
+    
+    def _merge_history(self, chart_data: BarFrame, live: bool = False) -> Optional[BarFrame]:
+        """
+        Fold newly loaded bars into the chart's history
+        
+        In real-time mode, loaded bars (which may be older than the stream)
+        never replace the bar builder's candles from its live start onwards,
+        and live bars newer than the load are kept.
+        
+        Args:
+            chart_data: Most recent bars for the current symbol and timeframe
+            live: Bars come from the real-time bar builder
+            
+        Returns:
+            Bars to render, or None if the user is viewing older history
+            and the live edge is off-screen
+        """
+        key = (self.current_symbol, self.current_timeframe)
+        history = self._history
+        if (history is None or not len(history) or self._history_key != key
+                or chart_data.time[0] < history.time[0]):
+            # New chart (or a load reaching further back): start over
+            self._history, self._history_key = chart_data, key
+            self._window_start, self._window_stop = 0, len(chart_data)
+            self._view_range = None
+            self._history_exhausted = False
+            return chart_data
+            
+        at_live_edge = self._window_stop >= len(history)
+        live_start = None if live else self.live_bar_start()
+        if live_start is not None:
+            loaded = chart_data.slice(0, int(np.searchsorted(chart_data.time, live_start, side='left')))
+            if len(loaded):
+                newer = int(np.searchsorted(history.time, loaded.time[-1], side='right'))
+                self._history = history.merge(loaded).merge(history.slice(newer, None))
+        else:
+            self._history = history.merge(chart_data)
+        if not at_live_edge:
+            return None
+        self._window_stop = len(self._history)
+        return self._history.slice(self._window_start, None)
+        
+    def _history_window(self, first: float, last: float, margin_scale: float = 1.0) -> Tuple[int, int]:
+        """History slice [start, stop) covering a view plus the configured margin on each side"""
+        margin = int((last - first) * CHART_WIDGET_CONFIG['history']['window_margin'] * margin_scale) + 1
+        return max(0, int(first) - margin), min(len(self._history), int(np.ceil(last)) + margin + 1)
+        
+    def _on_chart_range_changed(self, first: float, last: float):
+        """Record a user pan/zoom (rendered-window indices) and act once it settles"""
+        self._view_range = (first + self._window_start, last + self._window_start)
+        self._view_timer.start(CHART_WIDGET_CONFIG['history']['view_settle_ms'])
+        
+    def _on_view_settled(self):
+        """Page in older bars or re-window the render for the settled view"""
+        try:
+            if self._history is None or self._view_range is None or not self.chart_canvas:
+                return
+            first, last = self._view_range
+            
+            # At (or past) the oldest loaded bar: fetch the preceding page
+            if (first < CHART_WIDGET_CONFIG['history']['page_trigger_bars']
+                    and not self._history_exhausted and not self._paging):
+                self._paging = True
+                self.status_label.setText("Loading older history...")
+                QTimer.singleShot(0, self._load_history_page)
+                return
+                
+            # Re-render when the view nears the window's edges or the window is far
+            # larger than needed (zoomed in on a downsampled window)
+            inner_start, inner_stop = self._history_window(first, last, margin_scale=0.5)
+            start, stop = self._history_window(first, last)
+            if (inner_start < self._window_start or inner_stop > self._window_stop
+                    or (self._window_stop - self._window_start) > 2 * (stop - start)):
+                self._render_history_window(first, last)
+                
+        except Exception as e:
+            logger.error(f"Error handling chart view change: {str(e)}")
+            
+    def _render_history_window(self, first: float, last: float):
+        """Render the history around a view (history indices), keeping that view"""
+        start, stop = self._history_window(first, last)
+        self._window_start, self._window_stop = start, stop
+        logger.debug(f"Rendering history window [{start}:{stop}] of {len(self._history)} bars")
+        self._display_window(self._history.slice(start, stop), (first - start, last - start))
+        
+    def _load_history_page(self):
+        """Prepend the page of bars preceding the oldest loaded bar"""
+        try:
+            history = self._history
+            if history is None or not len(history):
+                return
+                
+            page = self.chart_manager.get_history_page(
+                self.current_symbol, self.current_timeframe, int(history.time[0]),
+                CHART_WIDGET_CONFIG['history']['page_bars']
+            )
+            if self._history is not history:
+                return  # Chart changed while the page loaded
+            if not page:
+                self._history_exhausted = True
+                self.status_label.setText("No older history available")
+                return
+                
+            self._history = page.merge(history)
+            added = len(self._history) - len(history)
+            self._window_start += added
+            self._window_stop += added
+            first, last = self._view_range
+            self._view_range = (first + added, last + added)
+            
+            self.status_label.setText(f"Loaded {added} older bars")
+            self.bars_count_label.setText(f"{len(self._history)} bars")
+            self._render_history_window(*self._view_range)
+            
+        except Exception as e:
+            logger.error(f"Error loading older chart history: {str(e)}")
+            self.status_label.setText(f"Error loading history: {str(e)}")
+        finally:
+            self._paging = False
     
     def on_non_blocking_chart_complete(self):
         """Called when non-blocking chart update completes - restore price levels"""
@@ -1079,15 +1275,8 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 saved_limit_price = levels.get('limit_price')
                 saved_target_prices = levels.get('target_prices')
                 
-                # Re-set chart references in case axes were recreated
-                if isinstance(self.chart_canvas, CandlestickChart):
-                    self.price_level_manager.set_chart_references(
-                        self.chart_canvas.price_ax,
-                        self.chart_canvas
-                    )
-                    
-                    # Reconnect drag events since the canvas was redrawn
-                    self.price_level_manager.connect_drag_events()
+                # Axes persist across redraws, so the chart references and drag
+                # connections made in setup_price_levels stay valid
                 
                 # Only restore limit_price if current order type is STOP LIMIT
                 restore_limit_price = saved_limit_price if self.is_current_order_type_stop_limit() else None
@@ -1127,8 +1316,17 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         except Exception as e:
             logger.error(f"Error restoring price levels after async chart update: {e}")
             
-    def refresh_chart(self):
-        """Refresh chart data with throttling to prevent excessive updates"""
+    def force_refresh_chart(self):
+        """Refresh chart data on explicit user request, topping up from IB immediately"""
+        self.refresh_chart(force_top_up=True)
+        
+    def refresh_chart(self, force_top_up: bool = False):
+        """
+        Refresh chart data with throttling to prevent excessive updates
+        
+        Args:
+            force_top_up: Top up from IB now instead of waiting for the top-up interval
+        """
         if not self.current_symbol:
             return
             
@@ -1142,8 +1340,9 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         self._last_refresh_time = current_time
         logger.info(f"Refreshing chart data for {self.current_symbol}")
         
-        # Clear cache to force fresh data (but don't clear calculation cache unnecessarily)
-        self.chart_manager.clear_cache()
+        # Auto-refreshes top up the tail at the refresh cadence; an explicit Refresh always does
+        if force_top_up:
+            self.chart_manager.clear_cache()
         self.load_chart_data()
             
     def rescale_chart(self):
@@ -1154,12 +1353,11 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 
             logger.info("Manual rescale requested")
             
-            if isinstance(self.chart_canvas, CandlestickChart) and self.chart_canvas.current_data:
+            if isinstance(self.chart_canvas, ChartBackend) and self.chart_canvas.current_data:
                 data = self.chart_canvas.current_data
                 
                 # Calculate proper limits from actual data
-                price_min = min(d['low'] for d in data)
-                price_max = max(d['high'] for d in data)
+                price_min, price_max = data.price_range()
                 
                 # Include price levels in rescaling calculation
                 price_levels = []
@@ -1186,18 +1384,17 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 price_range = price_max - price_min
                 y_margin = max(price_range * 0.05, 0.01)
                 
-                max_volume = max(d['volume'] for d in data)
+                max_volume = float(np.max(data.volume))
                 
                 # Set explicit limits
-                self.chart_canvas.price_ax.set_xlim(-0.5, len(data) - 0.5)
-                self.chart_canvas.price_ax.set_ylim(price_min - y_margin, price_max + y_margin)
-                self.chart_canvas.volume_ax.set_xlim(-0.5, len(data) - 0.5)
-                self.chart_canvas.volume_ax.set_ylim(0, max_volume * 1.1)
+                self.chart_canvas.set_bar_range(-0.5, len(data) - 0.5)
+                self.chart_canvas.set_price_range(price_min - y_margin, price_max + y_margin)
+                self.chart_canvas.set_volume_range(max_volume * 1.1)
                 
                 # Redraw
-                self.chart_canvas.draw()
+                self.chart_canvas.redraw()
                 
-                logger.info(f"Chart manually rescaled - New Y limits: {self.chart_canvas.price_ax.get_ylim()}")
+                logger.info(f"Chart manually rescaled - New Y limits: {self.chart_canvas.get_price_range()}")
                 if price_levels:
                     self.status_label.setText("Chart rescaled to fit data and price levels")
                 else:
@@ -1212,11 +1409,11 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                                           take_profit: Optional[float] = None):
         """Check if price levels are outside current view and rescale if needed"""
         try:
-            if not CHARTS_AVAILABLE or not self.chart_canvas or not isinstance(self.chart_canvas, CandlestickChart):
+            if not CHARTS_AVAILABLE or not self.chart_canvas or not isinstance(self.chart_canvas, ChartBackend):
                 return
                 
             # Get current Y-axis limits
-            y_min, y_max = self.chart_canvas.price_ax.get_ylim()
+            y_min, y_max = self.chart_canvas.get_price_range()
             
             # Collect all price levels
             price_levels = [price for price in [entry, stop_loss, take_profit] if price is not None]
@@ -1238,7 +1435,7 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
         except Exception as e:
             logger.error(f"Error checking price levels for rescale: {str(e)}")
             
-    def _rescale_to_include_price_levels(self, chart_data: List[Dict[str, Any]], 
+    def _rescale_to_include_price_levels(self, chart_data: BarFrame, 
                                        entry: Optional[float] = None,
                                        stop_loss: Optional[float] = None, 
                                        take_profit: Optional[float] = None,
@@ -1246,15 +1443,14 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                                        target_prices: Optional[list] = None):
         """Rescale chart to include both chart data and price levels"""
         try:
-            if not CHARTS_AVAILABLE or not self.chart_canvas or not isinstance(self.chart_canvas, CandlestickChart):
+            if not CHARTS_AVAILABLE or not self.chart_canvas or not isinstance(self.chart_canvas, ChartBackend):
                 return
                 
             if not chart_data:
                 return
                 
             # Get price range from chart data
-            data_price_min = min(d['low'] for d in chart_data)
-            data_price_max = max(d['high'] for d in chart_data)
+            data_price_min, data_price_max = chart_data.price_range()
             
             # Include price levels in range calculation (exclude limit_price if <= 0 to prevent chart scaling to 0)
             price_levels = []
@@ -1288,16 +1484,16 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             y_margin = max(price_range * 0.08, 0.01)  # 8% margin or minimum 1 cent for better visibility
             
             # Apply new limits
-            self.chart_canvas.price_ax.set_ylim(combined_min - y_margin, combined_max + y_margin)
+            self.chart_canvas.set_price_range(combined_min - y_margin, combined_max + y_margin)
             
             # Update volume limits (unchanged)
-            max_volume = max(d['volume'] for d in chart_data)
-            self.chart_canvas.volume_ax.set_ylim(0, max_volume * 1.1)
+            max_volume = float(np.max(chart_data.volume))
+            self.chart_canvas.set_volume_range(max_volume * 1.1)
             
             # Redraw
-            self.chart_canvas.draw_idle()
+            self.chart_canvas.redraw()
             
-            logger.info(f"Chart rescaled with price levels - New Y limits: {self.chart_canvas.price_ax.get_ylim()}")
+            logger.info(f"Chart rescaled with price levels - New Y limits: {self.chart_canvas.get_price_range()}")
             
         except Exception as e:
             logger.error(f"Error rescaling chart with price levels: {str(e)}")
@@ -1327,11 +1523,11 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
             if not CHARTS_AVAILABLE or not self.chart_canvas:
                 return
                 
-            # Create price level manager
-            self.price_level_manager = PriceLevelManager()
-            
-            # Set chart references
-            if isinstance(self.chart_canvas, CandlestickChart):
+            # Create price level manager drawing on the active backend
+            if isinstance(self.chart_canvas, ChartBackend):
+                self.price_level_manager = self.chart_canvas.create_price_level_manager()
+                
+                # Set chart references
                 self.price_level_manager.set_chart_references(
                     self.chart_canvas.price_ax,
                     self.chart_canvas
@@ -1411,7 +1607,7 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                         return
                     
                     # Check if any price level is outside current view
-                    y_min, y_max = self.chart_canvas.price_ax.get_ylim()
+                    y_min, y_max = self.chart_canvas.get_price_range()
                     # Include valid price levels (exclude limit_price if <= 0 to prevent chart scaling to 0)
                     price_levels = []
                     for price in [entry, stop_loss, take_profit]:
@@ -1467,7 +1663,7 @@ class ChartWidget(QWidget, NonBlockingChartMixin, OptimizedChartMixin):
                 self.disable_real_time_mode()
                 
             if self.chart_canvas:
-                plt.close('all')  # Close all matplotlib figures
+                self.chart_canvas.release()
                 
             logger.info("Chart widget cleanup completed - non-blocking updates disabled")
         except Exception as e:
@@ -8,7 +8,7 @@ from PyQt6.QtCore import pyqtSignal, QObject
 
 from .base_controller import BaseController
 from src.services import get_data_service
-from src.services.event_bus import EventType, Event, subscribe, unsubscribe
+from src.services.event_bus import EventType, Event, DeliveryMode, subscribe, unsubscribe
 from src.utils.logger import logger
 import config
 
@@ -33,9 +33,9 @@ class MarketDataController(BaseController):
             return False
             
         try:
-            # Subscribe to market data events
-            subscribe(EventType.PRICE_UPDATE, self._on_price_update_event)
-            subscribe(EventType.MARKET_DATA_ERROR, self._on_market_error_event)
+            # Subscribe to market data events (handlers update widgets, so run them on the GUI thread)
+            subscribe(EventType.PRICE_UPDATE, self._on_price_update_event, DeliveryMode.QT)
+            subscribe(EventType.MARKET_DATA_ERROR, self._on_market_error_event, DeliveryMode.QT)
             
             logger.info("MarketDataController initialized and subscribed to events")
             return True
@@ -115,7 +115,7 @@ class MarketDataController(BaseController):
     def _on_price_update_event(self, event: Event):
         """Handle price update event from EventBus"""
         try:
-            price_data = event.data
+            price_data = event.as_dict()  # Typed payloads arrive as slotted objects
             symbol = price_data.get('symbol', 'Unknown')
             current_price = price_data.get('current_price', 0)
             
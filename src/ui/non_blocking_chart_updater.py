@@ -1,50 +1,175 @@
 """
-Simplified Chart Updater
-Provides chart updating functionality with synchronous fallback for reliability
+Non-Blocking Chart Updater
+Prepares chart renders on a worker thread so the GUI thread only swaps artist data
 """
 
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
 from src.utils.logger import logger
+from src.ui.chart_backend import build_render_payload
+
+
+class ChartRenderRequest:
+    """Inputs for one full chart render, queued to the render worker"""
+
+    __slots__ = ('generation', 'data', 'symbol', 'timeframe', 'show_emas', 'show_smas', 'show_vwap',
+                 'pixel_width', 'view_range', 'backend')
+
+    def __init__(self, generation, data, symbol, timeframe, show_emas, show_smas, show_vwap,
+                 pixel_width, view_range, backend):
+        self.generation = generation
+        self.data = data
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.show_emas = show_emas
+        self.show_smas = show_smas
+        self.show_vwap = show_vwap
+        self.pixel_width = pixel_width
+        self.view_range = view_range
+        self.backend = backend
+
+
+class ChartRenderWorker(QObject):
+    """
+    Builds RenderPayloads off the GUI thread
+
+    Requests carry a generation number. latest_generation is raised by the
+    GUI thread whenever a newer request is issued or pending renders are
+    cancelled, and superseded requests are abandoned between stages instead
+    of being finished and thrown away.
+    """
+
+    requested = pyqtSignal(object)      # ChartRenderRequest (emitted from the GUI thread)
+    payload_ready = pyqtSignal(object)  # RenderPayload
+
+    def __init__(self):
+        super().__init__()
+        self.latest_generation = 0
+        self.requested.connect(self.prepare)
+
+    def is_stale(self, generation: int) -> bool:
+        """Check whether a newer request or a cancel superseded this generation"""
+        return generation < self.latest_generation
+
+    def prepare(self, request: ChartRenderRequest):
+        """Build the payload for a request (runs on the worker thread)"""
+        try:
+            if self.is_stale(request.generation) or not request.data:
+                return
+            payload = build_render_payload(
+                request.data, request.symbol, request.timeframe,
+                request.show_emas, request.show_smas, request.show_vwap,
+                pixel_width=request.pixel_width, generation=request.generation,
+                view_range=request.view_range
+            )
+            if self.is_stale(request.generation):
+                return
+            request.backend.prepare_geometry(payload)
+            if self.is_stale(request.generation):
+                return
+            self.payload_ready.emit(payload)
+
+        except Exception as e:
+            logger.error(f"Error preparing chart render: {str(e)}")
 
 
 class NonBlockingChartMixin:
-    """Mixin to add chart updating to existing chart widgets"""
-    
+    """Mixin to add off-thread chart preparation to existing chart widgets"""
+
     def init_non_blocking_updates(self):
-        """Initialize chart updates (simplified implementation)"""
-        logger.info("Chart updater initialized with synchronous fallback")
-        
+        """Start the render worker thread"""
+        self._render_generation = 0
+        self._render_thread = None
+        self._render_worker = None
+        try:
+            self._render_worker = ChartRenderWorker()
+            self._render_thread = QThread()
+            self._render_worker.moveToThread(self._render_thread)
+            self._render_worker.payload_ready.connect(self._on_render_payload_ready)
+            self._render_thread.start()
+            logger.info("Chart render worker thread started")
+        except Exception as e:
+            logger.error(f"Error starting chart render worker, using synchronous updates: {str(e)}")
+            self._render_thread = None
+
     def update_chart_non_blocking(self, data, symbol, timeframe, **kwargs):
-        """Update chart using reliable synchronous method"""
-        logger.debug("Using synchronous chart update for reliability")
-        self._fallback_to_sync_chart_update(data, **kwargs)
-            
+        """Queue a full render; the payload is applied on the GUI thread when ready"""
+        if not (hasattr(self, 'chart_canvas') and self.chart_canvas and data):
+            return
+        if self._render_thread is None or not self._render_thread.isRunning():
+            self._fallback_to_sync_chart_update(data, **kwargs)
+            return
+
+        self._render_generation += 1
+        self._render_worker.latest_generation = self._render_generation
+        request = ChartRenderRequest(
+            self._render_generation, data, symbol, timeframe,
+            kwargs.get('show_emas', True), kwargs.get('show_smas', True), kwargs.get('show_vwap', True),
+            self.chart_canvas.lod_pixel_width(), kwargs.get('view_range'), self.chart_canvas
+        )
+        self._render_worker.requested.emit(request)
+        logger.debug(f"Queued chart render #{self._render_generation} for {symbol} {timeframe} ({len(data)} bars)")
+
+    def cancel_pending_renders(self):
+        """Drop queued and in-flight renders (e.g. on symbol or timeframe change)"""
+        self._render_generation += 1
+        if self._render_worker is not None:
+            self._render_worker.latest_generation = self._render_generation
+
+    def _on_render_payload_ready(self, payload):
+        """Swap a finished payload into the chart (GUI thread)"""
+        try:
+            if payload.generation != self._render_generation:
+                logger.debug(f"Dropping stale chart render #{payload.generation} (current #{self._render_generation})")
+                return
+            if not self.chart_canvas:
+                return
+
+            self.chart_canvas.apply_render(payload)
+            logger.debug(f"Successfully rendered chart for {payload.symbol} {payload.timeframe} with {len(payload.data)} bars")
+
+            # Trigger price level restoration
+            if hasattr(self, 'on_non_blocking_chart_complete'):
+                self.on_non_blocking_chart_complete()
+        except Exception as e:
+            logger.error(f"Chart update failed: {e}")
+
     def _fallback_to_sync_chart_update(self, data, **kwargs):
         """Fallback to synchronous chart update"""
         try:
             if hasattr(self, 'chart_canvas') and self.chart_canvas and data:
                 logger.debug("Updating chart with synchronous plotting")
-                
+
                 # Get symbol and timeframe from widget attributes
                 symbol = getattr(self, 'current_symbol', 'UNKNOWN')
                 timeframe = getattr(self, 'current_timeframe', '5m')
-                
+
                 self.chart_canvas.plot_candlestick_data(
                     data,
                     symbol,
                     timeframe,
                     show_emas=kwargs.get('show_emas', True),
                     show_smas=kwargs.get('show_smas', True),
-                    show_vwap=kwargs.get('show_vwap', True)
+                    show_vwap=kwargs.get('show_vwap', True),
+                    view_range=kwargs.get('view_range')
                 )
-                
+
                 logger.debug(f"Successfully rendered chart for {symbol} {timeframe} with {len(data)} bars")
-                
+
                 # Trigger price level restoration
                 if hasattr(self, 'on_non_blocking_chart_complete'):
                     self.on_non_blocking_chart_complete()
         except Exception as e:
             logger.error(f"Chart update failed: {e}")
-                
+
     def cleanup_non_blocking(self):
-        """Cleanup chart updater (simplified - no resources to clean)"""
-        logger.debug("Chart updater cleanup completed")
\ No newline at end of file
+        """Cancel pending renders and stop the worker thread"""
+        try:
+            self.cancel_pending_renders()
+            if self._render_thread is not None:
+                self._render_thread.quit()
+                self._render_thread.wait(2000)
+                self._render_thread = None
+            logger.debug("Chart updater cleanup completed")
+        except Exception as e:
+            logger.error(f"Error stopping chart render worker: {str(e)}")
@@ -4,12 +4,13 @@ Provides real-time chart optimization methods that can be mixed into existing ch
 """
 
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
-import numpy as np
 
-from PyQt6.QtCore import QTimer, pyqtSlot
 from src.utils.logger import logger
+from src.core.bar_frame import BarFrame
+from src.core.bar_builder import BarBuilder
 from src.core.real_time_chart_updater import real_time_updater, StreamingBar
+from src.core.tick_conflator import tick_conflator
+from src.services.event_bus import BarClosed, publish_payload
 
 
 class OptimizedChartMixin:
@@ -22,18 +23,13 @@ class OptimizedChartMixin:
         """Initialize real-time chart optimization - call this in your chart widget __init__"""
         # Real-time data management
         self._rt_enabled = False
-        self._rt_bars_buffer = []
-        self._last_bar_time = None
-        self._current_bar = None
+        self._rt_symbol = None
+        self._rt_bars_closed = 0
         
-        # Performance optimization
-        self._chart_update_timer = QTimer()
-        self._chart_update_timer.timeout.connect(self._batch_update_chart)
-        self._pending_updates = False
-        
-        # Connect to real-time updater
-        real_time_updater.new_bar_update.connect(self._on_streaming_bar_update)
-        real_time_updater.price_tick_update.connect(self._on_price_tick_update)
+        # Live candle for the active timeframe, built from bars and ticks
+        self._bar_builder = BarBuilder()
+        self._bar_builder.bar_updated.connect(self._on_built_bar)
+        self._bar_builder.bar_closed.connect(self._on_built_bar_closed)
         
         logger.info("Real-time chart optimization initialized")
     
@@ -48,10 +44,17 @@ class OptimizedChartMixin:
             if not hasattr(self, '_rt_enabled'):
                 self.init_real_time_optimization()
             
-            # Start streaming data
-            success = real_time_updater.start_streaming(symbol)
+            # Leave the previous symbol's stream warm for a quick switch back
+            self._unsubscribe_real_time()
+            self._bar_builder.reset(None)  # Re-seeded once the new history loads
+            
+            # Subscribe to this symbol's updates only
+            success = real_time_updater.subscribe(
+                symbol, on_bars=self._on_streaming_bars, on_price=self._on_price_tick_update, consumer='chart'
+            )
             if success:
                 self._rt_enabled = True
+                self._rt_symbol = symbol
                 self.current_symbol = symbol
                 
                 # Reduce traditional refresh interval to backup mode
@@ -74,7 +77,8 @@ class OptimizedChartMixin:
         """Disable real-time mode and return to traditional refresh"""
         try:
             self._rt_enabled = False
-            real_time_updater.stop_streaming()
+            self._unsubscribe_real_time()
+            self._bar_builder.reset(None)
             
             # Restore traditional refresh interval
             if hasattr(self, 'update_timer'):
@@ -86,124 +90,94 @@ class OptimizedChartMixin:
         except Exception as e:
             logger.error(f"Error disabling real-time mode: {e}")
     
-    @pyqtSlot(object)
-    def _on_streaming_bar_update(self, streaming_bar: StreamingBar):
-        """Handle incoming streaming bar data"""
+    def _unsubscribe_real_time(self):
+        """Stop receiving updates for the current real-time symbol"""
+        if getattr(self, '_rt_symbol', None):
+            real_time_updater.unsubscribe(
+                self._rt_symbol, on_bars=self._on_streaming_bars, on_price=self._on_price_tick_update, consumer='chart'
+            )
+            self._rt_symbol = None
+    
+    def sync_bar_builder(self, history: Optional[BarFrame], continuing: bool = False):
+        """
+        Seed the live candle from freshly loaded history
+        
+        Args:
+            history: Bars for the current symbol and timeframe
+            continuing: History is a reload of the chart already being built;
+                candles the stream has built or closed are kept
+        """
+        if hasattr(self, '_bar_builder'):
+            timeframe = getattr(self, 'current_timeframe', None) if self._rt_enabled else None
+            if continuing and timeframe is not None and self._bar_builder.timeframe == timeframe:
+                self._bar_builder.reseed(history)
+            else:
+                self._bar_builder.reset(timeframe, history)
+    
+    def live_bar_start(self) -> Optional[int]:
+        """Epoch from which chart bars are built from the stream, or None outside real-time mode"""
+        if not getattr(self, '_rt_enabled', False):
+            return None
+        return self._bar_builder.live_start
+    
+    def _on_streaming_bars(self, symbol: str, streaming_bars: List[StreamingBar]):
+        """Fold 5-second bars for the subscribed symbol into the live candle"""
         try:
-            if not self._rt_enabled or not hasattr(self, 'current_symbol'):
+            if not self._rt_enabled or symbol != self._rt_symbol:
                 return
                 
-            # Buffer the update for batch processing
-            self._rt_bars_buffer.append(streaming_bar)
-            
-            # Schedule batch update if not already pending
-            if not self._pending_updates:
-                self._pending_updates = True
-                # Small delay to batch rapid updates
-                self._chart_update_timer.start(250)  # 250ms batch interval
+            for bar in streaming_bars:
+                self._bar_builder.add_bar(bar.time, bar.open, bar.high, bar.low, bar.close, bar.volume)
                 
         except Exception as e:
             logger.error(f"Error handling streaming bar update: {e}")
     
-    @pyqtSlot(float, float, float)
-    def _on_price_tick_update(self, last: float, bid: float, ask: float):
+    def _on_price_tick_update(self, symbol: str, last: float, bid: float, ask: float):
         """Handle live price tick updates"""
         try:
-            if not self._rt_enabled:
+            if not self._rt_enabled or symbol != self._rt_symbol:
                 return
                 
             # Update current price display (if you have price labels)
             if hasattr(self, 'update_live_price'):
                 self.update_live_price(last, bid, ask)
                 
-            # Update current bar with latest price
-            if self._current_bar and last > 0:
-                self._current_bar.close = last
-                if last > self._current_bar.high:
-                    self._current_bar.high = last
-                if last < self._current_bar.low:
-                    self._current_bar.low = last
-                    
-                # Trigger lightweight update for current bar
-                if hasattr(self, 'update_current_bar_display'):
-                    self.update_current_bar_display(self._current_bar)
+            self._bar_builder.add_tick(last)
                     
         except Exception as e:
             logger.error(f"Error handling price tick update: {e}")
     
-    def _batch_update_chart(self):
-        """Process batched real-time updates efficiently"""
+    def _on_built_bar(self, bar: BarFrame):
+        """Show the forming candle (replaces or appends the last chart bar)"""
         try:
-            if not self._rt_bars_buffer:
-                self._pending_updates = False
-                self._chart_update_timer.stop()
+            # Ignore candles built for a chart that has since changed
+            if self._bar_builder.timeframe != getattr(self, 'current_timeframe', None):
+                return
+            if getattr(self, '_history_key', None) != (self._rt_symbol, self._bar_builder.timeframe):
                 return
                 
-            # Process all buffered bars
-            new_bars = self._rt_bars_buffer.copy()
-            self._rt_bars_buffer.clear()
-            
-            # Efficiently update chart with new bars
-            self._apply_streaming_bars(new_bars)
-            
-            self._pending_updates = False
-            self._chart_update_timer.stop()
-            
-            logger.debug(f"Processed {len(new_bars)} streaming bars")
+            if hasattr(self, 'update_chart_display'):
+                self.update_chart_display(bar, live=True)
             
         except Exception as e:
-            logger.error(f"Error in batch chart update: {e}")
-            self._pending_updates = False
-            self._chart_update_timer.stop()
+            logger.error(f"Error applying live bar: {e}")
     
-    def _apply_streaming_bars(self, new_bars: List[StreamingBar]):
-        """
-        Apply streaming bars to chart data efficiently
-        Override this method in your chart widget
-        """
-        try:
-            # This is the method you'll override in your chart widget
-            # to efficiently update the matplotlib chart with new data
-            
-            for bar in new_bars:
-                # Example: Add to your chart data arrays
-                if hasattr(self, 'chart_data') and self.chart_data:
-                    # Convert StreamingBar to your chart format
-                    new_data_point = {
-                        'time': bar.time,
-                        'open': bar.open,
-                        'high': bar.high,
-                        'low': bar.low,
-                        'close': bar.close,
-                        'volume': bar.volume
-                    }
-                    
-                    # Check if this is an update to the last bar or a new bar
-                    if (self.chart_data and 
-                        abs((bar.time - self.chart_data[-1]['time']).total_seconds()) < 30):
-                        # Update existing bar
-                        self.chart_data[-1] = new_data_point
-                    else:
-                        # New bar
-                        self.chart_data.append(new_data_point)
-                        # Keep only recent data to avoid memory issues
-                        if len(self.chart_data) > 1000:
-                            self.chart_data = self.chart_data[-500:]
-            
-            # Update the chart display efficiently
-            if hasattr(self, 'update_chart_display') and hasattr(self, 'chart_data'):
-                self.update_chart_display(self.chart_data)
-            
-        except Exception as e:
-            logger.error(f"Error applying streaming bars: {e}")
+    def _on_built_bar_closed(self, bar: BarFrame):
+        """Publish completed candles (the final values were already shown by bar_updated)"""
+        self._rt_bars_closed += 1
+        publish_payload(BarClosed(
+            self._rt_symbol, self._bar_builder.timeframe, int(bar.time[0]), float(bar.open[0]),
+            float(bar.high[0]), float(bar.low[0]), float(bar.close[0]), float(bar.volume[0])
+        ), 'ChartWidget')
     
     def get_real_time_performance_info(self) -> Dict[str, Any]:
         """Get performance information about real-time updates"""
         return {
             'rt_enabled': getattr(self, '_rt_enabled', False),
-            'streaming': real_time_updater.is_streaming,
-            'symbol': real_time_updater.current_symbol,
-            'buffer_size': len(getattr(self, '_rt_bars_buffer', [])),
-            'pending_updates': getattr(self, '_pending_updates', False)
+            'streaming': bool(getattr(self, '_rt_symbol', None)) and real_time_updater.is_streaming(self._rt_symbol),
+            'symbol': getattr(self, '_rt_symbol', None),
+            'open_streams': real_time_updater.get_stats()['streams'],
+            'bars_closed': getattr(self, '_rt_bars_closed', 0),
+            'tick_conflation': tick_conflator.get_stats()
         }
 
@@ -8,6 +8,8 @@ from PyQt6.QtWidgets import QStatusBar, QLabel
 from PyQt6.QtCore import QTimer
 
 from src.utils.logger import logger
+from src.services.event_bus import get_event_bus
+from config import EVENT_BUS_CONFIG
 
 
 class StatusPanel(QStatusBar):
@@ -19,9 +21,16 @@ class StatusPanel(QStatusBar):
         self._message_timer = QTimer()
         self._message_timer.timeout.connect(self._clear_temp_message)
         
+        # Periodic EventBus health readout
+        self._metrics_timer = QTimer()
+        self._metrics_timer.timeout.connect(self.update_event_bus_metrics)
+        self._metrics_timer.start(EVENT_BUS_CONFIG['metrics_refresh_ms'])
+        
     def _init_ui(self):
         """Initialize the UI"""
         # Permanent widgets
+        self.event_bus_indicator = QLabel()
+        self.addPermanentWidget(self.event_bus_indicator)
         self.connection_indicator = QLabel()
         self.addPermanentWidget(self.connection_indicator)
         
@@ -67,6 +76,32 @@ class StatusPanel(QStatusBar):
             self.connection_indicator.setText("🔴 Disconnected")
             self.connection_indicator.setStyleSheet("color: red; font-weight: bold;")
             
+    def update_event_bus_metrics(self):
+        """Show EventBus queue depth and critical-lane (order/connection) latency, details in the tooltip"""
+        try:
+            metrics = get_event_bus().get_metrics()
+            depth = sum(metrics['queue_depth'].values())
+            order_wait = metrics['lane_wait']['critical']
+            text = f"Bus: {depth} queued"
+            if order_wait['count']:
+                text += f" | order p99 {order_wait['p99_ms']:.1f}ms"
+            if metrics['slow_calls']:
+                text += f" | {metrics['slow_calls']} slow"
+            self.event_bus_indicator.setText(text)
+            
+            tooltip = [
+                f"Dispatched: {metrics['dispatched']}",
+                f"Peak depth: {metrics['peak_queue_depth']}",
+            ]
+            for event_type, summary in metrics['queue_wait'].items():
+                tooltip.append(f"{event_type} wait: p50 {summary['p50_ms']:.2f}ms, "
+                               f"p99 {summary['p99_ms']:.2f}ms, max {summary['max_ms']:.1f}ms")
+            if metrics['slowest_subscriber']:
+                tooltip.append(f"Slowest subscriber: {metrics['slowest_subscriber']}")
+            self.event_bus_indicator.setToolTip('\n'.join(tooltip))
+        except Exception as e:
+            logger.error(f"Error updating event bus metrics: {str(e)}")
+            
     def _clear_temp_message(self):
         """Clear temporary message and reset styling"""
         self._message_timer.stop()
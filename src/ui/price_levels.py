@@ -23,6 +23,15 @@ class PriceLevelManager(QObject):
     limit_price_changed = pyqtSignal(float)  # Emitted when limit price is dragged
     drag_completed = pyqtSignal()  # Emitted when drag operation completes
     
+    # Line styles: (color, linestyle, label prefix)
+    LINE_STYLES = {
+        'entry': ('#2196F3', '-', 'Entry'),              # Blue
+        'stop_loss': ('#F44336', '--', 'Stop Loss'),     # Red
+        'take_profit': ('#4CAF50', '-.', 'Take Profit'), # Green
+        'limit_price': ('#FF9800', ':', 'Limit Price'),  # Orange (STOP LIMIT orders)
+    }
+    TARGET_COLORS = ['#9C27B0', '#E91E63', '#673AB7']  # Purple, Pink, Deep Purple
+    
     def __init__(self):
         super().__init__()
         
@@ -49,20 +58,24 @@ class PriceLevelManager(QObject):
         self.chart_ax = None
         self.chart_canvas = None
         
-        # Performance optimization for smooth dragging - blitting disabled to prevent chart issues
+        # Performance optimization for smooth dragging - lines are overlay artists
+        # blitted over the canvas' cached background instead of full redraws
         self._last_drag_update = 0
         self._drag_throttle_ms = 16.67  # 60fps throttling for good balance
-        self._background = None
-        self._use_blitting = False
+        self._use_blitting = True
+        self._drag_connections = []
         
     def set_chart_references(self, ax, canvas):
         """Set references to the chart axis and canvas"""
-        # Clear any existing lines when setting new references
-        self.entry_line = None
-        self.stop_loss_line = None
-        self.take_profit_line = None
-        self.limit_price_line = None
-        self.target_lines = []
+        # Lines belong to the previous axes - drop them before switching
+        if ax is not self.chart_ax or canvas is not self.chart_canvas:
+            for line in self._all_lines():
+                self._remove_line(line)
+            self.entry_line = None
+            self.stop_loss_line = None
+            self.take_profit_line = None
+            self.limit_price_line = None
+            self.target_lines = []
         
         self.chart_ax = ax
         self.chart_canvas = canvas
@@ -126,216 +139,113 @@ class PriceLevelManager(QObject):
             logger.error(f"Error updating price levels: {e}")
             
     def _draw_price_lines(self):
-        """Draw or update horizontal price lines on the chart"""
+        """Update the persistent horizontal price lines and refresh the overlay layer"""
         try:
             if not self.chart_ax or not self.chart_canvas:
                 return
                 
-            # Remove existing lines safely
-            if self.entry_line:
-                try:
-                    self.entry_line.remove()
-                except:
-                    pass  # Line might already be removed
-                self.entry_line = None
-            if self.stop_loss_line:
-                try:
-                    self.stop_loss_line.remove()
-                except:
-                    pass  # Line might already be removed
-                self.stop_loss_line = None
-            if self.take_profit_line:
-                try:
-                    self.take_profit_line.remove()
-                except:
-                    pass  # Line might already be removed
-                self.take_profit_line = None
-            if self.limit_price_line:
-                try:
-                    self.limit_price_line.remove()
-                except:
-                    pass  # Line might already be removed
-                self.limit_price_line = None
-            # Remove existing target lines
-            for line in self.target_lines:
-                try:
-                    line.remove()
-                except:
-                    pass
-            self.target_lines = []
-                
-            # Get x-axis limits
-            xlim = self.chart_ax.get_xlim()
+            self.entry_line = self._place_line(self.entry_line, 'entry', self.entry_price)
+            self.stop_loss_line = self._place_line(self.stop_loss_line, 'stop_loss', self.stop_loss_price)
+            self.take_profit_line = self._place_line(self.take_profit_line, 'take_profit', self.take_profit_price)
+            self.limit_price_line = self._place_line(self.limit_price_line, 'limit_price', self.limit_price)
             
-            # Draw entry line (blue)
-            if self.entry_price:
-                self.entry_line = self.chart_ax.axhline(
-                    y=self.entry_price,
-                    color='#2196F3',  # Blue
-                    linestyle='-',
-                    linewidth=1.5,
-                    alpha=0.8,
-                    label=f'Entry: ${self.entry_price:.2f}'
-                )
-                
-            # Draw stop loss line (red)
-            if self.stop_loss_price:
-                self.stop_loss_line = self.chart_ax.axhline(
-                    y=self.stop_loss_price,
-                    color='#F44336',  # Red
-                    linestyle='--',
-                    linewidth=1.5,
-                    alpha=0.8,
-                    label=f'Stop Loss: ${self.stop_loss_price:.2f}'
-                )
-                
-            # Draw take profit line (green)
-            if self.take_profit_price:
-                self.take_profit_line = self.chart_ax.axhline(
-                    y=self.take_profit_price,
-                    color='#4CAF50',  # Green
-                    linestyle='-.',
-                    linewidth=1.5,
-                    alpha=0.8,
-                    label=f'Take Profit: ${self.take_profit_price:.2f}'
-                )
-                
-            # Draw limit price line (orange, for STOP LIMIT orders)
-            if self.limit_price:
-                self.limit_price_line = self.chart_ax.axhline(
-                    y=self.limit_price,
-                    color='#FF9800',  # Orange
-                    linestyle=':',
-                    linewidth=1.5,
-                    alpha=0.8,
-                    label=f'Limit Price: ${self.limit_price:.2f}'
-                )
-                
-            # Draw multiple target lines (purple/magenta shades)
-            if self.target_prices:
-                target_colors = ['#9C27B0', '#E91E63', '#673AB7']  # Purple, Pink, Deep Purple
-                for i, target_price in enumerate(self.target_prices):
-                    if target_price and target_price > 0:
-                        color = target_colors[i % len(target_colors)]
-                        target_line = self.chart_ax.axhline(
-                            y=target_price,
-                            color=color,
-                            linestyle='-.',
-                            linewidth=1.5,
-                            alpha=0.8,
-                            label=f'Target {i+1}: ${target_price:.2f}'
-                        )
-                        self.target_lines.append(target_line)
-                
-            # Save background for blitting optimization
-            if self._use_blitting and hasattr(self.chart_canvas, 'copy_from_bbox'):
-                self._background = self.chart_canvas.copy_from_bbox(self.chart_ax.figure.bbox)
+            # Draw multiple target lines (purple/magenta shades), reusing existing lines
+            targets = [price for price in (self.target_prices or []) if price and price > 0]
+            for i, target_price in enumerate(targets):
+                color = self.TARGET_COLORS[i % len(self.TARGET_COLORS)]
+                existing = self.target_lines[i] if i < len(self.target_lines) else None
+                line = self._place_line(existing, None, target_price, color=color, linestyle='-.',
+                                        label=f'Target {i+1}: ${target_price:.2f}')
+                if existing is None:
+                    self.target_lines.append(line)
+            for line in self.target_lines[len(targets):]:
+                self._hide_line(line)
             
-            # Redraw canvas
-            self.chart_canvas.draw_idle()
+            self._refresh()
             
         except Exception as e:
             logger.error(f"Error drawing price lines: {e}")
             
+    def _place_line(self, line, line_type: Optional[str], price: Optional[float],
+                    color: Optional[str] = None, linestyle: Optional[str] = None,
+                    label: Optional[str] = None):
+        """
+        Move (or create on first use) one price line; hidden when price is unset
+        
+        Returns:
+            The line object (None if it was never needed)
+        """
+        if line_type:
+            color, linestyle, prefix = self.LINE_STYLES[line_type]
+            label = f'{prefix}: ${price:.2f}' if price else None
+            
+        if not price:
+            if line is not None:
+                self._hide_line(line)
+            return line
+            
+        if line is None:
+            line = self._create_line(line_type, price, color, linestyle)
+        self._move_line(line, price, label)
+        return line
+    
+    def _create_line(self, line_type: Optional[str], price: float, color: str, linestyle: str):
+        """Create a horizontal line artist on the chart axes"""
+        line = self.chart_ax.axhline(y=price, color=color, linestyle=linestyle, linewidth=1.5, alpha=0.8)
+        if self._use_blitting and hasattr(self.chart_canvas, 'add_overlay_artist'):
+            self.chart_canvas.add_overlay_artist(line)
+        return line
+    
+    def _move_line(self, line, price: float, label: Optional[str]):
+        """Position, relabel and show an existing line"""
+        line.set_ydata([price, price])
+        if label is not None:
+            line.set_label(label)
+        line.set_visible(True)
+    
+    def _all_lines(self) -> list:
+        """Every price line object currently created"""
+        lines = [self.entry_line, self.stop_loss_line, self.take_profit_line, self.limit_price_line]
+        return [line for line in lines + list(self.target_lines) if line is not None]
+    
+    def _hide_line(self, line):
+        """Hide a line while keeping it for reuse"""
+        line.set_visible(False)
+        
+    def _remove_line(self, line):
+        """Detach a line from its axes and the overlay layer"""
+        try:
+            if self.chart_canvas and hasattr(self.chart_canvas, 'remove_overlay_artist'):
+                self.chart_canvas.remove_overlay_artist(line)
+            line.remove()
+        except Exception:
+            pass  # Line might already be removed
+        
+    def _refresh(self):
+        """Show line changes - blit when the canvas has an overlay layer, else redraw"""
+        if not self.chart_canvas:
+            return
+        if self._use_blitting and hasattr(self.chart_canvas, 'refresh_overlays'):
+            self.chart_canvas.refresh_overlays()
+        else:
+            self.chart_canvas.draw_idle()
+            
     def _draw_price_lines_optimized(self):
-        """Optimized price line drawing for smooth 120fps dragging"""
+        """Move only the dragged line and blit it (no full redraw while dragging)"""
         try:
             if not self.chart_ax or not self.chart_canvas:
                 return
                 
-            # Use blitting for ultra-fast updates during dragging
-            if self._use_blitting and self._background and hasattr(self.chart_canvas, 'restore_region'):
-                # Restore background
-                self.chart_canvas.restore_region(self._background)
-                
-                # Remove existing lines
-                if self.entry_line:
-                    try:
-                        self.entry_line.remove()
-                    except:
-                        pass
-                if self.stop_loss_line:
-                    try:
-                        self.stop_loss_line.remove()
-                    except:
-                        pass
-                if self.take_profit_line:
-                    try:
-                        self.take_profit_line.remove()
-                    except:
-                        pass
-                if self.limit_price_line:
-                    try:
-                        self.limit_price_line.remove()
-                    except:
-                        pass
-                # Remove target lines
-                for line in self.target_lines:
-                    try:
-                        line.remove()
-                    except:
-                        pass
-                self.target_lines = []
-                
-                # Redraw price lines
-                if self.entry_price:
-                    self.entry_line = self.chart_ax.axhline(
-                        y=self.entry_price,
-                        color='#2196F3',
-                        linestyle='-',
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                    self.chart_ax.draw_artist(self.entry_line)
-                    
-                if self.stop_loss_price:
-                    self.stop_loss_line = self.chart_ax.axhline(
-                        y=self.stop_loss_price,
-                        color='#F44336',
-                        linestyle='--',
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                    self.chart_ax.draw_artist(self.stop_loss_line)
-                    
-                if self.take_profit_price:
-                    self.take_profit_line = self.chart_ax.axhline(
-                        y=self.take_profit_price,
-                        color='#4CAF50',
-                        linestyle='-.',
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                    self.chart_ax.draw_artist(self.take_profit_line)
-                    
-                if self.limit_price:
-                    self.limit_price_line = self.chart_ax.axhline(
-                        y=self.limit_price,
-                        color='#FF9800',
-                        linestyle=':',
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                    self.chart_ax.draw_artist(self.limit_price_line)
-                    
-                # Draw target lines
-                if self.target_prices:
-                    target_colors = ['#9C27B0', '#E91E63', '#673AB7']
-                    for i, target_price in enumerate(self.target_prices):
-                        if target_price and target_price > 0:
-                            color = target_colors[i % len(target_colors)]
-                            target_line = self.chart_ax.axhline(
-                                y=target_price,
-                                color=color,
-                                linestyle='-.',
-                                linewidth=1.5,
-                                alpha=0.8
-                            )
-                            self.chart_ax.draw_artist(target_line)
-                            self.target_lines.append(target_line)
-                
-                # Blit only the changed areas
-                self.chart_canvas.blit(self.chart_ax.figure.bbox)
+            dragged = {
+                'entry': (self.entry_line, self.entry_price),
+                'stop_loss': (self.stop_loss_line, self.stop_loss_price),
+                'take_profit': (self.take_profit_line, self.take_profit_price),
+            }.get(self.drag_line)
+            
+            if dragged and dragged[0] is not None:
+                line, price = dragged
+                self._move_line(line, price, None)
+                self._refresh()
             else:
                 # Fallback to normal drawing
                 self._draw_price_lines()
@@ -348,38 +258,9 @@ class PriceLevelManager(QObject):
     def clear_price_levels(self):
         """Clear all price levels from the chart"""
         try:
-            # Remove lines safely
-            if self.entry_line:
-                try:
-                    self.entry_line.remove()
-                except:
-                    pass
-                self.entry_line = None
-            if self.stop_loss_line:
-                try:
-                    self.stop_loss_line.remove()
-                except:
-                    pass
-                self.stop_loss_line = None
-            if self.take_profit_line:
-                try:
-                    self.take_profit_line.remove()
-                except:
-                    pass
-                self.take_profit_line = None
-            if self.limit_price_line:
-                try:
-                    self.limit_price_line.remove()
-                except:
-                    pass
-                self.limit_price_line = None
-            # Remove target lines
-            for line in self.target_lines:
-                try:
-                    line.remove()
-                except:
-                    pass
-            self.target_lines = []
+            # Hide lines (kept for reuse)
+            for line in self._all_lines():
+                self._hide_line(line)
                 
             # Clear values
             self.entry_price = None
@@ -389,8 +270,7 @@ class PriceLevelManager(QObject):
             self.target_prices = []
             
             # Redraw
-            if self.chart_canvas:
-                self.chart_canvas.draw_idle()
+            self._refresh()
                 
         except Exception as e:
             logger.error(f"Error clearing price levels: {e}")
@@ -400,10 +280,16 @@ class PriceLevelManager(QObject):
         if not self.chart_canvas:
             return
             
+        # Replace any earlier connections so handlers never stack up
+        for cid in self._drag_connections:
+            self.chart_canvas.mpl_disconnect(cid)
+            
         # Connect mouse events
-        self.chart_canvas.mpl_connect('button_press_event', self._on_press)
-        self.chart_canvas.mpl_connect('motion_notify_event', self._on_motion)
-        self.chart_canvas.mpl_connect('button_release_event', self._on_release)
+        self._drag_connections = [
+            self.chart_canvas.mpl_connect('button_press_event', self._on_press),
+            self.chart_canvas.mpl_connect('motion_notify_event', self._on_motion),
+            self.chart_canvas.mpl_connect('button_release_event', self._on_release),
+        ]
         
     def _on_press(self, event):
         """Handle mouse press events"""
@@ -413,15 +299,15 @@ class PriceLevelManager(QObject):
         # Check if click is near a price line
         tolerance = self._get_click_tolerance()
         
-        if self.entry_line and abs(event.ydata - self.entry_price) < tolerance:
+        if self.entry_line and self.entry_price and abs(event.ydata - self.entry_price) < tolerance:
             self.dragging = True
             self.drag_line = 'entry'
             self.drag_start_y = event.ydata
-        elif self.stop_loss_line and abs(event.ydata - self.stop_loss_price) < tolerance:
+        elif self.stop_loss_line and self.stop_loss_price and abs(event.ydata - self.stop_loss_price) < tolerance:
             self.dragging = True
             self.drag_line = 'stop_loss'
             self.drag_start_y = event.ydata
-        elif self.take_profit_line and abs(event.ydata - self.take_profit_price) < tolerance:
+        elif self.take_profit_line and self.take_profit_price and abs(event.ydata - self.take_profit_price) < tolerance:
             self.dragging = True
             self.drag_line = 'take_profit'
             self.drag_start_y = event.ydata
@@ -507,8 +393,7 @@ class PriceLevelManager(QObject):
                 self.take_profit_line.set_linewidth(2.5)
                 
             # Redraw
-            if self.chart_canvas:
-                self.chart_canvas.draw_idle()
+            self._refresh()
                 
         except Exception as e:
             logger.error(f"Error highlighting line: {e}")
@@ -0,0 +1,471 @@
+"""
+PyQtGraph Chart Backend
+Qt-native scene-graph candlestick chart with interactive pan/zoom
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+import numpy as np
+import pytz
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QWidget
+
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+from src.utils.logger import logger
+from src.core.bar_frame import BarFrame, EASTERN, session_days
+from src.services.technical_indicator_service import indicator_optimizer
+from src.ui.chart_backend import (
+    ChartBackend, RenderPayload, visible_ranges, UP_COLOR, DOWN_COLOR, INDICATOR_STYLES
+)
+from src.ui.price_levels import PriceLevelManager
+
+
+# Base classes resolve to plain Qt/object types when pyqtgraph is missing so this module always imports
+_GraphicsLayoutWidget = pg.GraphicsLayoutWidget if PYQTGRAPH_AVAILABLE else QWidget
+_AxisItem = pg.AxisItem if PYQTGRAPH_AVAILABLE else object
+
+# matplotlib linestyle -> Qt pen style (price level lines share PriceLevelManager.LINE_STYLES)
+PEN_STYLES = {
+    '-': Qt.PenStyle.SolidLine,
+    '--': Qt.PenStyle.DashLine,
+    '-.': Qt.PenStyle.DashDotLine,
+    ':': Qt.PenStyle.DotLine,
+}
+
+
+def _pen(color: str, width: float = 1.0, alpha: float = 1.0, linestyle: str = '-'):
+    """Build a cosmetic pen from matplotlib-style arguments"""
+    qcolor = QColor(color)
+    qcolor.setAlphaF(alpha)
+    return pg.mkPen(qcolor, width=width, style=PEN_STYLES.get(linestyle, Qt.PenStyle.SolidLine))
+
+
+class TimeIndexAxis(_AxisItem):
+    """Bottom axis labeling bar indices with their US/Eastern times"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._times = None
+        self._format = '%H:%M'
+
+    def set_times(self, local_times: np.ndarray, timeframe: str):
+        """
+        Set the bar times shown by tick labels
+
+        Args:
+            local_times: Eastern wall-clock bar times as datetime64[s]
+            timeframe: Chart timeframe
+        """
+        self._times = local_times
+        if timeframe in ['1m', '3m', '5m', '15m', '30m', '1h']:
+            multi_day = len(local_times) and local_times[-1].astype('datetime64[D]') != local_times[0].astype('datetime64[D]')
+            self._format = '%m/%d %H:%M' if multi_day else '%H:%M'
+        else:
+            self._format = '%m/%d'
+        self.picture = None  # Force label regeneration
+        self.update()
+
+    def tickStrings(self, values, scale, spacing):
+        if self._times is None or not len(self._times):
+            return super().tickStrings(values, scale, spacing)
+        labels = []
+        for value in values:
+            index = int(round(value))
+            if 0 <= index < len(self._times):
+                labels.append(self._times[index].astype(object).strftime(self._format))
+            else:
+                labels.append('')
+        return labels
+
+
+class PyQtGraphPriceLevelManager(PriceLevelManager):
+    """PriceLevelManager drawing draggable InfiniteLines on a pyqtgraph plot"""
+
+    DRAGGABLE = ('entry', 'stop_loss', 'take_profit')
+
+    def _create_line(self, line_type: Optional[str], price: float, color: str, linestyle: str):
+        movable = line_type in self.DRAGGABLE
+        line = pg.InfiniteLine(pos=price, angle=0, movable=movable, pen=_pen(color, 1.5, 0.8, linestyle))
+        if movable:
+            line.setHoverPen(_pen(color, 2.5, 1.0, linestyle))
+            line.sigDragged.connect(lambda dragged, kind=line_type: self._on_line_dragged(kind, dragged.value()))
+            line.sigPositionChangeFinished.connect(self._on_line_released)
+        self.chart_ax.addItem(line, ignoreBounds=True)
+        return line
+
+    def _move_line(self, line, price: float, label: Optional[str]):
+        line.setPos(price)
+        line.setVisible(True)
+
+    def _hide_line(self, line):
+        line.setVisible(False)
+
+    def _remove_line(self, line):
+        try:
+            self.chart_ax.removeItem(line)
+        except Exception:
+            pass  # Line might already be removed
+
+    def _refresh(self):
+        """The scene repaints changed items itself"""
+        pass
+
+    def connect_drag_events(self):
+        """Dragging is built into the InfiniteLines"""
+        pass
+
+    def _on_line_dragged(self, line_type: str, price: float):
+        """Mirror the mouse-driven drag of the matplotlib manager"""
+        self.dragging = True
+        self.drag_line = line_type
+        if line_type == 'entry':
+            self.entry_price = price
+            self.entry_changed.emit(price)
+        elif line_type == 'stop_loss':
+            self.stop_loss_price = price
+            self.stop_loss_changed.emit(price)
+        elif line_type == 'take_profit':
+            self.take_profit_price = price
+            self.take_profit_changed.emit(price)
+
+    def _on_line_released(self, *args):
+        was_dragging = self.dragging
+        self.dragging = False
+        self.drag_line = None
+        if was_dragging:
+            self.drag_completed.emit()
+
+    def highlight_active_line(self, line_type: str):
+        """Highlight a specific price line (for hover effects)"""
+        try:
+            for kind, line in (('entry', self.entry_line), ('stop_loss', self.stop_loss_line),
+                               ('take_profit', self.take_profit_line)):
+                if line is not None:
+                    color, linestyle, _ = self.LINE_STYLES[kind]
+                    line.setPen(_pen(color, 2.5 if kind == line_type else 1.5, 0.8, linestyle))
+        except Exception as e:
+            logger.error(f"Error highlighting line: {e}")
+
+
+class PyQtGraphCandlestickChart(_GraphicsLayoutWidget, ChartBackend):
+    """Candlestick chart rendered by pyqtgraph (x pans/zooms with the mouse, y follows the data)"""
+
+    # User zoomed or panned the time axis (first, last visible source bar index)
+    bar_range_changed = pyqtSignal(float, float)
+
+    # Most bars a delta update may append before falling back to a full render
+    MAX_APPENDED_BARS = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setBackground('#1e1e1e')
+
+        # Price plot on top, volume below with the time axis (5:1 like the matplotlib chart)
+        self.time_axis = TimeIndexAxis(orientation='bottom')
+        self.price_plot = self.addPlot(row=0, col=0)
+        self.volume_plot = self.addPlot(row=1, col=0, axisItems={'bottom': self.time_axis})
+        self.ci.layout.setRowStretchFactor(0, 5)
+        self.ci.layout.setRowStretchFactor(1, 1)
+        self.volume_plot.setXLink(self.price_plot)
+        self.price_plot.hideAxis('bottom')
+        for plot in (self.price_plot, self.volume_plot):
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            plot.setMouseEnabled(x=True, y=False)
+        self.price_plot.setLabel('left', 'Price ($)')
+        self.volume_plot.setLabel('left', 'Volume')
+        self.price_ax = self.price_plot
+
+        # Candles split by direction: wick pairs, bodies and volume per color
+        self.candle_items = {}
+        for direction, color in (('up', UP_COLOR), ('down', DOWN_COLOR)):
+            wicks = pg.PlotDataItem(pen=_pen(color), connect='pairs')
+            bodies = pg.BarGraphItem(x=np.zeros(0), height=np.zeros(0), width=0.6, brush=color, pen=_pen(color))
+            volume = pg.BarGraphItem(x=np.zeros(0), height=np.zeros(0), width=0.8, brush=QColor(color).lighter(100), pen=None)
+            volume.setOpacity(0.7)
+            self.price_plot.addItem(wicks)
+            self.price_plot.addItem(bodies)
+            self.volume_plot.addItem(volume)
+            self.candle_items[direction] = (wicks, bodies, volume)
+
+        # Indicator lines, added to the legend only while visible
+        self.legend = self.price_plot.addLegend(offset=(10, 10), labelTextSize='7pt')
+        self.indicator_lines = {}
+        for label, (color, linewidth, alpha) in INDICATOR_STYLES.items():
+            line = pg.PlotDataItem(pen=_pen(color, linewidth, alpha), name=label)
+            self.price_plot.addItem(line)
+            self.legend.removeItem(line)
+            line.setVisible(False)
+            self.indicator_lines[label] = line
+        self._legend_labels = []
+
+        # Day separators (pooled, one pair per session boundary)
+        self.separator_lines = []
+
+        # Crosshair and OHLC readout
+        crosshair_pen = _pen('#888888', 0.8, 0.8)
+        self.crosshair_v_price = pg.InfiniteLine(angle=90, movable=False, pen=crosshair_pen)
+        self.crosshair_v_volume = pg.InfiniteLine(angle=90, movable=False, pen=crosshair_pen)
+        self.crosshair_h = pg.InfiniteLine(angle=0, movable=False, pen=crosshair_pen)
+        self.ohlc_text = pg.TextItem(anchor=(0.5, 0), color='w', fill=QColor(46, 46, 46, 230))
+        self.price_plot.addItem(self.crosshair_v_price, ignoreBounds=True)
+        self.price_plot.addItem(self.crosshair_h, ignoreBounds=True)
+        self.price_plot.addItem(self.ohlc_text, ignoreBounds=True)
+        self.volume_plot.addItem(self.crosshair_v_volume, ignoreBounds=True)
+        self._set_crosshair_visible(False)
+        self._mouse_proxy = pg.SignalProxy(self.scene().sigMouseMoved, rateLimit=60, slot=self._on_mouse_moved)
+        self.price_plot.getViewBox().sigRangeChangedManually.connect(self._on_range_changed_manually)
+        self.volume_plot.getViewBox().sigRangeChangedManually.connect(self._on_range_changed_manually)
+
+        self.current_data = None
+        self.source_data = None
+
+        # Delta-update state: what the last full render showed
+        self._render_key = None
+        self._geometry = None
+        self._streaming_indicators = None
+
+    def prepare_geometry(self, payload: RenderPayload):
+        """Split candles by direction into wick pairs, bodies and volume (render worker thread)"""
+        payload.geometry = self._candle_geometry(payload.data)
+
+    @staticmethod
+    def _candle_geometry(data: BarFrame, first_x: int = 0) -> dict:
+        """Per-direction (wick x, wick y, x, body bottom, body height, volume) for bars starting at first_x"""
+        x = np.arange(first_x, first_x + len(data), dtype=np.float64)
+        up = data.close >= data.open
+        bottoms = np.minimum(data.open, data.close)
+        heights = np.abs(data.close - data.open)
+        geometry = {}
+        for direction, mask in (('up', up), ('down', ~up)):
+            xs = x[mask]
+            geometry[direction] = (np.repeat(xs, 2), np.column_stack((data.low[mask], data.high[mask])).ravel(),
+                                   xs, bottoms[mask], heights[mask], data.volume[mask])
+        return geometry
+    
+    def apply_render(self, payload: RenderPayload):
+        """Swap a prepared payload into the scene items and fit the view"""
+        try:
+            self._render(payload)
+            
+            # Fit the view to the new dataset (or the view the payload asks for)
+            price_min, price_max = payload.price_range
+            y_margin = max((price_max - price_min) * 0.05, 0.01)
+            self.set_bar_range(*payload.x_range)
+            self.set_price_range(price_min - y_margin, price_max + y_margin)
+            self.set_volume_range((payload.max_volume or 1000) * 1.1)
+            
+        except Exception as e:
+            logger.error(f"Error plotting candlestick data: {str(e)}")
+    
+    def update_incremental(self, data: BarFrame, symbol: str, timeframe: str, show_emas: bool = True,
+                           show_smas: bool = True, show_vwap: bool = True) -> bool:
+        """
+        Apply a refresh that only changed the last bar or appended a few bars
+        
+        Only the affected candles are rebuilt and the streaming indicators
+        advanced; the user's view is kept. A new session needs separators, so
+        it goes through a full render.
+        
+        Returns:
+            True if handled, False if the caller needs a full render
+        """
+        try:
+            old = self.current_data
+            if (old is None or not len(old) or not data or timeframe == '1d' or self._geometry is None
+                    or self._render_key != (symbol, timeframe, show_emas, show_smas, show_vwap)):
+                return False
+            
+            # Same history up to the previously forming bar, at most MAX_APPENDED_BARS new bars
+            start = len(old) - 1
+            appended = len(data) - len(old)
+            if (not 0 <= appended <= self.MAX_APPENDED_BARS
+                    or data.time[0] != old.time[0] or data.time[start] != old.time[start]):
+                return False
+            if appended and timeframe not in ['1w', '1M'] and len(np.unique(session_days(data.time[start:]))) > 1:
+                return False
+            
+            x_min, x_max = self.price_plot.viewRange()[0]
+            self.current_data = self.source_data = data
+            self._set_candle_tail(data, start)
+            self._update_indicator_tails(data, start)
+            
+            if appended:
+                self.time_axis.set_times(data.local_times(), timeframe)
+                # Keep following the live edge if it was in view
+                if x_max >= len(old) - 1:
+                    self.set_bar_range(x_min + appended, x_max + appended)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error applying incremental chart update: {str(e)}")
+            return False
+    
+    def _set_candle_tail(self, data: BarFrame, start: int):
+        """Replace the candles from bar start onwards, keeping the geometry before it"""
+        tail = self._candle_geometry(data.slice(start, None), start)
+        geometry = {}
+        for direction, arrays in self._geometry.items():
+            keep = int(np.searchsorted(arrays[2], start))
+            cuts = (2 * keep, 2 * keep, keep, keep, keep, keep)  # Wicks hold two points per bar
+            geometry[direction] = tuple(np.concatenate((kept[:cut], new))
+                                        for kept, new, cut in zip(arrays, tail[direction], cuts))
+        self._set_candle_geometry(geometry)
+
+    def _update_indicator_tails(self, data: BarFrame, start: int):
+        """Advance the streaming indicators over bars[start:] and refresh the visible lines"""
+        _, _, show_emas, show_smas, show_vwap = self._render_key
+        if not (show_emas or show_smas or show_vwap):
+            return
+
+        indicators = self._streaming_indicators
+        if indicators is None or len(indicators) != start + 1:
+            indicators = indicator_optimizer.create_streaming_indicators(data.slice(0, start))
+            self._streaming_indicators = indicators
+        else:
+            indicators.update_last_bar(data.high[start], data.low[start], data.close[start],
+                                       data.volume[start], int(data.time[start]))
+            start += 1
+        for i in range(start, len(data)):
+            indicators.append_bar(data.high[i], data.low[i], data.close[i], data.volume[i], int(data.time[i]))
+
+        x = np.arange(len(data), dtype=np.float64)
+        for label, values in indicators.arrays().items():
+            line = self.indicator_lines[label]
+            if line.isVisible():
+                line.setData(x, values, connect='finite')
+
+    def _set_candle_geometry(self, geometry: dict):
+        """Push per-direction candle arrays into the wick, body and volume items"""
+        self._geometry = geometry
+        for direction, (wick_x, wick_y, xs, bottoms, heights, volumes) in geometry.items():
+            wicks, bodies, volume = self.candle_items[direction]
+            wicks.setData(wick_x, wick_y, connect='pairs')
+            bodies.setOpts(x=xs, y0=bottoms, height=heights)
+            volume.setOpts(x=xs, y0=np.zeros(len(xs)), height=volumes)
+
+    def _render(self, payload: RenderPayload):
+        """Push prepared bars, indicators, separators and labels into the scene items"""
+        data = payload.data
+        self.current_data = self.source_data = data
+        self._render_key = payload.render_key
+        self._streaming_indicators = None  # Re-seeded lazily by the first delta update
+        
+        self._set_candle_geometry(payload.geometry)
+        
+        x = np.arange(len(data), dtype=np.float64)
+        lines = payload.indicators
+        for label, item in self.indicator_lines.items():
+            values = lines.get(label)
+            if values is not None:
+                item.setData(x, values, connect='finite')
+            item.setVisible(values is not None)
+        labels = list(lines)
+        if labels != self._legend_labels:
+            self.legend.clear()
+            for label in labels:
+                self.legend.addItem(self.indicator_lines[label], label)
+            self._legend_labels = labels
+        
+        self._set_separators(payload.boundaries)
+        
+        self.time_axis.set_times(payload.local_times, payload.timeframe)
+        self.price_plot.setTitle(f'{payload.symbol} - {payload.timeframe}', color='w', size='12pt')
+        
+    def _set_separators(self, positions: np.ndarray):
+        """Show one dashed vertical line per session boundary on both plots"""
+        pen = _pen('#555555', 1, 0.7, '--')
+        while len(self.separator_lines) < len(positions):
+            pair = (pg.InfiniteLine(angle=90, movable=False, pen=pen),
+                    pg.InfiniteLine(angle=90, movable=False, pen=pen))
+            self.price_plot.addItem(pair[0], ignoreBounds=True)
+            self.volume_plot.addItem(pair[1], ignoreBounds=True)
+            self.separator_lines.append(pair)
+        for i, pair in enumerate(self.separator_lines):
+            visible = i < len(positions)
+            for line in pair:
+                if visible:
+                    line.setPos(positions[i])
+                line.setVisible(visible)
+
+    def _on_range_changed_manually(self, *args):
+        """Fit y to the bars now in view and report the new x-range"""
+        if self.current_data is None or not len(self.current_data):
+            return
+        x_min, x_max = self.price_plot.viewRange()[0]
+        extent = visible_ranges(self.current_data, x_min, x_max)
+        if extent is not None:
+            price_min, price_max, max_volume = extent
+            y_margin = max((price_max - price_min) * 0.05, 0.01)
+            self.set_price_range(price_min - y_margin, price_max + y_margin)
+            self.set_volume_range((max_volume or 1000) * 1.1)
+        self.bar_range_changed.emit(x_min, x_max)
+
+    # ============================================================================
+    # CROSSHAIR
+    # ============================================================================
+
+    def _set_crosshair_visible(self, visible: bool):
+        for item in (self.crosshair_v_price, self.crosshair_v_volume, self.crosshair_h, self.ohlc_text):
+            item.setVisible(visible)
+
+    def _on_mouse_moved(self, event):
+        """Move the crosshair (rate limited to 60Hz by the SignalProxy)"""
+        if self.current_data is None or not len(self.current_data):
+            return
+        pos = event[0]
+        in_price = self.price_plot.sceneBoundingRect().contains(pos)
+        in_volume = self.volume_plot.sceneBoundingRect().contains(pos)
+        if not (in_price or in_volume):
+            self._set_crosshair_visible(False)
+            return
+
+        point = (self.price_plot if in_price else self.volume_plot).vb.mapSceneToView(pos)
+        bar_idx = max(0, min(int(point.x() + 0.5), len(self.current_data) - 1))
+        self.crosshair_v_price.setPos(bar_idx)
+        self.crosshair_v_volume.setPos(bar_idx)
+        if in_price:
+            self.crosshair_h.setPos(point.y())
+
+        bar_data = self.current_data.bar(bar_idx)
+        bar_time = datetime.fromtimestamp(bar_data['time'], tz=pytz.UTC).astimezone(EASTERN)
+        self.ohlc_text.setText(f"{bar_time.strftime('%m/%d %H:%M')} O:${bar_data['open']:.2f} H:${bar_data['high']:.2f} "
+                               f"L:${bar_data['low']:.2f} C:${bar_data['close']:.2f} V:{bar_data['volume']:,}")
+        (x_min, x_max), (_, y_max) = self.price_plot.viewRange()
+        self.ohlc_text.setPos((x_min + x_max) / 2, y_max)
+
+        self._set_crosshair_visible(True)
+        self.crosshair_h.setVisible(in_price)
+
+    # ============================================================================
+    # CHART BACKEND INTERFACE
+    # ============================================================================
+
+    def get_price_range(self) -> Tuple[float, float]:
+        low, high = self.price_plot.viewRange()[1]
+        return low, high
+
+    def set_price_range(self, low: float, high: float):
+        self.price_plot.setYRange(low, high, padding=0)
+
+    def set_volume_range(self, max_volume: float):
+        self.volume_plot.setYRange(0, max_volume, padding=0)
+
+    def set_bar_range(self, first: float, last: float):
+        self.price_plot.setXRange(first, last, padding=0)
+
+    def redraw(self):
+        self.update()
+
+    def create_price_level_manager(self) -> PriceLevelManager:
+        return PyQtGraphPriceLevelManager()
+
+    def release(self):
+        self._mouse_proxy.disconnect()
@@ -0,0 +1,75 @@
+"""
+Live candle building from 5-second bars
+Re-seeding from reloaded (possibly stale) history must not re-open or re-close candles
+"""
+
+import numpy as np
+import pytest
+
+from src.core.bar_frame import BarFrame
+from src.core.bar_builder import BarBuilder
+
+
+SESSION_OPEN = 1709562600  # 2024-03-04 09:30 EST
+
+
+def minute_bars(minutes: int) -> BarFrame:
+    """1-minute history starting at the session open"""
+    times = SESSION_OPEN + np.arange(minutes, dtype=np.int64) * 60
+    closes = 100.0 + np.arange(minutes, dtype=np.float64)
+    return BarFrame(times, closes - 0.5, closes + 1.0, closes - 1.0, closes, np.full(minutes, 1000.0))
+
+
+def feed(builder: BarBuilder, start: int, stop: int, volume: float = 10.0):
+    """Feed 5-second bars covering [start, stop)"""
+    for epoch in range(start, stop, 5):
+        builder.add_bar(epoch, 100.0, 101.0, 99.0, 100.5, volume)
+
+
+@pytest.fixture
+def builder():
+    builder = BarBuilder()
+    builder.closed = []
+    builder.bar_closed.connect(lambda bar: builder.closed.append(int(bar.time[0])))
+    builder.reset('1m', minute_bars(5))  # Forming candle: 09:34
+    return builder
+
+
+def test_five_second_bars_close_each_minute_once(builder):
+    feed(builder, SESSION_OPEN + 240, SESSION_OPEN + 360)
+    assert builder.closed == [SESSION_OPEN + 240, SESSION_OPEN + 300]
+
+
+def test_reseed_from_older_history_does_not_close_again(builder):
+    feed(builder, SESSION_OPEN + 240, SESSION_OPEN + 360)
+    
+    # A store snapshot ending at the already-closed 09:34 candle
+    builder.reseed(minute_bars(5))
+    feed(builder, SESSION_OPEN + 360, SESSION_OPEN + 420)
+    
+    assert builder.closed == [SESSION_OPEN + 240, SESSION_OPEN + 300, SESSION_OPEN + 360]
+
+
+def test_reseed_keeps_the_forming_candle(builder):
+    feed(builder, SESSION_OPEN + 240, SESSION_OPEN + 300)
+    feed(builder, SESSION_OPEN + 300, SESSION_OPEN + 330, volume=50.0)
+    forming = builder.current_bar()
+    
+    # Stale snapshot of the 09:35 candle from before most of its 5s bars arrived
+    builder.reseed(minute_bars(6))
+    
+    current = builder.current_bar()
+    assert int(current.time[0]) == SESSION_OPEN + 300
+    assert current.volume[0] == forming.volume[0] == 300.0
+    assert builder.closed == [SESSION_OPEN + 240]
+
+
+def test_reseed_from_newer_history_moves_forward(builder):
+    feed(builder, SESSION_OPEN + 240, SESSION_OPEN + 300)
+    
+    # The stream fell behind; a top-up reaches the 09:37 candle
+    builder.reseed(minute_bars(8))
+    assert int(builder.current_bar().time[0]) == SESSION_OPEN + 420
+    
+    feed(builder, SESSION_OPEN + 300, SESSION_OPEN + 480)
+    assert builder.closed == [SESSION_OPEN + 240, SESSION_OPEN + 420]
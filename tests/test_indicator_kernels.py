@@ -0,0 +1,272 @@
+"""
+Numerical equivalence of the vectorized indicator kernels
+Compares TechnicalIndicatorService against the per-bar loops it replaced
+"""
+
+import numpy as np
+import pytest
+
+from src.core.bar_frame import BarFrame
+from src.services.technical_indicator_service import (
+    TechnicalIndicatorService, StreamingEMA, StreamingSMA, StreamingVWAP, RollingHighLow, stack_series
+)
+
+
+# ============================================================================
+# REFERENCE LOOPS (the implementations before vectorization)
+# ============================================================================
+
+def reference_ema(prices: np.ndarray, period: int) -> np.ndarray:
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+    alpha = 2.0 / (period + 1)
+    ema = np.zeros_like(prices)
+    ema[0] = prices[0]
+    for i in range(1, len(prices)):
+        ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
+    return ema
+
+
+def reference_sma(prices: np.ndarray, period: int) -> np.ndarray:
+    if len(prices) < period:
+        return np.full(len(prices), np.nan)
+    sma = np.full(len(prices), np.nan)
+    for i in range(period - 1, len(prices)):
+        sma[i] = np.mean(prices[i - period + 1:i + 1])
+    return sma
+
+
+def reference_daily_vwap(highs, lows, closes, volumes, days) -> np.ndarray:
+    typical_prices = (highs + lows + closes) / 3
+    vwap = np.full(len(closes), np.nan)
+    current_day = None
+    day_cumulative_pv = 0
+    day_cumulative_volume = 0
+    for i in range(len(closes)):
+        if current_day is not None and days[i] != current_day:
+            day_cumulative_pv = 0
+            day_cumulative_volume = 0
+        day_cumulative_pv += typical_prices[i] * volumes[i]
+        day_cumulative_volume += volumes[i]
+        if day_cumulative_volume > 0:
+            vwap[i] = day_cumulative_pv / day_cumulative_volume
+        current_day = days[i]
+    return vwap
+
+
+def reference_wilder_atr(highs, lows, closes, period: int) -> np.ndarray:
+    atr = np.full(len(closes), np.nan)
+    average = None
+    for i in range(len(closes)):
+        true_range = highs[i] - lows[i]
+        if i > 0:
+            true_range = max(true_range, abs(highs[i] - closes[i-1]), abs(lows[i] - closes[i-1]))
+        average = true_range if average is None else (average * (period - 1) + true_range) / period
+        if i >= period - 1:
+            atr[i] = average
+    return atr
+
+
+def reference_rolling(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    return np.array([reduce(values[max(0, i - period + 1):i + 1]) for i in range(len(values))])
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def service():
+    return TechnicalIndicatorService()
+
+
+def random_walk(rng: np.random.Generator, length: int) -> np.ndarray:
+    return 100.0 + np.cumsum(rng.normal(0.0, 0.5, length))
+
+
+def session_bars(rng: np.random.Generator, sessions: int = 5, bars_per_session: int = 390):
+    """OHLCV bars over several sessions; each session opens with zero-volume bars"""
+    closes = random_walk(rng, sessions * bars_per_session)
+    highs = closes + rng.uniform(0.0, 0.3, len(closes))
+    lows = closes - rng.uniform(0.0, 0.3, len(closes))
+    volumes = rng.integers(0, 5000, len(closes)).astype(np.float64)
+    days = np.repeat(np.arange(sessions) + 19000, bars_per_session)
+    volumes[::bars_per_session] = 0.0
+    volumes[1::bars_per_session] = 0.0
+    return highs, lows, closes, volumes, days
+
+
+def session_frame(rng: np.random.Generator, sessions: int = 3, bars_per_session: int = 390) -> BarFrame:
+    """1-minute BarFrame with real timestamps, each session starting 09:30 US/Eastern"""
+    highs, lows, closes, volumes, _ = session_bars(rng, sessions, bars_per_session)
+    opens = np.clip(closes + rng.normal(0.0, 0.1, len(closes)), lows, highs)
+    session_opens = 1709562600 + np.arange(sessions) * 86400  # 2024-03-04 09:30 EST
+    times = (session_opens[:, None] + np.arange(bars_per_session) * 60).ravel()
+    return BarFrame(times.astype(np.int64), opens, highs, lows, closes, volumes)
+
+
+def ragged_histories(rng: np.random.Generator, lengths=(400, 250, 1, 0, 399, 60)):
+    """Per-symbol OHLCV histories of different lengths, each ending on the same session"""
+    histories = []
+    for length in lengths:
+        highs, lows, closes, volumes, days = session_bars(rng, sessions=2, bars_per_session=200)
+        histories.append(tuple(column[len(column) - length:] for column in (highs, lows, closes, volumes, days)))
+    return histories
+
+
+def assert_rows_match(matrix: np.ndarray, expected_rows):
+    """Each row is its 1-D result right-aligned behind NaN padding"""
+    columns = matrix.shape[1]
+    for row, expected in zip(matrix, expected_rows):
+        padding = columns - len(expected)
+        assert np.isnan(row[:padding]).all()
+        np.testing.assert_allclose(row[padding:], expected, rtol=1e-9)
+
+
+def stream(indicator, bars: BarFrame, start: int):
+    """Seed with bars[:start], then replay the rest as an opening tick plus forming-bar updates"""
+    indicator.seed(bars.slice(None, start))
+    for i in range(start, len(bars)):
+        opening = bars.open[i]
+        indicator.append_bar(opening, opening, opening, 0.0, bars.time[i])
+        indicator.update_last_bar(max(opening, bars.close[i]), min(opening, bars.close[i]),
+                                  bars.close[i], bars.volume[i] / 2, bars.time[i])
+        indicator.update_last_bar(bars.high[i], bars.low[i], bars.close[i], bars.volume[i], bars.time[i])
+    return indicator
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("length,period", [(1, 1), (5, 9), (9, 9), (500, 9), (5000, 200)])
+def test_ema_matches_loop(service, length, period):
+    prices = random_walk(np.random.default_rng(length), length)
+    np.testing.assert_allclose(service.calculate_ema_optimized(prices, period),
+                               reference_ema(prices, period), rtol=1e-10)
+
+
+@pytest.mark.parametrize("length,period", [(1, 1), (5, 9), (9, 9), (500, 20), (5000, 200)])
+def test_sma_matches_loop(service, length, period):
+    prices = random_walk(np.random.default_rng(length), length)
+    np.testing.assert_allclose(service.calculate_sma_optimized(prices, period),
+                               reference_sma(prices, period), rtol=1e-10)
+
+
+def test_sma_nan_only_blanks_its_windows(service):
+    prices = random_walk(np.random.default_rng(7), 100)
+    prices[30] = np.nan
+    sma = service.calculate_sma_optimized(prices, 10)
+    np.testing.assert_allclose(sma, reference_sma(prices, 10), rtol=1e-10)
+    assert np.isnan(sma[30:40]).all()
+    assert np.isfinite(sma[40:]).all()
+
+
+def test_session_vwap_matches_loop(service):
+    highs, lows, closes, volumes, days = session_bars(np.random.default_rng(1))
+    np.testing.assert_allclose(
+        service.calculate_session_vwap_optimized(highs, lows, closes, volumes, days),
+        reference_daily_vwap(highs, lows, closes, volumes, days), rtol=1e-10)
+
+
+def test_session_vwap_resets_at_session_boundary(service):
+    highs, lows, closes, volumes, days = session_bars(np.random.default_rng(2), sessions=3, bars_per_session=50)
+    vwap = service.calculate_session_vwap_optimized(highs, lows, closes, volumes, days)
+    for start in (0, 50, 100):
+        # Zero-volume opening bars have no VWAP; the first traded bar is its typical price
+        assert np.isnan(vwap[start:start + 2]).all()
+        np.testing.assert_allclose(vwap[start + 2], (highs[start + 2] + lows[start + 2] + closes[start + 2]) / 3)
+
+
+@pytest.mark.parametrize("start", [0, 1, 300, 900])
+def test_streaming_ema_matches_batch(start):
+    bars = session_frame(np.random.default_rng(3))
+    ema = stream(StreamingEMA(21), bars, start)
+    np.testing.assert_allclose(ema.values, reference_ema(bars.close, 21), rtol=1e-10)
+
+
+@pytest.mark.parametrize("start", [0, 1, 300, 900])
+def test_streaming_sma_matches_batch(service, start):
+    bars = session_frame(np.random.default_rng(4))
+    sma = stream(StreamingSMA(50), bars, start)
+    np.testing.assert_allclose(sma.values, service.calculate_sma_optimized(bars.close, 50), rtol=1e-9)
+
+
+@pytest.mark.parametrize("start", [0, 1, 300, 900])
+def test_streaming_vwap_matches_batch_across_sessions(service, start):
+    # Starts before 780 replay at least one session boundary through append_bar
+    bars = session_frame(np.random.default_rng(5))
+    vwap = stream(StreamingVWAP(), bars, start)
+    expected = service.calculate_session_vwap_optimized(bars.high, bars.low, bars.close, bars.volume,
+                                                        bars.session_days())
+    np.testing.assert_allclose(vwap.values, expected, rtol=1e-9)
+    for session_open in (390, 780):
+        assert np.isnan(vwap.values[session_open:session_open + 2]).all()
+
+
+@pytest.mark.parametrize("start", [0, 1, 300, 900])
+def test_rolling_high_low_matches_batch(start):
+    bars = session_frame(np.random.default_rng(6))
+    rolling = stream(RollingHighLow(20), bars, start)
+    np.testing.assert_allclose(rolling.highs.values, reference_rolling(bars.high, 20, np.max))
+    np.testing.assert_allclose(rolling.lows.values, reference_rolling(bars.low, 20, np.min))
+    assert len(rolling) == len(bars)
+
+
+@pytest.mark.parametrize("indicator", [StreamingEMA(5), StreamingSMA(5), StreamingVWAP()])
+def test_streaming_seed_from_empty_frame(indicator):
+    indicator.seed(BarFrame.empty())
+    assert len(indicator) == 0
+    assert np.isnan(indicator.last)
+
+
+@pytest.mark.parametrize("indicator", [StreamingEMA(5), StreamingSMA(1), StreamingVWAP()])
+def test_streaming_update_before_any_bar_starts_one(indicator):
+    bars = session_frame(np.random.default_rng(7), sessions=1, bars_per_session=3)
+    indicator.update_last_bar(bars.high[2], bars.low[2], bars.close[2], bars.volume[2], bars.time[2])
+    assert len(indicator) == 1
+    typical = (bars.high[2] + bars.low[2] + bars.close[2]) / 3
+    expected = typical if isinstance(indicator, StreamingVWAP) else bars.close[2]
+    np.testing.assert_allclose(indicator.last, expected)
+
+
+def test_rolling_high_low_empty_seed_and_update_before_any_bar():
+    rolling = RollingHighLow(3)
+    rolling.seed(BarFrame.empty())
+    assert len(rolling) == 0 and len(rolling.highs) == 0
+    rolling.update_last_bar(10.0, 9.0, 9.5, 100.0, 1709562600)
+    assert len(rolling) == 1
+    assert rolling.highs.last == 10.0 and rolling.lows.last == 9.0
+
+
+@pytest.mark.parametrize("period", [1, 9, 200])
+def test_ema_batch_rows_match_kernel(service, period):
+    histories = ragged_histories(np.random.default_rng(8))
+    closes = [history[2] for history in histories]
+    assert_rows_match(service.calculate_ema_batch(stack_series(closes), period),
+                      [service.calculate_ema_optimized(series, period) for series in closes])
+
+
+@pytest.mark.parametrize("period", [1, 20, 200])
+def test_sma_batch_rows_match_kernel(service, period):
+    histories = ragged_histories(np.random.default_rng(9))
+    closes = [history[2] for history in histories]
+    assert_rows_match(service.calculate_sma_batch(stack_series(closes), period),
+                      [service.calculate_sma_optimized(series, period) for series in closes])
+
+
+def test_vwap_batch_rows_match_kernel(service):
+    histories = ragged_histories(np.random.default_rng(10))
+    highs, lows, closes, volumes, days = (stack_series([history[i] for history in histories]) for i in range(5))
+    assert_rows_match(service.calculate_vwap_batch(highs, lows, closes, volumes),
+                      [service.calculate_vwap_optimized(*history[:4]) for history in histories])
+    assert_rows_match(service.calculate_vwap_batch(highs, lows, closes, volumes, days),
+                      [service.calculate_session_vwap_optimized(*history) for history in histories])
+
+
+@pytest.mark.parametrize("period", [1, 14])
+def test_atr_batch_rows_match_wilder_loop(service, period):
+    histories = ragged_histories(np.random.default_rng(11))
+    highs, lows, closes = (stack_series([history[i] for history in histories]) for i in range(3))
+    assert_rows_match(service.calculate_atr_batch(highs, lows, closes, period),
+                      [reference_wilder_atr(*history[:3], period) for history in histories])